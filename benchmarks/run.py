@@ -0,0 +1,343 @@
+"""
+Benchmarks - Benchmark Runner
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module runs the benchmark suite for the hot functions of the Paycheck Calculator and the Month Selector, and
+reports the results as machine-readable JSON, so performance regressions show up as numbers. There are three
+scenarios:
+    - scalar: calculate_gross_pay(), calculate_taxes(), calculate_net_pay(), is_valid_float_greater_than_zero(),
+      is_leap_year(), and get_days_in_month(), called once per row in both their console and GUI variants.
+    - batch: the vectorized batch engine (batch.py) over the same employee mix. Skipped if NumPy is not installed.
+    - file: the streaming (stream.py) and parallel (parallel.py) modes over a synthetic timesheet file.
+
+Every benchmark is run several times, and the best and median times are reported together with the time per
+operation. A saved report can be passed with --compare, in which case each benchmark is compared against the baseline
+and the exit status is 1 if any benchmark got slower by more than the tolerance.
+
+Usage (from the repository root):
+    python -m benchmarks.run --output baseline.json
+    python -m benchmarks.run --compare baseline.json --tolerance 0.1
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from . import workload
+
+SCENARIOS = ('scalar', 'batch', 'file')
+VARIANTS = ('console', 'gui')
+
+
+def measure(function, repeat):
+    """
+    Run the function several times and measure each run.
+
+    Args:
+        function: The function to measure, called without arguments.
+        :param function: function
+
+        repeat: The number of runs.
+        :param repeat: int
+
+    Returns: A list with the duration of each run in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def make_result(name, scenario, operations, timings):
+    """
+    Make the report entry of one benchmark.
+
+    Args:
+        name: The name of the benchmark.
+        :param name: str
+
+        scenario: The scenario of the benchmark ('scalar', 'batch', or 'file').
+        :param scenario: str
+
+        operations: The number of operations (rows) per run.
+        :param operations: int
+
+        timings: The duration of each run in seconds.
+        :param timings: list[float]
+
+    Returns: A dictionary with the benchmark results.
+    """
+    best = min(timings)
+    return {
+        'name': name,
+        'scenario': scenario,
+        'operations': operations,
+        'runs': len(timings),
+        'best_seconds': best,
+        'median_seconds': statistics.median(timings),
+        'ns_per_operation': best / operations * 1e9 if operations else 0.0,
+    }
+
+
+def scalar_benchmarks(args):
+    """
+    Build the scalar benchmarks for the console and GUI variants of both applications.
+
+    Args:
+        args: The parsed command line arguments.
+        :param args: argparse.Namespace
+
+    Returns: A list of (name, scenario, operations, function) tuples.
+    """
+    hours, rates = workload.generate_employees(args.employees, args.overtime_share, args.seed)
+    pairs = list(zip(hours, rates))
+    strings = workload.generate_numeric_strings(args.employees, seed=args.seed)
+    months, years = workload.generate_month_years(args.employees, seed=args.seed)
+    month_years = list(zip(months, years))
+
+    benchmarks = []
+    for variant in VARIANTS:
+        paycheck = importlib.import_module(f'paycheck_calculator.python.{variant}.main')
+        calendar = importlib.import_module(f'month_selector.python.{variant}.main')
+        gross = [paycheck.calculate_gross_pay(h, r) for h, r in pairs]
+        taxes = [paycheck.calculate_taxes(g) for g in gross]
+        gross_taxes = list(zip(gross, taxes))
+
+        def run_gross_pay(function=paycheck.calculate_gross_pay):
+            for hours_worked, hourly_rate in pairs:
+                function(hours_worked, hourly_rate)
+
+        def run_taxes(function=paycheck.calculate_taxes):
+            for gross_pay in gross:
+                function(gross_pay)
+
+        def run_net_pay(function=paycheck.calculate_net_pay):
+            for gross_pay, tax_amount in gross_taxes:
+                function(gross_pay, tax_amount)
+
+        def run_validation(function=paycheck.is_valid_float_greater_than_zero):
+            for value in strings:
+                function(value)
+
+        def run_leap_year(function=calendar.is_leap_year):
+            for year in years:
+                function(year)
+
+        def run_days_in_month(function=calendar.get_days_in_month):
+            for month_number, year in month_years:
+                function(month_number, year)
+
+        benchmarks += [
+            (f'paycheck.{variant}.calculate_gross_pay', 'scalar', len(pairs), run_gross_pay),
+            (f'paycheck.{variant}.calculate_taxes', 'scalar', len(gross), run_taxes),
+            (f'paycheck.{variant}.calculate_net_pay', 'scalar', len(gross), run_net_pay),
+            (f'paycheck.{variant}.is_valid_float_greater_than_zero', 'scalar', len(strings), run_validation),
+            (f'month_selector.{variant}.is_leap_year', 'scalar', len(years), run_leap_year),
+            (f'month_selector.{variant}.get_days_in_month', 'scalar', len(month_years), run_days_in_month),
+        ]
+    return benchmarks
+
+
+def batch_benchmarks(args):
+    """
+    Build the batch benchmarks for the vectorized batch engine.
+
+    Args:
+        args: The parsed command line arguments.
+        :param args: argparse.Namespace
+
+    Returns: A list of (name, scenario, operations, function) tuples, empty if NumPy is not installed.
+    """
+    try:
+        from paycheck_calculator.python import batch
+    except ImportError:
+        return []
+
+    hours, rates = workload.generate_employees(args.employees, args.overtime_share, args.seed)
+    hours = batch.as_float_array(hours)
+    rates = batch.as_float_array(rates)
+    hours_hundredths = batch.as_int_array([round(value * 100) for value in hours])
+    rate_cents = batch.as_int_array([round(value * 100) for value in rates])
+
+    return [
+        ('paycheck.batch.calculate_pay_batch', 'batch', len(hours),
+         lambda: batch.calculate_pay_batch(hours, rates)),
+        ('paycheck.batch.calculate_pay_batch_cents', 'batch', len(hours),
+         lambda: batch.calculate_pay_batch_cents(hours_hundredths, rate_cents)),
+    ]
+
+
+def file_benchmarks(args, directory):
+    """
+    Build the large-file benchmarks for the streaming and parallel modes.
+
+    Args:
+        args: The parsed command line arguments.
+        :param args: argparse.Namespace
+
+        directory: The directory to write the synthetic timesheet file to.
+        :param directory: str
+
+    Returns: A list of (name, scenario, operations, function) tuples.
+    """
+    from paycheck_calculator.python import stream
+
+    path = os.path.join(directory, 'timesheet.csv')
+    workload.write_timesheet(path, args.file_rows, args.overtime_share, args.seed)
+
+    def run_stream():
+        with open(path, newline='', encoding='utf-8') as lines, open(os.devnull, 'w') as output:
+            stream.process_timesheet(lines, output)
+
+    benchmarks = [('paycheck.stream.process_timesheet', 'file', args.file_rows, run_stream)]
+
+    try:
+        from paycheck_calculator.python import parallel
+    except ImportError:
+        return benchmarks
+
+    def run_parallel():
+        with open(os.devnull, 'w') as output:
+            parallel.process_timesheet_parallel(path, output, workers=args.workers)
+
+    benchmarks.append(('paycheck.parallel.process_timesheet_parallel', 'file', args.file_rows, run_parallel))
+    return benchmarks
+
+
+def compare_results(results, baseline, tolerance):
+    """
+    Compare the results with a saved baseline report.
+
+    Args:
+        results: The benchmark results of this run.
+        :param results: list[dict]
+
+        baseline: The saved baseline report.
+        :param baseline: dict
+
+        tolerance: The allowed slowdown as a fraction (e.g., 0.1 allows benchmarks to be 10% slower).
+        :param tolerance: float
+
+    Returns: A list with one comparison dictionary per benchmark found in both reports.
+    """
+    baseline_results = {result['name']: result for result in baseline.get('results', [])}
+    comparisons = []
+    for result in results:
+        previous = baseline_results.get(result['name'])
+        if previous is None or not previous['ns_per_operation']:
+            continue
+        ratio = result['ns_per_operation'] / previous['ns_per_operation']
+        comparisons.append({
+            'name': result['name'],
+            'baseline_ns_per_operation': previous['ns_per_operation'],
+            'ns_per_operation': result['ns_per_operation'],
+            'ratio': ratio,
+            'regression': ratio > 1 + tolerance,
+        })
+    return comparisons
+
+
+def parse_arguments(argv):
+    """
+    Parse the command line arguments of the benchmark runner.
+
+    Args:
+        argv: The command line arguments, without the program name.
+        :param argv: list[str]
+
+    Returns: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description='Run the benchmark suite and report the results as JSON.')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help=f'Comma-separated scenarios to run (default: {",".join(SCENARIOS)}).')
+    parser.add_argument('--employees', type=int, default=100000, help='Rows per scalar and batch benchmark.')
+    parser.add_argument('--overtime-share', type=float, default=0.2, help='Share of employees working overtime.')
+    parser.add_argument('--file-rows', type=int, default=200000, help='Rows in the synthetic timesheet file.')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for the parallel benchmark.')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per benchmark.')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of the workload generator.')
+    parser.add_argument('--output', default='-', help="The report file, or '-' for standard output.")
+    parser.add_argument('--compare', help='A saved report to compare the results against.')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='Allowed slowdown before a regression.')
+    args = parser.parse_args(argv)
+
+    args.scenarios = [scenario.strip() for scenario in args.scenarios.split(',') if scenario.strip()]
+    unknown = [scenario for scenario in args.scenarios if scenario not in SCENARIOS]
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(unknown)}')
+    return args
+
+
+def main(argv=None):
+    """
+    Run the benchmark suite and write the report.
+
+    Args:
+        argv: The command line arguments, without the program name. Defaults to sys.argv[1:].
+        :param argv: list[str]
+
+    Returns: The exit status (1 if a regression was found against the baseline, 0 otherwise).
+    """
+    args = parse_arguments(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        benchmarks = []
+        if 'scalar' in args.scenarios:
+            benchmarks += scalar_benchmarks(args)
+        if 'batch' in args.scenarios:
+            benchmarks += batch_benchmarks(args)
+        if 'file' in args.scenarios:
+            benchmarks += file_benchmarks(args, directory)
+
+        for name, scenario, operations, function in benchmarks:
+            results.append(make_result(name, scenario, operations, measure(function, args.repeat)))
+            print(f'{name:<60} {results[-1]["ns_per_operation"]:>12.1f} ns/op', file=sys.stderr)
+
+    report = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'scenarios': args.scenarios,
+            'employees': args.employees,
+            'overtime_share': args.overtime_share,
+            'file_rows': args.file_rows,
+            'workers': args.workers,
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            comparisons = compare_results(results, json.load(file), args.tolerance)
+        report['comparison'] = comparisons
+        for comparison in comparisons:
+            flag = '  REGRESSION' if comparison['regression'] else ''
+            print(f'{comparison["name"]:<60} {comparison["ratio"]:>8.2f}x{flag}', file=sys.stderr)
+        status = 1 if any(comparison['regression'] for comparison in comparisons) else 0
+
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
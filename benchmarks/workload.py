@@ -0,0 +1,131 @@
+"""
+Benchmarks - Synthetic Workload Generator
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module generates synthetic workloads for the benchmark suite. The paycheck workloads are employee mixes of hours
+worked and hourly rates, with a configurable share of employees working overtime (more than MAX_STANDARD_HOURS). The
+month selector workloads are (month, year) pairs within MIN_YEAR and MAX_YEAR. Every generator takes a seed, so the
+same workload is produced on every run and the results of two runs can be compared.
+
+The following functions are defined in this module:
+    - generate_employees(count, overtime_share, seed): Generates hours worked and hourly rates for employees.
+    - generate_numeric_strings(count, invalid_share, seed): Generates input strings for the validation functions.
+    - generate_month_years(count, seed): Generates (month, year) pairs for the calendar functions.
+    - write_timesheet(path, count, overtime_share, seed): Writes a synthetic CSV timesheet file.
+"""
+
+import csv
+import random
+
+STANDARD_RATES = [15.0, 18.5, 22.0, 25.0, 32.75, 40.0, 55.0]  # Most employees share a few standard rates
+STANDARD_HOURS = 40.0  # Most employees work a standard 40-hour week
+MIN_YEAR = 1800
+MAX_YEAR = 2100
+INVALID_VALUES = ['', 'abc', '-5', '0', '1,000', 'N/A']
+
+
+def generate_employees(count, overtime_share=0.2, seed=0):
+    """
+    Generate hours worked and hourly rates for a mix of employees.
+
+    Employees without overtime either work the standard 40-hour week or fewer hours, and employees with overtime work
+    between 40 and 80 hours. Half of the employees are paid one of the STANDARD_RATES, and the rest have a random
+    hourly rate between $10 and $200.
+
+    Args:
+        count: The number of employees.
+        :param count: int
+
+        overtime_share: The share of employees working overtime, between 0 and 1.
+        :param overtime_share: float
+
+        seed: The random seed.
+        :param seed: int
+
+    Returns: A tuple with the list of hours worked and the list of hourly rates.
+    """
+    generator = random.Random(seed)
+    hours = []
+    rates = []
+    for _ in range(count):
+        if generator.random() < overtime_share:
+            hours.append(round(generator.uniform(STANDARD_HOURS + 0.25, 80.0), 2))
+        elif generator.random() < 0.5:
+            hours.append(STANDARD_HOURS)
+        else:
+            hours.append(round(generator.uniform(1.0, STANDARD_HOURS), 2))
+
+        if generator.random() < 0.5:
+            rates.append(generator.choice(STANDARD_RATES))
+        else:
+            rates.append(round(generator.uniform(10.0, 200.0), 2))
+    return hours, rates
+
+
+def generate_numeric_strings(count, invalid_share=0.05, seed=0):
+    """
+    Generate input strings for the validation functions, with a share of invalid values.
+
+    Args:
+        count: The number of strings.
+        :param count: int
+
+        invalid_share: The share of invalid values, between 0 and 1.
+        :param invalid_share: float
+
+        seed: The random seed.
+        :param seed: int
+
+    Returns: A list of strings.
+    """
+    generator = random.Random(seed)
+    return [generator.choice(INVALID_VALUES) if generator.random() < invalid_share
+            else f'{generator.uniform(0.01, 200.0):.2f}'
+            for _ in range(count)]
+
+
+def generate_month_years(count, seed=0):
+    """
+    Generate (month, year) pairs within MIN_YEAR and MAX_YEAR.
+
+    Args:
+        count: The number of pairs.
+        :param count: int
+
+        seed: The random seed.
+        :param seed: int
+
+    Returns: A tuple with the list of months and the list of years.
+    """
+    generator = random.Random(seed)
+    months = [generator.randint(1, 12) for _ in range(count)]
+    years = [generator.randint(MIN_YEAR, MAX_YEAR) for _ in range(count)]
+    return months, years
+
+
+def write_timesheet(path, count, overtime_share=0.2, seed=0):
+    """
+    Write a synthetic CSV timesheet file in the layout read by the streaming and parallel modes.
+
+    Args:
+        path: The path of the file to write.
+        :param path: str
+
+        count: The number of employee rows.
+        :param count: int
+
+        overtime_share: The share of employees working overtime, between 0 and 1.
+        :param overtime_share: float
+
+        seed: The random seed.
+        :param seed: int
+
+    Returns: None
+    """
+    hours, rates = generate_employees(count, overtime_share, seed)
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['employee_id', 'hours_worked', 'hourly_rate'])
+        for index, (hours_worked, hourly_rate) in enumerate(zip(hours, rates), start=1):
+            writer.writerow([f'E{index:08d}', hours_worked, hourly_rate])
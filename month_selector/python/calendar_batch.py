@@ -0,0 +1,158 @@
+"""
+    Month Selector - Python Calendar Batch Functions
+    Date: Saturday, October 17th, 2026
+    Author: Brittaney Perry-Morgan
+
+    This module contains vectorized versions of is_leap_year() and get_days_in_month() from the core module (core.py)
+    for reporting jobs that need the number of days for millions of (month, year) pairs at a time. The functions accept
+    NumPy integer arrays (or anything NumPy can turn into an array, such as lists) and evaluate every pair with array
+    operations, with no Python-level loop:
+        - A leap year is computed with the same divisibility rules as is_leap_year(), as boolean masks.
+        - The number of days is looked up in a 13-entry table of month lengths (indexed by the month number), and one
+          day is added where the month is February and the year is a leap year.
+
+    The scalar get_days_in_month() silently returns 0 for an invalid month. get_days_in_month_batch() instead returns
+    a mask of the valid months next to the days, so the caller can tell a bad month apart from a real month length.
+    The years are broadcast against the months, so a single year can be combined with an array of months (and vice
+    versa). The day spans between arrays of months use the closed-form day numbers of day_span.py, so every span
+    takes the same few array operations no matter how long it is. This module requires NumPy.
+
+    The following functions are defined in this module:
+        - as_int_array(values): Converts the input values to an int64 NumPy array.
+        - is_leap_year_batch(years): Checks which years are leap years.
+        - get_days_in_month_batch(month_numbers, years): Returns the number of days and the valid month mask.
+        - get_month_day_number_batch(month_numbers, years): Returns the absolute day numbers and the valid month mask.
+        - get_days_between_batch(start_months, start_years, end_months, end_years, inclusive): Returns the days
+            between pairs of months and the valid mask.
+
+    Example:
+        >>> from month_selector.python.calendar_batch import get_days_in_month_batch
+        >>> days, valid = get_days_in_month_batch([2, 2, 13], [2024, 2100, 2024])
+        >>> days.tolist(), valid.tolist()
+        ([29, 28, 0], [True, True, False])
+    """
+
+import numpy as np
+
+from .core import MIN_MONTH, MAX_MONTH, get_days_in_month
+from .day_span import DAYS_BEFORE_MONTH
+
+FEBRUARY = 2  # The month that has an extra day in leap years
+DAYS_IN_MONTH = np.array([0] + [get_days_in_month(month, 1) for month in range(MIN_MONTH, MAX_MONTH + 1)],
+                         dtype=np.int64)  # Days per month number in a common year (index 0 is unused)
+DAYS_BEFORE_MONTH_ARRAY = np.array((0,) + DAYS_BEFORE_MONTH, dtype=np.int64)  # Indexed by the month number
+
+
+def as_int_array(values):
+    """
+    Convert the input values to an int64 NumPy array.
+
+    Arrays that already have the int64 data type are returned as they are, without making a copy.
+
+    Args:
+        values: The values to convert (e.g., a list, tuple, or NumPy array).
+        :param values: array-like
+
+    Returns: The values as an int64 NumPy array.
+    """
+    return np.asarray(values, dtype=np.int64)
+
+
+def is_leap_year_batch(years):
+    """
+    Check which years are leap years.
+
+    This is the batch equivalent of is_leap_year(): a year is a leap year if it is divisible by 4 and not by 100,
+    unless it is also divisible by 400.
+
+    Args:
+        years: The years to check.
+        :param years: array-like
+
+    Returns: A boolean array that is True for the leap years.
+    """
+    years = as_int_array(years)
+    return ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+
+
+def get_days_in_month_batch(month_numbers, years):
+    """
+    Get the number of days in each month, and which month numbers are valid.
+
+    Args:
+        month_numbers: The month numbers (1-12).
+        :param month_numbers: array-like
+
+        years: The years (broadcast against month_numbers).
+        :param years: array-like
+
+    Returns: A tuple with an int64 array of the number of days in each month (0 where the month number is invalid) and
+    a boolean array that is True where the month number is valid.
+    """
+    month_numbers, years = np.broadcast_arrays(as_int_array(month_numbers), as_int_array(years))
+    valid = (month_numbers >= MIN_MONTH) & (month_numbers <= MAX_MONTH)
+
+    days = DAYS_IN_MONTH[np.where(valid, month_numbers, 0)]
+    days = days + ((month_numbers == FEBRUARY) & is_leap_year_batch(years))
+    return days, valid
+
+
+def get_month_day_number_batch(month_numbers, years):
+    """
+    Get the absolute day number of the first day of each month, counting January 1st of year 1 as day 0.
+
+    This is the batch equivalent of get_month_day_number() in day_span.py.
+
+    Args:
+        month_numbers: The month numbers (1-12).
+        :param month_numbers: array-like
+
+        years: The years, broadcast against month_numbers.
+        :param years: array-like
+
+    Returns: A tuple with an int64 array of the day numbers (0 where the month number is invalid) and a boolean array
+    that is True where the month number is valid.
+    """
+    month_numbers, years = np.broadcast_arrays(as_int_array(month_numbers), as_int_array(years))
+    valid = (month_numbers >= MIN_MONTH) & (month_numbers <= MAX_MONTH)
+
+    previous_years = years - 1
+    days = 365 * previous_years + previous_years // 4 - previous_years // 100 + previous_years // 400
+    days = days + DAYS_BEFORE_MONTH_ARRAY[np.where(valid, month_numbers, 0)]
+    days = days + ((month_numbers > FEBRUARY) & is_leap_year_batch(years))
+    return np.where(valid, days, 0), valid
+
+
+def get_days_between_batch(start_months, start_years, end_months, end_years, inclusive=False):
+    """
+    Get the number of days from the first day of each start month to the first day of each end month.
+
+    This is the batch equivalent of get_days_between() in day_span.py.
+
+    Args:
+        start_months: The start month numbers (1-12).
+        :param start_months: array-like
+
+        start_years: The years of the start months.
+        :param start_years: array-like
+
+        end_months: The end month numbers (1-12).
+        :param end_months: array-like
+
+        end_years: The years of the end months.
+        :param end_years: array-like
+
+        inclusive: True to also count the days of the end months.
+        :param inclusive: bool
+
+    Returns: A tuple with an int64 array of the number of days in each span (0 where a month number is invalid) and a
+    boolean array that is True where both month numbers are valid.
+    """
+    start_days, start_valid = get_month_day_number_batch(start_months, start_years)
+    end_days, end_valid = get_month_day_number_batch(end_months, end_years)
+    days = end_days - start_days
+    if inclusive:
+        days = days + get_days_in_month_batch(end_months, end_years)[0]
+
+    valid = start_valid & end_valid
+    return np.where(valid, days, 0), valid
@@ -0,0 +1,156 @@
+"""
+    Month Selector - Python Calendar Index
+    Date: Saturday, October 17th, 2026
+    Author: Brittaney Perry-Morgan
+
+    This module contains a precomputed calendar index for the Month Selector. get_days_in_month() in the core module
+    (core.py) tests the month against lists of month numbers and calls is_leap_year() on every call, which adds up when
+    scheduling code calls it in tight loops. The CalendarIndex class does that work once, and keeps two flat lists
+    indexed by (year in cycle) * 12 + (month - 1):
+        - days: The number of days in each month.
+        - starts: The prefix sums of days, i.e., the day number of the first day of each month, counting January 1st
+          of the first year of the cycle as day 0. The list has one extra entry at the end, the day after the last
+          month.
+
+    The Gregorian calendar repeats every 400 years (146,097 days, an exact number of weeks), because the leap year
+    rules of is_leap_year() only depend on the year modulo 400. The lists therefore only cover one 400-year cycle
+    (4,800 months, for years 1 to 400), and any year, including years before year 1 in the proleptic Gregorian
+    calendar, is folded into the cycle with divmod(year - 1, 400). The number of days in a month and the day-of-year
+    offset of a month are each a single list lookup, no matter which year is asked for, and the table has a fixed
+    size. The absolute day number of a date uses the closed-form get_month_day_number() in day_span.py, so there is
+    only one implementation of day numbers. Like get_days_in_month(), every method takes the month first and the year
+    last. The index is built on first use and shared by the console and GUI applications through
+    get_calendar_index().
+
+    The following functions are defined in this module:
+        - get_calendar_index(): Returns the shared calendar index.
+
+    Example:
+        >>> from month_selector.python.calendar_index import get_calendar_index
+        >>> index = get_calendar_index()
+        >>> index.days_in_month(2, 2024), index.day_of_year(3, 1, 2024), index.days_in_month(2, -100000)
+        (29, 61, 29)
+    """
+
+from functools import lru_cache
+
+from .core import MIN_MONTH, MAX_MONTH, get_days_in_month
+from .day_span import get_month_day_number
+
+MONTHS_PER_YEAR = MAX_MONTH - MIN_MONTH + 1  # Number of entries per year in the index
+CYCLE_YEARS = 400  # The Gregorian calendar repeats every 400 years
+
+
+class CalendarIndex:
+    """
+    Precomputed days per month and day number prefix sums for one 400-year cycle, which cover every year.
+    """
+
+    def __init__(self):
+        self.days = [get_days_in_month(month, year)
+                     for year in range(1, CYCLE_YEARS + 1)
+                     for month in range(MIN_MONTH, MAX_MONTH + 1)]
+        self.starts = [0]
+        for days in self.days:
+            self.starts.append(self.starts[-1] + days)
+
+    def get_position(self, month, year):
+        """
+        Fold a month into the 400-year cycle.
+
+        Args:
+            month: The month number (1-12).
+            :param month: int
+
+            year: The year (any year, including year 0 and negative years).
+            :param year: int
+
+        Returns: The position of the month in days and starts.
+        """
+        if not MIN_MONTH <= month <= MAX_MONTH:
+            raise ValueError(f'Month {month} is not between {MIN_MONTH} and {MAX_MONTH}.')
+        return (year - 1) % CYCLE_YEARS * MONTHS_PER_YEAR + (month - MIN_MONTH)
+
+    def days_in_month(self, month, year):
+        """
+        Get the number of days in a month.
+
+        Like get_days_in_month(), an invalid month number has 0 days.
+
+        Args:
+            month: The month number (1-12).
+            :param month: int
+
+            year: The year.
+            :param year: int
+
+        Returns: The number of days in the month.
+        """
+        if not MIN_MONTH <= month <= MAX_MONTH:
+            return 0
+        return self.days[(year - 1) % CYCLE_YEARS * MONTHS_PER_YEAR + (month - MIN_MONTH)]
+
+    def month_offset(self, month, year):
+        """
+        Get the number of days in the year before the first day of a month.
+
+        Args:
+            month: The month number (1-12).
+            :param month: int
+
+            year: The year.
+            :param year: int
+
+        Returns: The number of days from January 1st to the first day of the month (0 for January).
+        """
+        position = self.get_position(month, year)
+        return self.starts[position] - self.starts[position - (month - MIN_MONTH)]
+
+    def day_of_year(self, month, day, year):
+        """
+        Get the day of the year of a date.
+
+        Args:
+            month: The month number (1-12).
+            :param month: int
+
+            day: The day of the month.
+            :param day: int
+
+            year: The year.
+            :param year: int
+
+        Returns: The day of the year, starting at 1 for January 1st.
+        """
+        return self.month_offset(month, year) + day
+
+    def day_number(self, month, day, year):
+        """
+        Get the absolute day number of a date, counting January 1st of year 1 as day 0.
+
+        The difference between the day numbers of two dates is the number of days between them. The day number is
+        calculated by get_month_day_number() in day_span.py.
+
+        Args:
+            month: The month number (1-12).
+            :param month: int
+
+            day: The day of the month.
+            :param day: int
+
+            year: The year.
+            :param year: int
+
+        Returns: The absolute day number of the date.
+        """
+        return get_month_day_number(month, year) + day - 1
+
+
+@lru_cache(maxsize=None)
+def get_calendar_index():
+    """
+    Get the shared calendar index. The index is built on the first call only.
+
+    Returns: The calendar index.
+    """
+    return CalendarIndex()
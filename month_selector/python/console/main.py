@@ -9,36 +9,55 @@
     user input and displays the selected month (by full name) and year to the user. The main functionality includes
     functions to validate user input, get the month name from the month number, and display the selected month, year,
     and number of days in the month. The application takes leap years into consideration when calculating the number of
-    days in February. There are six constant variables defined at the beginning of the module: MIN_YEAR, MAX_YEAR, 
-    MIN_MONTH, MAX_MONTH, MONTHS, and INSTRUCTIONS.
+    days in February. The constants (MIN_MONTH, MAX_MONTH, and MONTHS), the input validation
+    functions, and the calendar functions are defined in the headless core module (core.py) and imported from there.
+    This module defines the INSTRUCTIONS constant and adds the functions to prompt the user and display the results.
+    The number of days in the month is looked up in the shared precomputed calendar index (calendar_index.py).
     
     The following functions are defined in this module:
         - display_start(): Displays the welcome message and instructions to the user.
         - prompt_user(prompt): Prompts the user for input and returns the user's input. 
-        - is_valid_input(value): Checks if the input value is not an empty string. 
-        - is_valid_integer(value): Checks if the input value can be converted to an integer. 
-        - is_valid_year(value): Checks if the input value is a valid year within the specified range. 
         - get_valid_input(prompt, validation_function, error_message): Prompts the user for input and validates the
             input. 
-        - is_leap_year(year): Checks if the given year is a leap year.
-        - is_valid_month(value): Checks if the input value is a valid month within the specified range. 
-        - get_month_name(month_number): Returns the full name of the month based on the month number. 
-        - get_days_in_month(month_number, year): Returns the number of days in the month based on the month number
-            and year. 
         - display_selected_month(month_name, year, days_in_month): Displays the selected month, year, and number of days
             in the month to the user. 
+        - parse_month(value): Returns the month number of a month number or month name, or None if it is invalid.
+        - process_month_lines(lines, output, errors): Writes the month name, year, and days for 'year,month' lines.
+        - run_cli(argv, stdin, stdout, stderr): Runs the non-interactive streaming mode and returns the exit status.
+
+    When command line arguments are given, the application runs non-interactively instead. It reads 'year,month' lines
+    (the month can be a number, a month name, or an abbreviation) from a file or standard input, and writes one
+    'month_name,year,days' line per input line. Invalid lines are reported on standard error with their line number,
+    and the exit status is 1 if any line was invalid. The lines are processed one at a time and written in large
+    blocks, so memory use stays constant and one process can handle millions of lines:
+        python -m month_selector.python.console.main --batch < months.csv
+        python -m month_selector.python.console.main --batch months.csv --output days.csv
     """
 
-MIN_YEAR = 1800
-MAX_YEAR = 2100
-MIN_MONTH = 1
-MAX_MONTH = 2
-MONTHS = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
+import argparse
+import sys
+
+from ..core import (
+    MIN_MONTH,
+    MAX_MONTH,
+    MONTHS,
+    is_valid_input,
+    is_valid_integer,
+    is_valid_year,
+    is_leap_year,
+    is_valid_month,
+    get_month_name,
+    get_days_in_month,
+)
+from ..calendar_index import get_calendar_index
+from ..month_names import parse_month_name
+
+MONTH_NUMBERS = {str(number): number for number in range(MIN_MONTH, MAX_MONTH + 1)}  # Month number text to number
+OUTPUT_BLOCK_LINES = 8192  # Output lines written at a time in the streaming mode
+INPUT_BUFFER_SIZE = 1024 * 1024  # Read buffer of an input file in the streaming mode
+
 INSTRUCTIONS = [
-    f'Select a year between {MIN_YEAR} and {MAX_YEAR}.',
+    'Select any year (e.g., 2024).',
     f'Select a month between January and December, represented by the numbers 1 to 12.',
     'The application will display the selected month (by full name), year, and the number of days in the month.'
 ]
@@ -76,56 +95,6 @@ def prompt_user(prompt):
     return input(prompt)
 
 
-def is_valid_input(value):
-    """
-    Check if the input value is not an empty string. 
-
-    Args:
-        value: The input value to check. 
-        :param value: str
-
-    Returns: True if the input value is not an empty string, False otherwise.
-    """
-    return value != ''
-
-
-def is_valid_integer(value):
-    """
-    Checks if the input value can be converted to an integer. 
-
-    This function attempts to convert the input value to an integer and returns True if successful, 
-    indicating that the input is a valid integer. If the conversion raises a ValueError, it returns False. 
-
-    Args:
-        value: The input value to check. 
-        :param value: str 
-
-    Returns: True if the input value can be converted to an integer, False otherwise.
-    """
-    try:
-        int(value)
-        return True
-    except ValueError:
-        return False
-
-
-def is_valid_year(value):
-    """
-    Check if the input value is a valid year within the specified range. 
-
-    The function checks if the input value can be converted to an integer and if it falls within the
-    specified range of years. The function uses the constant values MIN_YEAR and MAX_YEAR to determine
-    the valid range of years. MIN_YEAR is set to 1800 and MAX_YEAR is set to 2100.
-
-    Args:
-        value: The input value to check. 
-        :param value: str 
-
-    Returns: True if the input value is a valid year within the specified range, False otherwise.
-    """
-    return is_valid_integer(value) and MIN_YEAR <= int(value) <= MAX_YEAR
-
-
 def get_valid_input(prompt, validation_function, error_message):
     """ 
     Prompt the user for input and validate the input using the specified validation function. 
@@ -155,85 +124,6 @@ def get_valid_input(prompt, validation_function, error_message):
             print(error_message)
 
 
-def is_leap_year(year):
-    """
-    Determine if the given year is a leap year. 
-
-    The function checks if the given year is a leap year based on the following criteria:
-        - The year is evenly divisible by 4. 
-        - The year is not divisible by 100, unless it is also divisible by 400. 
-
-    Args:
-        year: The year to check. 
-        :param year: int
-
-    Returns: True if the given year is a leap year, False otherwise. 
-    """
-    return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
-
-
-def is_valid_month(value):
-    """
-    Determine if the given month is a valid month within the specified range. 
-
-    The function checks if the input value can be converted to an integer and if it falls within the
-    specified range of months. The function uses the constant values MIN_MONTH and MAX_MONTH to determine
-    the valid range of months. MIN_MONTH is set to 1, which is for January, and MAX_MONTH is set to 12, 
-    which is for December. 
-
-    Args:
-        value: The input value to check. 
-        :param value: str
-
-    Returns: True if the input value is a valid month within the specified range, False otherwise. 
-    """
-    return is_valid_integer(value) and MIN_MONTH <= int(value) <= MAX_MONTH
-
-
-def get_month_name(month_number):
-    """
-    Get the month named based on the month number. 
-
-    The function returns the full name of the month based on the month number provided as an argument. 
-    The function uses the MONTHS constant list to map the month number to the corresponding month name. 
-    Because the list is zero-based, the month number is decremented by 1 to get the correct index. 
-
-    Args:
-        month_number: The month number. 
-        :param month_number: int
-
-    Returns: The full name of the month. 
-    """
-    return MONTHS[month_number - 1]
-
-
-def get_days_in_month(month_number, year):
-    """
-    Get the number of days in the month based on the month number and year. 
-
-    The function calculates the number of days in the month based on the month number and year provided as
-    arguments. The function takes leap years into consideration when determining the number of days in February. 
-    The function returns the number of days in the month. 
-
-    Args:
-        month_number: The month number. 
-        :param month_number: int
-
-        year: The year. 
-        :param year: int
-
-    Returns: The number of days in the month. 
-    """
-    if month_number in [1, 3, 5, 7, 8, 10, 12]:
-        return 31
-    elif month_number in [4, 6, 9, 11]:
-        return 30
-    elif month_number == 2:
-        return 29 if is_leap_year(year) else 28
-    else:
-        return 0
-
-
 def display_selected_month(month_name, year, days_in_month):
     """
     Display the selected month, year, and number of days in the month. 
@@ -267,15 +157,143 @@ def main():
     display_start()
     while True:
         year = get_valid_input('Enter the year: ', is_valid_year,
-                               f'{" " * 2}*** Enter a valid year between {MIN_YEAR} and {MAX_YEAR}.')
+                               f'{" " * 2}*** Enter a valid year (a whole number).')
         month = get_valid_input('Enter the month (1-12): ', is_valid_month,
                                 f'{" " * 2}*** Enter a valid month between 1 and 12.')
         month_name = get_month_name(int(month))
-        days_in_month = get_days_in_month(int(month), int(year))
+        days_in_month = get_calendar_index().days_in_month(int(month), int(year))
         display_selected_month(month_name, year, days_in_month)
         print('Thank you for using the Month Selector Application!')
         break
 
 
+def parse_month(value):
+    """
+    Parse a month given as a month number (1-12) or a month name or abbreviation (in any case, see month_names.py).
+
+    Args:
+        value: The month number or name.
+        :param value: str
+
+    Returns: The month number, or None if the value is not a valid month.
+    """
+    value = value.strip()
+    month_number = MONTH_NUMBERS.get(value)
+    if month_number is None:
+        month_number = int(value) if is_valid_month(value) else parse_month_name(value)
+    return month_number
+
+
+def process_month_lines(lines, output, errors):
+    """
+    Write the month name, year, and number of days in the month for each 'year,month' line.
+
+    Each line is validated with the same rules as the interactive prompts (is_valid_year() and is_valid_month(), or a
+    month name), parsing each value only once. Blank lines are skipped. The output lines are collected into blocks of
+    OUTPUT_BLOCK_LINES lines and each block is written with a single write() call.
+
+    Args:
+        lines: An iterable of 'year,month' lines (e.g., a file or sys.stdin).
+        :param lines: iterable[str]
+
+        output: The text stream to write the 'month_name,year,days' lines to.
+        :param output: io.TextIOBase
+
+        errors: The text stream to write the invalid lines to.
+        :param errors: io.TextIOBase
+
+    Returns: A tuple with the number of processed lines and the number of invalid lines.
+    """
+    days_in_month = get_calendar_index().days_in_month
+    processed = 0
+    rejected = 0
+    block = []
+
+    for line_number, line in enumerate(lines, start=1):
+        year, _, month = line.strip().partition(',')
+        if not year and not month:
+            continue
+
+        try:
+            year_number = int(year)
+        except ValueError:
+            year_number = None
+        if year_number is None:
+            rejected += 1
+            errors.write(f'Line {line_number}: Invalid year: {year.strip()!r}\n')
+            continue
+
+        month_number = parse_month(month)
+        if month_number is None:
+            rejected += 1
+            errors.write(f'Line {line_number}: Invalid month: {month.strip()!r}\n')
+            continue
+
+        block.append(f'{MONTHS[month_number - 1]},{year_number},{days_in_month(month_number, year_number)}\n')
+        processed += 1
+        if len(block) >= OUTPUT_BLOCK_LINES:
+            output.write(''.join(block))
+            block.clear()
+
+    output.write(''.join(block))
+    return processed, rejected
+
+
+def run_cli(argv, stdin=None, stdout=None, stderr=None):
+    """
+    Run the non-interactive streaming mode.
+
+    Args:
+        argv: The command line arguments, without the program name.
+        :param argv: list[str]
+
+        stdin: The stream to read the lines from when no input file is given. Defaults to sys.stdin.
+        :param stdin: io.TextIOBase
+
+        stdout: The stream to write the results to when no output file is given. Defaults to sys.stdout.
+        :param stdout: io.TextIOBase
+
+        stderr: The stream to write the invalid lines to. Defaults to sys.stderr.
+        :param stderr: io.TextIOBase
+
+    Returns: The exit status (0 if every line was valid, 1 otherwise). A file that cannot be opened is reported as a
+    usage error, with exit status 2.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    parser = argparse.ArgumentParser(description='Write the month name, year, and days for year,month lines.')
+    parser.add_argument('--batch', action='store_true', required=True,
+                        help="Read 'year,month' lines and write 'month_name,year,days' lines.")
+    parser.add_argument('input', nargs='?', default='-', help="The input file, or '-' for standard input.")
+    parser.add_argument('--output', default='-', help="The output file, or '-' for standard output.")
+    args = parser.parse_args(argv)
+
+    lines = stdin
+    output = stdout
+    try:
+        if args.input != '-':
+            lines = open(args.input, encoding='utf-8', buffering=INPUT_BUFFER_SIZE)
+        if args.output != '-':
+            output = open(args.output, 'w', encoding='utf-8', newline='')
+    except OSError as error:
+        if lines is not stdin:
+            lines.close()
+        parser.error(f"cannot open '{error.filename}': {error.strerror}")
+
+    try:
+        _, rejected = process_month_lines(lines, output, stderr)
+    finally:
+        if lines is not stdin:
+            lines.close()
+        if output is not stdout:
+            output.close()
+
+    return 1 if rejected else 0
+
+
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
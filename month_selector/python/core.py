@@ -0,0 +1,159 @@
+"""
+    Month Selector - Python Calendar Core
+    Date: Saturday, October 17th, 2026
+    Author: Brittaney Perry-Morgan
+
+    This module contains the headless core of the Month Selector: the constants, the input validation functions, and
+    the calendar functions shared by the console application and the GUI application. It has no imports at all (in
+    particular, no GUI imports), so it can be imported in worker processes and on headless hosts in a few milliseconds
+    without pulling in Tkinter. The application takes leap years into consideration when calculating the number of
+    days in February. There are three constant variables defined at the beginning of the module: MIN_MONTH,
+    MAX_MONTH, and MONTHS. Any whole number is a valid year (in the proleptic Gregorian calendar), so there is no year
+    range.
+
+    The following functions are defined in this module:
+        - is_valid_input(value): Checks if the input value is not an empty string.
+        - is_valid_integer(value): Checks if the input value can be converted to an integer.
+        - is_valid_year(value): Checks if the input value is a valid year.
+        - is_leap_year(year): Checks if the given year is a leap year.
+        - is_valid_month(value): Checks if the input value is a valid month within the specified range.
+        - get_month_name(month_number): Returns the full name of the month based on the month number.
+        - get_days_in_month(month_number, year): Returns the number of days in the month based on the month number
+            and year.
+    """
+
+MIN_MONTH = 1
+MAX_MONTH = 12
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+
+def is_valid_input(value):
+    """
+    Check if the input value is not an empty string.
+
+    Args:
+        value: The input value to check.
+        :param value: str
+
+    Returns: True if the input value is not an empty string, False otherwise.
+    """
+    return value != ''
+
+
+def is_valid_integer(value):
+    """
+    Checks if the input value can be converted to an integer.
+
+    This function attempts to convert the input value to an integer and returns True if successful,
+    indicating that the input is a valid integer. If the conversion raises a ValueError, it returns False.
+
+    Args:
+        value: The input value to check.
+        :param value: str
+
+    Returns: True if the input value can be converted to an integer, False otherwise.
+    """
+    try:
+        int(value)
+        return True
+    except ValueError:
+        return False
+
+
+def is_valid_year(value):
+    """
+    Check if the input value is a valid year.
+
+    The function checks if the input value can be converted to an integer. Any whole number is a valid year, since
+    the leap year rule and the calendar index (calendar_index.py) work for every year, not only for the 1800 to 2100
+    range of the original assignment.
+
+    Args:
+        value: The input value to check.
+        :param value: str
+
+    Returns: True if the input value is a valid year, False otherwise.
+    """
+    return is_valid_integer(value)
+
+
+def is_leap_year(year):
+    """
+    Determine if the given year is a leap year.
+
+    The function checks if the given year is a leap year based on the following criteria:
+        - The year is evenly divisible by 4.
+        - The year is not divisible by 100, unless it is also divisible by 400.
+
+    Args:
+        year: The year to check.
+        :param year: int
+
+    Returns: True if the given year is a leap year, False otherwise.
+    """
+    return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+
+
+def is_valid_month(value):
+    """
+    Determine if the given month is a valid month within the specified range.
+
+    The function checks if the input value can be converted to an integer and if it falls within the
+    specified range of months. The function uses the constant values MIN_MONTH and MAX_MONTH to determine
+    the valid range of months. MIN_MONTH is set to 1, which is for January, and MAX_MONTH is set to 12,
+    which is for December.
+
+    Args:
+        value: The input value to check.
+        :param value: str
+
+    Returns: True if the input value is a valid month within the specified range, False otherwise.
+    """
+    return is_valid_integer(value) and MIN_MONTH <= int(value) <= MAX_MONTH
+
+
+def get_month_name(month_number):
+    """
+    Get the month named based on the month number.
+
+    The function returns the full name of the month based on the month number provided as an argument.
+    The function uses the MONTHS constant list to map the month number to the corresponding month name.
+    Because the list is zero-based, the month number is decremented by 1 to get the correct index.
+
+    Args:
+        month_number: The month number.
+        :param month_number: int
+
+    Returns: The full name of the month.
+    """
+    return MONTHS[month_number - 1]
+
+
+def get_days_in_month(month_number, year):
+    """
+    Get the number of days in the month based on the month number and year.
+
+    The function calculates the number of days in the month based on the month number and year provided as
+    arguments. The function takes leap years into consideration when determining the number of days in February.
+    The function returns the number of days in the month.
+
+    Args:
+        month_number: The month number.
+        :param month_number: int
+
+        year: The year.
+        :param year: int
+
+    Returns: The number of days in the month.
+    """
+    if month_number in [1, 3, 5, 7, 8, 10, 12]:
+        return 31
+    elif month_number in [4, 6, 9, 11]:
+        return 30
+    elif month_number == 2:
+        return 29 if is_leap_year(year) else 28
+    else:
+        return 0
@@ -0,0 +1,84 @@
+"""
+    Month Selector - Python Day Spans
+    Date: Saturday, October 17th, 2026
+    Author: Brittaney Perry-Morgan
+
+    This module contains day-span arithmetic for the Month Selector. Pro-rating a salary needs the total number of days
+    between two (month, year) points, and adding up get_days_in_month() month by month takes time proportional to the
+    length of the span. Instead, every month is given an absolute day number in closed form, and the span between two
+    months is the difference of their day numbers, which takes the same time for a span of one month or of a thousand
+    years.
+
+    The day number of the first day of a month (counting January 1st of year 1 as day 0, in the proleptic Gregorian
+    calendar) is:
+        365 * y + y // 4 - y // 100 + y // 400 + (days before the month in a common year) + (1 if the month is after
+        February in a leap year)
+    where y = year - 1. The y // 4 - y // 100 + y // 400 terms count the leap days in the earlier years, which is the
+    leap year rule of is_leap_year() folded over each 400-year cycle. The formula works for any year, not only for
+    the 1800 to 2100 range of the original assignment. The batch versions for NumPy arrays are in calendar_batch.py.
+
+    The following functions are defined in this module:
+        - get_month_day_number(month_number, year): Returns the absolute day number of the first day of a month.
+        - get_days_between(start_month, start_year, end_month, end_year, inclusive): Returns the days between months.
+
+    Example:
+        >>> from month_selector.python.day_span import get_days_between
+        >>> get_days_between(1, 2024, 3, 2024), get_days_between(1, 2024, 12, 2024, inclusive=True)
+        (60, 366)
+    """
+
+from .core import MIN_MONTH, MAX_MONTH, is_leap_year, get_days_in_month
+
+DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)  # Days before each month, common year
+
+
+def get_month_day_number(month_number, year):
+    """
+    Get the absolute day number of the first day of a month, counting January 1st of year 1 as day 0.
+
+    Args:
+        month_number: The month number (1-12).
+        :param month_number: int
+
+        year: The year.
+        :param year: int
+
+    Returns: The absolute day number of the first day of the month.
+    """
+    if not MIN_MONTH <= month_number <= MAX_MONTH:
+        raise ValueError(f'Month {month_number} is not between {MIN_MONTH} and {MAX_MONTH}.')
+    previous_years = year - 1
+    days = 365 * previous_years + previous_years // 4 - previous_years // 100 + previous_years // 400
+    days += DAYS_BEFORE_MONTH[month_number - 1]
+    if month_number > 2 and is_leap_year(year):
+        days += 1
+    return days
+
+
+def get_days_between(start_month, start_year, end_month, end_year, inclusive=False):
+    """
+    Get the number of days from the first day of the start month to the first day of the end month.
+
+    Args:
+        start_month: The start month number (1-12).
+        :param start_month: int
+
+        start_year: The year of the start month.
+        :param start_year: int
+
+        end_month: The end month number (1-12).
+        :param end_month: int
+
+        end_year: The year of the end month.
+        :param end_year: int
+
+        inclusive: True to also count the days of the end month, i.e., to count the days up to the last day of the end
+            month.
+        :param inclusive: bool
+
+    Returns: The number of days between the months (negative if the end month is before the start month).
+    """
+    days = get_month_day_number(end_month, end_year) - get_month_day_number(start_month, start_year)
+    if inclusive:
+        days += get_days_in_month(end_month, end_year)
+    return days
@@ -1,12 +1,15 @@
-import tkinter as tk
-from tkinter import ttk
+import datetime
 
-MIN_YEAR = 1800
-MAX_YEAR = 2100
-MONTHS = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
+from ..core import (
+    MONTHS,
+    is_leap_year,
+    is_valid_integer,
+    get_days_in_month,
+)
+from ..calendar_index import get_calendar_index
+from ..month_names import parse_month_name
+
+YEAR_OPTIONS = 21  # Number of years listed in the year dropdown at a time
 
 
 def create_window(title, width, height):
@@ -23,6 +26,8 @@ def create_window(title, width, height):
 
     Returns: The created window.
     """
+    import tkinter as tk
+
     window = tk.Tk()
     window.title(title)
     window.geometry(f'{width}x{height}')
@@ -50,44 +55,59 @@ def create_dropdown_menu(window, options, row, column, padx=5, pady=5):
 
     Returns: The created dropdown menu.
     """
+    from tkinter import ttk
+
     dropdown_menu = ttk.Combobox(window, values=options)
     dropdown_menu.grid(row=row, column=column, padx=padx, pady=pady)
     return dropdown_menu
 
 
-def is_leap_year(year):
+def get_year_options(text, count=YEAR_OPTIONS):
     """
-    Determine if the given year is a leap year.
+    Get the years to list in the year dropdown for the text typed into it.
+
+    Any year can be typed, so the dropdown never lists every year. It only lists a window of count years centered on
+    the typed year, or on the current year if the text is not a year yet.
 
     Args:
-        year: The year to check.
-        :param year: int
+        text: The text typed into the year dropdown.
+        :param text: str
+
+        count: The number of years to list.
+        :param count: int
 
-    Returns: True if the given year is a leap year, False otherwise.
+    Returns: The list of year strings.
     """
-    return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+    text = text.strip()
+    center = int(text) if is_valid_integer(text) else datetime.date.today().year
+    first = center - count // 2
+    return [str(year) for year in range(first, first + count)]
 
 
-def get_days_in_month(month_number, year):
+def create_year_menu(window, row, column, padx=5, pady=5):
     """
-    Get the number of days in the month based on the month number and year.
+    Create the year dropdown menu in the specified row and column of the window.
+
+    The year can be typed in, and the list of years is only filled in when the dropdown is opened, with the years
+    around the typed year (see get_year_options()).
 
     Args:
-        month_number: The month number.
-        :param month_number: int
-        year: The year.
-        :param year: int
+        window: The GUI window in which to create the dropdown menu.
+        :param window: tk.Tk
+        row: The row in which to place the dropdown menu.
+        :param row: int
+        column: The column in which to place the dropdown menu.
+        :param column: int
+        padx: The horizontal padding around the dropdown menu.
+        :param padx: int
+        pady: The vertical padding around the dropdown menu.
+        :param pady: int
 
-    Returns: The number of days in the month.
+    Returns: The created dropdown menu.
     """
-    if month_number in [1, 3, 5, 7, 8, 10, 12]:
-        return 31
-    elif month_number in [4, 6, 9, 11]:
-        return 30
-    elif month_number == 2:
-        return 29 if is_leap_year(year) else 28
-    else:
-        return 0
+    year_menu = create_dropdown_menu(window, [], row, column, padx=padx, pady=pady)
+    year_menu.configure(postcommand=lambda: year_menu.configure(values=get_year_options(year_menu.get())))
+    return year_menu
 
 
 def update_display(year, month):
@@ -106,12 +126,14 @@ def update_display(year, month):
         display_text.set("Please select both a year and a month.")
         return
 
-    try:
-        month_number = MONTHS.index(month) + 1
-        days_in_month = get_days_in_month(month_number, int(year))
-        display_text.set(f'Selected Month: {month}\nSelected Year: {year}\nNumber of Days: {days_in_month}')
-    except ValueError:
+    month_number = parse_month_name(month)
+    if month_number is None or not is_valid_integer(year):
         display_text.set("Invalid selection. Please try again.")
+        return
+
+    month = MONTHS[month_number - 1]
+    days_in_month = get_calendar_index().days_in_month(month_number, int(year))
+    display_text.set(f'Selected Month: {month}\nSelected Year: {year}\nNumber of Days: {days_in_month}')
 
 
 def main():
@@ -120,9 +142,11 @@ def main():
 
     Returns: None
     """
+    import tkinter as tk
+    from tkinter import ttk
+
     window = create_window('Month Selector', 350, 200)
 
-    years = [str(year) for year in range(MIN_YEAR, MAX_YEAR + 1)]
     months = MONTHS
 
     # Center the layout
@@ -132,7 +156,7 @@ def main():
     window.rowconfigure(0, weight=1)
 
     ttk.Label(frame, text="Select a Year:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-    year_menu = create_dropdown_menu(frame, years, 0, 1, padx=5, pady=5)
+    year_menu = create_year_menu(frame, 0, 1, padx=5, pady=5)
 
     ttk.Label(frame, text="Select a Month:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
     month_menu = create_dropdown_menu(frame, months, 1, 1, padx=5, pady=5)
@@ -0,0 +1,188 @@
+"""
+    Month Selector - Python Month Name Parser
+    Date: Saturday, October 17th, 2026
+    Author: Brittaney Perry-Morgan
+
+    This module contains a month name parser for the Month Selector. Looking a name up with MONTHS.index(month) scans
+    the list of months and only accepts the exact English full names. The parser in this module instead accepts full
+    names and abbreviations (e.g., "September", "Sep", "Sept", and "Sept.") in any case, in any of the configured
+    locales, and resolves each name with a single lookup in a precomputed dictionary (a hash map).
+
+    Each locale has a table with one tuple of accepted names per month, where the first name is the full name. The
+    lookup dictionary is built once per combination of locales and cached. Its keys are the normalized names: the name
+    without surrounding whitespace or a trailing period, case-folded, and without accents (so "Février", "fevrier",
+    and "févr." are all February). The names are also added as written, in lowercase, and in uppercase, so the common
+    spellings are found without normalizing them first. More locales can be added with register_locale().
+
+    The following functions are defined in this module:
+        - normalize_month_name(name): Normalizes a month name for the lookup.
+        - build_month_lookup(locales): Builds the lookup dictionary of month names for the given locales.
+        - get_month_lookup(locales): Returns the cached lookup dictionary for the given locales.
+        - register_locale(locale, names): Adds or replaces the month name table of a locale.
+        - parse_month_name(name, locales): Returns the month number of a month name, or None.
+        - parse_month_names(names, locales): Returns the month numbers of a column of month names, and the invalid rows.
+
+    Example:
+        >>> from month_selector.python.month_names import parse_month_name, parse_month_names
+        >>> parse_month_name('Sept'), parse_month_name('février', locales=('en', 'fr'))
+        (9, 2)
+        >>> parse_month_names(['Jan', 'dec', 'Smarch'])
+        ([1, 12, None], [2])
+    """
+
+import unicodedata
+from functools import lru_cache
+
+from .core import MONTHS
+
+DEFAULT_LOCALES = ('en',)
+
+LOCALE_MONTH_NAMES = {
+    'en': [
+        (MONTHS[0], 'Jan'), (MONTHS[1], 'Feb'), (MONTHS[2], 'Mar'), (MONTHS[3], 'Apr'), (MONTHS[4],),
+        (MONTHS[5], 'Jun'), (MONTHS[6], 'Jul'), (MONTHS[7], 'Aug'), (MONTHS[8], 'Sep', 'Sept'), (MONTHS[9], 'Oct'),
+        (MONTHS[10], 'Nov'), (MONTHS[11], 'Dec'),
+    ],
+    'es': [
+        ('Enero', 'Ene'), ('Febrero', 'Feb'), ('Marzo', 'Mar'), ('Abril', 'Abr'), ('Mayo', 'May'), ('Junio', 'Jun'),
+        ('Julio', 'Jul'), ('Agosto', 'Ago'), ('Septiembre', 'Setiembre', 'Sep', 'Sept', 'Set'), ('Octubre', 'Oct'),
+        ('Noviembre', 'Nov'), ('Diciembre', 'Dic'),
+    ],
+    'fr': [
+        ('Janvier', 'Janv'), ('Février', 'Févr', 'Fév'), ('Mars',), ('Avril', 'Avr'), ('Mai',), ('Juin',),
+        ('Juillet', 'Juil'), ('Août',), ('Septembre', 'Sept'), ('Octobre', 'Oct'), ('Novembre', 'Nov'),
+        ('Décembre', 'Déc'),
+    ],
+    'de': [
+        ('Januar', 'Jänner', 'Jan'), ('Februar', 'Feb'), ('März', 'Mär', 'Mrz'), ('April', 'Apr'), ('Mai',),
+        ('Juni', 'Jun'), ('Juli', 'Jul'), ('August', 'Aug'), ('September', 'Sep', 'Sept'), ('Oktober', 'Okt'),
+        ('November', 'Nov'), ('Dezember', 'Dez'),
+    ],
+}
+
+
+def normalize_month_name(name):
+    """
+    Normalize a month name for the lookup.
+
+    Surrounding whitespace and a trailing period are removed, the name is case-folded, and accents are removed.
+
+    Args:
+        name: The month name.
+        :param name: str
+
+    Returns: The normalized month name.
+    """
+    name = unicodedata.normalize('NFKD', name.strip().rstrip('.').casefold())
+    return ''.join(character for character in name if not unicodedata.combining(character))
+
+
+def build_month_lookup(locales=DEFAULT_LOCALES):
+    """
+    Build the lookup dictionary of month names for the given locales.
+
+    Args:
+        locales: The locales whose month names are accepted, e.g., ('en', 'fr').
+        :param locales: tuple[str]
+
+    Returns: A dictionary that maps each accepted month name (normalized, as written, lowercase, and uppercase) to its
+    month number.
+    """
+    lookup = {}
+    for locale in locales:
+        if locale not in LOCALE_MONTH_NAMES:
+            raise ValueError(f'Unknown locale: {locale}')
+        for month_number, names in enumerate(LOCALE_MONTH_NAMES[locale], start=1):
+            for name in names:
+                for key in (normalize_month_name(name), name, name.lower(), name.upper()):
+                    if lookup.setdefault(key, month_number) != month_number:
+                        raise ValueError(f'The month name {name!r} is ambiguous in the locales {locales}.')
+    return lookup
+
+
+@lru_cache(maxsize=None)
+def get_month_lookup(locales=DEFAULT_LOCALES):
+    """
+    Get the lookup dictionary of month names for the given locales. Each combination of locales is built only once.
+
+    Args:
+        locales: The locales whose month names are accepted.
+        :param locales: tuple[str]
+
+    Returns: The lookup dictionary from build_month_lookup().
+    """
+    return build_month_lookup(tuple(locales))
+
+
+def register_locale(locale, names):
+    """
+    Add or replace the month name table of a locale.
+
+    Args:
+        locale: The locale code, e.g., 'it'.
+        :param locale: str
+
+        names: The accepted names of each month, in month order. The first name of each month is its full name.
+        :param names: list[tuple[str]]
+
+    Returns: None
+    """
+    names = [(month_names,) if isinstance(month_names, str) else tuple(month_names) for month_names in names]
+    if len(names) != len(MONTHS):
+        raise ValueError(f'A locale needs names for {len(MONTHS)} months, got {len(names)}.')
+    LOCALE_MONTH_NAMES[locale] = names
+    get_month_lookup.cache_clear()
+
+
+def parse_month_name(name, locales=DEFAULT_LOCALES):
+    """
+    Get the month number of a month name or abbreviation.
+
+    Args:
+        name: The month name, e.g., 'September', 'sep', or 'Sept.'.
+        :param name: str
+
+        locales: The locales whose month names are accepted.
+        :param locales: tuple[str]
+
+    Returns: The month number (1-12), or None if the name is not a month name.
+    """
+    lookup = get_month_lookup(tuple(locales))
+    month_number = lookup.get(name)
+    if month_number is None:
+        month_number = lookup.get(normalize_month_name(name))
+    return month_number
+
+
+def parse_month_names(names, locales=DEFAULT_LOCALES):
+    """
+    Get the month numbers of a column of month names, e.g., from imported data.
+
+    The names are first looked up as they are written, all at once. Only the names that are not found are normalized,
+    and each distinct name is normalized only once.
+
+    Args:
+        names: The month names.
+        :param names: list[str]
+
+        locales: The locales whose month names are accepted.
+        :param locales: tuple[str]
+
+    Returns: A tuple with the list of month numbers (None for invalid names) and the list of the positions of the
+    invalid names.
+    """
+    lookup = get_month_lookup(tuple(locales))
+    month_numbers = list(map(lookup.get, names))
+    invalid = []
+    normalized = {}
+
+    for index, month_number in enumerate(month_numbers):
+        if month_number is not None:
+            continue
+        name = names[index]
+        if name not in normalized:
+            normalized[name] = lookup.get(normalize_month_name(name)) if isinstance(name, str) else None
+        month_numbers[index] = normalized[name]
+        if month_numbers[index] is None:
+            invalid.append(index)
+    return month_numbers, invalid
@@ -0,0 +1,205 @@
+"""
+Paycheck Calculator - Python Batch Engine
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a vectorized version of the Paycheck Calculator pay pipeline. Instead of pricing one
+(hours worked, hourly rate) pair at a time, the functions in this module accept NumPy arrays (or anything NumPy can
+turn into an array, such as lists) and compute the gross pay, taxes, and net pay for every row in a single pass. The
+overtime split at MAX_STANDARD_HOURS is handled with array masks instead of an if/else per row, and every operation is
+performed in the same order as the scalar functions in the core module, so the results match them exactly.
+
+The constants are read from the core module (core.py) at call time, so the batch engine always agrees with
+calculate_gross_pay(), calculate_taxes(), and calculate_net_pay().
+
+The following functions are defined in this module:
+    - as_float_array(values): Converts the input values to a float64 NumPy array.
+    - calculate_gross_pay_batch(hours_worked, hourly_rate): Calculates the gross pay for arrays of hours and rates.
+    - calculate_taxes_batch(gross_pay): Calculates the taxes for an array of gross pay amounts.
+    - calculate_net_pay_batch(gross_pay, taxes): Calculates the net pay for arrays of gross pay and taxes.
+    - calculate_pay_batch(hours_worked, hourly_rate): Calculates the gross pay, taxes, and net pay in one call.
+    - as_int_array(values): Converts the input values to an int64 NumPy array.
+    - calculate_pay_batch_cents(hours_hundredths, rate_cents): Calculates the pay details in integer cents.
+    - calculate_progressive_taxes_batch(gross_pay, schedule): Calculates the taxes with a progressive tax schedule.
+
+Example:
+    >>> from paycheck_calculator.python.batch import calculate_pay_batch
+    >>> gross, taxes, net = calculate_pay_batch([40, 45.5], [20.0, 18.25])
+"""
+
+import numpy as np
+
+from . import core
+from .fixed_point import (
+    BASIS_POINTS,
+    HUNDREDTHS_PER_HOUR,
+    max_standard_hundredths,
+    overtime_rate_hundredths,
+    round_half_up_divide,
+    tax_rate_basis_points,
+)
+
+
+def as_float_array(values):
+    """
+    Convert the input values to a float64 NumPy array.
+
+    Arrays that already have the float64 data type are returned as they are, without making a copy.
+
+    Args:
+        values: The values to convert (e.g., a list, tuple, or NumPy array).
+        :param values: array-like
+
+    Returns: The values as a float64 NumPy array.
+    """
+    return np.asarray(values, dtype=np.float64)
+
+
+def calculate_gross_pay_batch(hours_worked, hourly_rate):
+    """
+    Calculate the gross pay for arrays of hours worked and hourly rates.
+
+    Rows at or below MAX_STANDARD_HOURS are paid at the hourly rate, and rows above it are paid the standard pay plus
+    the overtime hours at OVERTIME_RATE times the hourly rate. Both branches are computed for every row and the
+    correct one is picked with a mask, so there is no per-row branching. The hours and rates are broadcast against
+    each other, which means a single rate can be applied to an array of hours (and vice versa).
+
+    Args:
+        hours_worked: The number of hours worked for each row.
+        :param hours_worked: array-like
+
+        hourly_rate: The hourly rate for each row.
+        :param hourly_rate: array-like
+
+    Returns: A float64 array with the gross pay for each row.
+    """
+    hours_worked = as_float_array(hours_worked)
+    hourly_rate = as_float_array(hourly_rate)
+
+    standard_pay = hours_worked * hourly_rate
+    overtime_pay = (core.MAX_STANDARD_HOURS * hourly_rate
+                    + (hours_worked - core.MAX_STANDARD_HOURS) * hourly_rate * core.OVERTIME_RATE)
+    return np.where(hours_worked <= core.MAX_STANDARD_HOURS, standard_pay, overtime_pay)
+
+
+def calculate_taxes_batch(gross_pay):
+    """
+    Calculate the taxes for an array of gross pay amounts.
+
+    Args:
+        gross_pay: The gross pay amount for each row.
+        :param gross_pay: array-like
+
+    Returns: A float64 array with the tax amount for each row.
+    """
+    return as_float_array(gross_pay) * core.TAX_RATE_PERCENTAGE
+
+
+def calculate_net_pay_batch(gross_pay, taxes):
+    """
+    Calculate the net pay for arrays of gross pay amounts and taxes.
+
+    Args:
+        gross_pay: The gross pay amount for each row.
+        :param gross_pay: array-like
+
+        taxes: The tax amount for each row.
+        :param taxes: array-like
+
+    Returns: A float64 array with the net pay for each row.
+    """
+    return as_float_array(gross_pay) - as_float_array(taxes)
+
+
+def calculate_pay_batch(hours_worked, hourly_rate):
+    """
+    Calculate the gross pay, taxes, and net pay for arrays of hours worked and hourly rates.
+
+    This is the batch equivalent of calling calculate_gross_pay(), calculate_taxes(), and calculate_net_pay() for every
+    row, and the values match those of the scalar functions exactly.
+
+    Args:
+        hours_worked: The number of hours worked for each row.
+        :param hours_worked: array-like
+
+        hourly_rate: The hourly rate for each row.
+        :param hourly_rate: array-like
+
+    Returns: A tuple of three float64 arrays (gross pay, taxes, net pay).
+    """
+    gross_pay = calculate_gross_pay_batch(hours_worked, hourly_rate)
+    taxes = calculate_taxes_batch(gross_pay)
+    net_pay = calculate_net_pay_batch(gross_pay, taxes)
+    return gross_pay, taxes, net_pay
+
+
+def as_int_array(values):
+    """
+    Convert the input values to an int64 NumPy array.
+
+    Arrays that already have the int64 data type are returned as they are, without making a copy.
+
+    Args:
+        values: The values to convert (e.g., a list, tuple, or NumPy array).
+        :param values: array-like
+
+    Returns: The values as an int64 NumPy array.
+    """
+    return np.asarray(values, dtype=np.int64)
+
+
+def calculate_pay_batch_cents(hours_hundredths, rate_cents):
+    """
+    Calculate the gross pay, taxes, and net pay in integer cents for arrays of hours worked and hourly rates.
+
+    This is the batch equivalent of the fixed-point functions in fixed_point.py, and the values match those of
+    calculate_gross_pay_cents(), calculate_taxes_cents(), and calculate_net_pay_cents() exactly. Only integer
+    operations are used, so no Decimal reconciliation is needed afterwards.
+
+    Args:
+        hours_hundredths: The number of hours worked for each row, in hundredths of an hour.
+        :param hours_hundredths: array-like
+
+        rate_cents: The hourly rate for each row, in cents.
+        :param rate_cents: array-like
+
+    Returns: A tuple of three int64 arrays (gross pay, taxes, net pay) in cents.
+    """
+    hours_hundredths = as_int_array(hours_hundredths)
+    rate_cents = as_int_array(rate_cents)
+
+    max_standard = max_standard_hundredths()
+    standard_hours = np.minimum(hours_hundredths, max_standard)
+    overtime_hours = np.maximum(hours_hundredths - max_standard, 0)
+    numerator = (standard_hours * 100 + overtime_hours * overtime_rate_hundredths()) * rate_cents
+
+    gross_cents = round_half_up_divide(numerator, HUNDREDTHS_PER_HOUR * 100)
+    taxes_cents = round_half_up_divide(gross_cents * tax_rate_basis_points(), BASIS_POINTS)
+    net_cents = gross_cents - taxes_cents
+    return gross_cents, taxes_cents, net_cents
+
+
+def calculate_progressive_taxes_batch(gross_pay, schedule):
+    """
+    Calculate the taxes for an array of gross pay amounts with a progressive tax schedule.
+
+    This is the batch equivalent of calculate_progressive_taxes() in tax_schedule.py. The bracket of every row is found
+    with one vectorized binary search, and the tax is the cumulative tax at the start of the bracket plus the pay
+    inside the bracket times its marginal rate.
+
+    Args:
+        gross_pay: The gross pay amount for each row.
+        :param gross_pay: array-like
+
+        schedule: The tax schedule (see tax_schedule.py).
+        :param schedule: TaxSchedule
+
+    Returns: A float64 array with the tax amount for each row.
+    """
+    gross_pay = as_float_array(gross_pay)
+    starts = as_float_array(schedule.starts)
+    rates = as_float_array(schedule.rates)
+    cumulative = as_float_array(schedule.cumulative)
+
+    index = np.maximum(np.searchsorted(starts, gross_pay, side='right') - 1, 0)
+    return cumulative[index] + (gross_pay - starts[index]) * rates[index]
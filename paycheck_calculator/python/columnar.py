@@ -0,0 +1,227 @@
+"""
+Paycheck Calculator - Python Columnar Result Store
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a columnar container for the results of a payroll run. Instead of keeping one dictionary or
+object per paycheck, the PayrollColumns class keeps the hours worked, hourly rate, gross pay, taxes, and net pay of
+every paycheck in five contiguous float64 NumPy arrays (one per column), which is about 40 bytes per paycheck.
+
+The columns can be saved to a binary column file. The file starts with a fixed 64-byte header (the magic bytes
+b'PAYCOLS1', the number of rows, and the number of columns, as little-endian integers), followed by each column in
+COLUMNS order as raw little-endian float64 values. Because the layout is fixed, PayrollColumns.open() maps the file
+into memory with numpy.memmap instead of reading and parsing it, so even a file with tens of millions of rows opens
+instantly, and slicing it only touches the pages that are actually read.
+
+Indexing the columns with a row number returns a PaycheckView, a row view with the same fields as a Paycheck record
+(see records.py) that reads its values from the columns on access, so iterating over millions of rows never copies
+them into per-row objects.
+
+Example:
+    >>> from paycheck_calculator.python.columnar import PayrollColumns
+    >>> columns = PayrollColumns.from_inputs([40, 45.5], [20.0, 18.25])
+    >>> columns.save('run.paycols')
+    >>> PayrollColumns.open('run.paycols').net_pay[:10]
+    >>> columns[1].gross_pay
+"""
+
+import struct
+
+import numpy as np
+
+from .batch import as_float_array, calculate_pay_batch
+from .records import Paycheck
+
+COLUMNS = ('hours_worked', 'hourly_rate', 'gross_pay', 'taxes', 'net_pay')
+MAGIC = b'PAYCOLS1'  # Identifies a column file and its format version
+HEADER = struct.Struct('<8sQI')  # Magic bytes, number of rows, number of columns
+HEADER_SIZE = 64  # The header is padded to 64 bytes, so the columns start on an aligned offset
+DTYPE = np.dtype('<f8')  # Little-endian float64
+
+
+class PaycheckView:
+    """
+    A view of one row of PayrollColumns, with the same fields as a Paycheck record.
+
+    The view only holds the columns and the row number, and reads each field from its column when it is accessed, so
+    creating a view copies no data. Views of memory-mapped columns also see changes made to the file.
+
+    Args:
+        columns: The columns.
+        :param columns: PayrollColumns
+
+        index: The row number.
+        :param index: int
+    """
+
+    __slots__ = ('columns', 'index')
+
+    def __init__(self, columns, index):
+        self.columns = columns
+        self.index = index
+
+    @property
+    def hours_worked(self):
+        return float(self.columns.hours_worked[self.index])
+
+    @property
+    def hourly_rate(self):
+        return float(self.columns.hourly_rate[self.index])
+
+    @property
+    def gross_pay(self):
+        return float(self.columns.gross_pay[self.index])
+
+    @property
+    def taxes(self):
+        return float(self.columns.taxes[self.index])
+
+    @property
+    def net_pay(self):
+        return float(self.columns.net_pay[self.index])
+
+    def to_paycheck(self):
+        """
+        Copy the row into a Paycheck record.
+
+        Returns: The Paycheck record.
+        """
+        return Paycheck(*(float(self.columns.column(name)[self.index]) for name in COLUMNS))
+
+    def __repr__(self):
+        return f'PaycheckView(index={self.index}, {self.to_paycheck()!r})'
+
+
+class PayrollColumns:
+    """
+    The results of a payroll run, stored as one contiguous float64 array per column.
+
+    Args:
+        hours_worked: The number of hours worked of each paycheck.
+        :param hours_worked: array-like
+
+        hourly_rate: The hourly rate of each paycheck.
+        :param hourly_rate: array-like
+
+        gross_pay: The gross pay of each paycheck.
+        :param gross_pay: array-like
+
+        taxes: The taxes of each paycheck.
+        :param taxes: array-like
+
+        net_pay: The net pay of each paycheck.
+        :param net_pay: array-like
+    """
+
+    def __init__(self, hours_worked, hourly_rate, gross_pay, taxes, net_pay):
+        self.hours_worked = as_float_array(hours_worked)
+        self.hourly_rate = as_float_array(hourly_rate)
+        self.gross_pay = as_float_array(gross_pay)
+        self.taxes = as_float_array(taxes)
+        self.net_pay = as_float_array(net_pay)
+
+        if len({len(self.column(name)) for name in COLUMNS}) != 1:
+            raise ValueError('All columns must have the same length.')
+
+    @classmethod
+    def from_inputs(cls, hours_worked, hourly_rate):
+        """
+        Calculate the pay details of every paycheck with the batch engine and store them in columns.
+
+        Args:
+            hours_worked: The number of hours worked of each paycheck.
+            :param hours_worked: array-like
+
+            hourly_rate: The hourly rate of each paycheck.
+            :param hourly_rate: array-like
+
+        Returns: The columns of the payroll run.
+        """
+        hours_worked, hourly_rate = np.broadcast_arrays(as_float_array(hours_worked), as_float_array(hourly_rate))
+        gross_pay, taxes, net_pay = calculate_pay_batch(hours_worked, hourly_rate)
+        return cls(hours_worked, hourly_rate, gross_pay, taxes, net_pay)
+
+    def __len__(self):
+        return len(self.hours_worked)
+
+    def __getitem__(self, index):
+        """
+        Get a view of one row, or a slice of the rows as new columns that share memory with these columns. In both
+        cases, no data is copied.
+
+        Args:
+            index: The row number (negative numbers count from the end), or the slice of rows.
+            :param index: int | slice
+
+        Returns: A PaycheckView for a row number, or the sliced columns for a slice.
+        """
+        if isinstance(index, slice):
+            return PayrollColumns(*(self.column(name)[index] for name in COLUMNS))
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError('PayrollColumns can only be indexed with an integer or a slice.')
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('PayrollColumns index out of range.')
+        return PaycheckView(self, int(index))
+
+    def __iter__(self):
+        return (PaycheckView(self, index) for index in range(len(self)))
+
+    def column(self, name):
+        """
+        Get a column by name.
+
+        Args:
+            name: The column name, one of COLUMNS.
+            :param name: str
+
+        Returns: The column array.
+        """
+        if name not in COLUMNS:
+            raise KeyError(f'Unknown column: {name}')
+        return getattr(self, name)
+
+    def save(self, path):
+        """
+        Save the columns to a binary column file.
+
+        Args:
+            path: The path of the file.
+            :param path: str
+
+        Returns: None
+        """
+        header = HEADER.pack(MAGIC, len(self), len(COLUMNS)).ljust(HEADER_SIZE, b'\0')
+        with open(path, 'wb') as file:
+            file.write(header)
+            for name in COLUMNS:
+                np.ascontiguousarray(self.column(name), dtype=DTYPE).tofile(file)
+
+    @classmethod
+    def open(cls, path, mode='r'):
+        """
+        Open a binary column file by mapping it into memory, without reading or parsing the columns.
+
+        Args:
+            path: The path of the file.
+            :param path: str
+
+            mode: The numpy.memmap mode ('r' for read-only, 'r+' to modify the file in place, 'c' for copy-on-write).
+            :param mode: str
+
+        Returns: The columns, backed by the memory-mapped file.
+        """
+        with open(path, 'rb') as file:
+            magic, rows, column_count = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f'Not a payroll column file: {path}')
+        if column_count != len(COLUMNS):
+            raise ValueError(f'Expected {len(COLUMNS)} columns, found {column_count}: {path}')
+        if rows == 0:
+            return cls(*np.zeros((len(COLUMNS), 0), dtype=DTYPE))
+
+        data = np.memmap(path, dtype=DTYPE, mode=mode, offset=HEADER_SIZE, shape=(len(COLUMNS), rows))
+        return cls(*data)
@@ -7,32 +7,55 @@ This module contains the main functionality of the Paycheck Calculator console a
 The application calculates the gross pay, taxes, and net pay based on the number of hours worked and the hourly rate. 
 The user is prompted to enter the number of hours worked and the hourly rate, and the application displays the
 calculated pay details. The tax rate is set to 18%, and overtime pay is calculated at 1.5 times the hourly rate for
-hours worked over 40 hours. There are four constant variables defined at the beginning of the module: TAX_RATE, 
-TAX_RATE_PERCENTAGE, MAX_STANDARD_HOURS, and OVERTIME_RATE. The main functionality includes functions to validate user
-input, calculate pay details, and display the results. The application provides a simple command-line interface for
-interacting with the user. 
+hours worked over 40 hours. The four constant variables (TAX_RATE, TAX_RATE_PERCENTAGE, MAX_STANDARD_HOURS, and
+OVERTIME_RATE), the input validation functions, and the pay calculation functions are defined in the headless core
+module (core.py) and imported from there. This module adds the functions to prompt the user and display the results.
+The application provides a simple command-line interface for interacting with the user. 
 
 The following functions are defined in this module:
     - prompt_user(prompt): Prompts the user for input and returns the user's input.
-    - is_valid_input(value): Checks if the input value is not an empty string. 
-    - is_valid_float(value): Checks if the input value can be converted to a float. 
-    - is_valid_float_greater_than_zero(value): Checks if the input value is a valid float greater than zero. 
     - get_valid_input(prompt, validation_function, error_message): Prompts the user for input and validates the input.
-    - calculate_gross_pay(hours_worked, hourly_rate): Calculates the gross pay based on the hours worked and rate.
-    - calculate_taxes(gross_pay): Calculates the taxes based on the gross pay and the tax rate. 
-    - calculate_net_pay(gross_pay, taxes): Calculates the net pay based on the gross pay and taxes. 
-    - display_pay_details(gross_pay, tax_amount, net_pay): Displays the pay details to the user. 
+    - display_pay_details(gross_pay, tax_amount, net_pay): Displays the pay details (or a Paycheck record) to the user.
+    - validate_quote_input(hours_worked, hourly_rate): Returns an error message for invalid quote input, or None.
+    - calculate_quote_record(hours_worked, hourly_rate): Calculates the pay details as a machine-readable record.
+    - read_quote_records(lines): Reads (line number, hours worked, hourly rate) records from comma-separated lines.
+    - write_quote_records(records, output, output_format): Writes the quote records as JSON Lines or CSV.
+    - parse_arguments(argv): Parses the command line arguments of the non-interactive mode.
+    - run_cli(argv): Runs the non-interactive command line and returns the exit status.
     
 The main code block of the module interacts with the user to get the hours worked and hourly rate, calculates the pay
 details, and displays the results to the user. The user is prompted to enter the hours worked and hourly rate, and the
 application calculates the gross pay, taxes, and net pay based on the input values. The results are then displayed to
 the user. 
+
+When command line arguments are given, the application runs non-interactively instead. The --hours and --rate flags
+calculate a single quote, and the --batch flag reads one 'hours,rate' record per line from standard input. The
+results are written as JSON Lines (the default) or CSV, and invalid input (including infinite values and quotes too
+large to calculate, which have no standard JSON form) is reported on standard error with an exit status of 1, so one
+process can handle thousands of quotes:
+    python -m paycheck_calculator.python.console.main --hours 45 --rate 20
+    python -m paycheck_calculator.python.console.main --batch --format csv < quotes.csv
 """
 
-TAX_RATE = 18.0  # Tax rate
-TAX_RATE_PERCENTAGE = TAX_RATE / 100  # Tax rate percentage
-MAX_STANDARD_HOURS = 40  # Maximum standard hours for regular pay
-OVERTIME_RATE = 1.5  # Overtime rate multiplier
+import argparse
+import csv
+import json
+import math
+import sys
+
+from ..core import (
+    TAX_RATE,
+    TAX_RATE_PERCENTAGE,
+    MAX_STANDARD_HOURS,
+    OVERTIME_RATE,
+    is_valid_input,
+    is_valid_float,
+    is_valid_float_greater_than_zero,
+    calculate_gross_pay,
+    calculate_taxes,
+    calculate_net_pay,
+)
+from ..records import calculate_paycheck
 
 
 def prompt_user(prompt):
@@ -48,50 +71,6 @@ def prompt_user(prompt):
     return input(prompt)
 
 
-def is_valid_input(value):
-    """
-    Check if the input value is valid, meaning it's not an empty string. 
-
-    Arguments:
-        value: The input value to check. 
-        :param value: str 
-    """
-    return value != ''
-
-
-def is_valid_float(value):
-    """
-    Check if the input value can be converted to a float. 
-
-    This function attempts to convert the input value to a float and returns True if successful,
-    indicating that the input is a valid float. If the conversion raises a ValueError, it returns False.
-
-    Args:
-        value: The input value to check. 
-        :param value: str
-
-    Returns: True if the input value can be converted to a float, False otherwise.
-    """
-    try:
-        float(value)
-        return True
-    except ValueError:
-        return False
-
-
-def is_valid_float_greater_than_zero(value):
-    """
-    Check if the input value is a valid float greater than zero.
-
-    Args:
-        value: The input value to check. 
-        :param value: str
-
-    Returns: True if the input value is a valid float greater than zero, False otherwise. 
-    """
-    return is_valid_float(value) and float(value) > 0
-
-
 def get_valid_input(prompt, validation_function, error_message):
     """
     Prompt the user for input and validate the input using the specified validation function. 
@@ -118,9 +97,69 @@ def get_valid_input(prompt, validation_function, error_message):
     return float(value)
 
 
-def calculate_gross_pay(hours_worked, hourly_rate):
+def display_pay_details(gross_pay, tax_amount=None, net_pay=None):
+    """
+    Display the pay details to the user. 
+
+    This function displays the gross pay, tax amount, and net pay to the user in a formatted manner. The pay details
+    can also be passed as a single Paycheck record (or a PaycheckView of a columnar batch).
+
+    Args:
+        gross_pay: The gross pay amount, or a record with gross_pay, taxes, and net_pay fields. 
+        :param gross_pay: float | Paycheck
+
+        tax_amount: The tax amount. Omitted when a record is passed. 
+        :param tax_amount: float
+
+        net_pay: The net pay amount. Omitted when a record is passed. 
+        :param net_pay: float
+    """
+    if tax_amount is None:
+        gross_pay, tax_amount, net_pay = gross_pay.gross_pay, gross_pay.taxes, gross_pay.net_pay
+
+    print(f'\n{"-" * 40}')
+    print(f'{"Gross Pay:":<15} ${gross_pay:,.2f}')
+    print(f'{"Taxes:":<15} ${tax_amount:,.2f}')
+    print(f'{"Net Pay:":<15} ${net_pay:,.2f}')
+    print(f'{"-" * 40}\n')
+    print('Thank you for using the Paycheck Calculator!')
+
+
+QUOTE_FIELDS = ['hours_worked', 'hourly_rate', 'gross_pay', 'taxes', 'net_pay']
+
+
+def validate_quote_input(hours_worked, hourly_rate):
     """
-    Calculate the gross pay based on the hours worked and the hourly rate. 
+    Validate the hours worked and hourly rate of a quote with the same rules as the interactive prompts.
+
+    The values must also be finite, and so must the gross pay they result in, so the quote can be written as standard
+    JSON.
+
+    Args:
+        hours_worked: The number of hours worked. 
+        :param hours_worked: str
+
+        hourly_rate: The hourly rate. 
+        :param hourly_rate: str
+
+    Returns: An error message if the input is invalid, None otherwise.
+    """
+    if not (is_valid_input(hours_worked) and is_valid_float_greater_than_zero(hours_worked)
+            and math.isfinite(float(hours_worked))):
+        return f'Invalid hours worked: {hours_worked!r}'
+    if not (is_valid_input(hourly_rate) and is_valid_float_greater_than_zero(hourly_rate)
+            and math.isfinite(float(hourly_rate))):
+        return f'Invalid hourly rate: {hourly_rate!r}'
+    if not math.isfinite(calculate_gross_pay(float(hours_worked), float(hourly_rate))):
+        return f'The quote is out of range: {hours_worked!r} hours at {hourly_rate!r}'
+    return None
+
+
+def calculate_quote_record(hours_worked, hourly_rate):
+    """
+    Calculate the pay details as a machine-readable record. 
+
+    The pay amounts are rounded to two decimal places, the same precision shown by display_pay_details().
 
     Args:
         hours_worked: The number of hours worked. 
@@ -129,75 +168,146 @@ def calculate_gross_pay(hours_worked, hourly_rate):
         hourly_rate: The hourly rate. 
         :param hourly_rate: float
 
-    Returns: The calculated gross pay (e.g., standard pay + overtime pay, if applicable). Overtime pay is calculated at
-    1.5 times the hourly rate for hours worked over 40 hours.
+    Returns: A dictionary with the keys in QUOTE_FIELDS.
     """
-    if hours_worked <= MAX_STANDARD_HOURS:
-        return hours_worked * hourly_rate
-    else:
-        standard_pay = MAX_STANDARD_HOURS * hourly_rate
-        overtime_hours = hours_worked - MAX_STANDARD_HOURS
-        overtime_pay = overtime_hours * hourly_rate * OVERTIME_RATE
-        return standard_pay + overtime_pay
+    gross_pay = calculate_gross_pay(hours_worked, hourly_rate)
+    tax_amount = calculate_taxes(gross_pay)
+    net_pay = calculate_net_pay(gross_pay, tax_amount)
+    return {
+        'hours_worked': hours_worked,
+        'hourly_rate': hourly_rate,
+        'gross_pay': round(gross_pay, 2),
+        'taxes': round(tax_amount, 2),
+        'net_pay': round(net_pay, 2),
+    }
 
 
-def calculate_taxes(gross_pay):
+def read_quote_records(lines):
     """
-    Calculate the taxes based on the gross pay and the tax rate. 
+    Read quote records from comma-separated lines. 
+
+    Each line holds the hours worked and the hourly rate, separated by a comma (e.g., '45,20.50'). Blank lines are
+    skipped. The values are returned as strings, so they can be validated with validate_quote_input().
 
     Args:
-        gross_pay: The gross pay amount. 
-        :param gross_pay: float
+        lines: An iterable of lines (e.g., sys.stdin). 
+        :param lines: iterable[str]
 
-    Returns: The calculated tax amount based on the gross pay and the tax rate.
+    Returns: A generator of (line number, hours worked, hourly rate) tuples. 
     """
-    return gross_pay * TAX_RATE_PERCENTAGE
+    for line_number, fields in enumerate(csv.reader(lines), start=1):
+        if not fields or not ''.join(fields).strip():
+            continue
+        fields = [field.strip() for field in fields] + ['', '']
+        yield line_number, fields[0], fields[1]
 
 
-def calculate_net_pay(gross_pay, taxes):
+def write_quote_records(records, output, output_format='json'):
     """
-    Calculate the net pay based on the gross pay and the taxes. 
+    Write quote records as JSON Lines or CSV. 
 
     Args:
-        gross_pay: The gross pay amount. 
-        :param gross_pay: float 
+        records: An iterable of quote records from calculate_quote_record(). 
+        :param records: iterable[dict]
+
+        output: The text stream to write to. 
+        :param output: io.TextIOBase
 
-        taxes: The tax amount. 
-        :param taxes: float
+        output_format: The output format ('json' or 'csv'). 
+        :param output_format: str
 
-    Returns: The calculated net pay after deducting the taxes from the gross pay.
+    Returns: None
     """
-    return gross_pay - taxes
+    if output_format == 'csv':
+        writer = csv.DictWriter(output, fieldnames=QUOTE_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(records)
+    else:
+        for record in records:
+            output.write(json.dumps(record, allow_nan=False) + '\n')
 
 
-def display_pay_details(gross_pay, tax_amount, net_pay):
+def parse_arguments(argv):
     """
-    Display the pay details to the user. 
+    Parse the command line arguments of the non-interactive mode. 
+
+    Args:
+        argv: The command line arguments, without the program name. 
+        :param argv: list[str]
 
-    This function displays the gross pay, tax amount, and net pay to the user in a formatted manner.
+    Returns: The parsed arguments. 
+    """
+    parser = argparse.ArgumentParser(description='Calculate the gross pay, taxes, and net pay non-interactively.')
+    parser.add_argument('--hours', help='The number of hours worked, for a single quote.')
+    parser.add_argument('--rate', help='The hourly rate, for a single quote.')
+    parser.add_argument('--batch', action='store_true',
+                        help="Read one 'hours,rate' record per line from standard input.")
+    parser.add_argument('--format', choices=['json', 'csv'], default='json', help='The output format.')
+    args = parser.parse_args(argv)
+
+    if args.batch and (args.hours is not None or args.rate is not None):
+        parser.error('--batch cannot be combined with --hours or --rate')
+    if not args.batch and (args.hours is None or args.rate is None):
+        parser.error('--hours and --rate are required unless --batch is given')
+    return args
+
+
+def run_cli(argv, stdin=None, stdout=None, stderr=None):
+    """
+    Run the non-interactive command line. 
+
+    Valid quotes are written to stdout and validation errors to stderr. In batch mode, invalid records are reported
+    with their line number and skipped, and the remaining records are still processed. 
 
     Args:
-        gross_pay: The gross pay amount. 
-        :param gross_pay: float
+        argv: The command line arguments, without the program name. 
+        :param argv: list[str]
 
-        tax_amount: The tax amount. 
-        :param tax_amount: float
+        stdin: The stream to read batch records from. Defaults to sys.stdin. 
+        :param stdin: io.TextIOBase
 
-        net_pay: The net pay amount. 
-        :param net_pay: float
+        stdout: The stream to write the quotes to. Defaults to sys.stdout. 
+        :param stdout: io.TextIOBase
+
+        stderr: The stream to write the validation errors to. Defaults to sys.stderr. 
+        :param stderr: io.TextIOBase
+
+    Returns: The exit status (0 if every quote was valid, 1 otherwise). 
     """
-    print(f'\n{"-" * 40}')
-    print(f'{"Gross Pay:":<15} ${gross_pay:,.2f}')
-    print(f'{"Taxes:":<15} ${tax_amount:,.2f}')
-    print(f'{"Net Pay:":<15} ${net_pay:,.2f}')
-    print(f'{"-" * 40}\n')
-    print('Thank you for using the Paycheck Calculator!')
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    args = parse_arguments(argv)
+
+    if not args.batch:
+        records = [(None, args.hours.strip(), args.rate.strip())]
+    else:
+        records = read_quote_records(stdin)
+
+    failures = 0
+
+    def calculate_valid_records():
+        nonlocal failures
+        for line_number, hours_worked, hourly_rate in records:
+            error_message = validate_quote_input(hours_worked, hourly_rate)
+            if error_message:
+                failures += 1
+                prefix = f'Line {line_number}: ' if line_number is not None else ''
+                stderr.write(f'{prefix}{error_message}\n')
+                continue
+            yield calculate_quote_record(float(hours_worked), float(hourly_rate))
+
+    write_quote_records(calculate_valid_records(), stdout, args.format)
+    return 1 if failures else 0
 
 
 if __name__ == '__main__':
     """
     Main code block of the Paycheck Calculator console application.
     """
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+
     print('\nWelcome to the Paycheck Calculator!')
     print(f'{"-" * 40}\n')
 
@@ -213,8 +323,4 @@ if __name__ == '__main__':
         'Invalid input. Please enter a valid hourly rate: '
     )
 
-    gross_pay = calculate_gross_pay(hours_worked, hourly_rate)
-    tax_amount = calculate_taxes(gross_pay)
-    net_pay = calculate_net_pay(gross_pay, tax_amount)
-
-    display_pay_details(gross_pay, tax_amount, net_pay)
+    display_pay_details(calculate_paycheck(hours_worked, hourly_rate))
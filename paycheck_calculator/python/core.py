@@ -0,0 +1,126 @@
+"""
+Paycheck Calculator - Python Calculation Core
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains the headless core of the Paycheck Calculator: the constants, the input validation functions, and
+the pay calculation functions shared by the console application, the GUI application, and the batch, streaming, and
+parallel modes. It has no imports at all (in particular, no GUI imports), so it can be imported in worker processes
+and on headless hosts in a few milliseconds without pulling in Tkinter. The tax rate is set to 18%, and overtime pay is
+calculated at 1.5 times the hourly rate for hours worked over 40 hours.
+
+The following functions are defined in this module:
+    - is_valid_input(value): Checks if the input value is not an empty string.
+    - is_valid_float(value): Checks if the input value can be converted to a float.
+    - is_valid_float_greater_than_zero(value): Checks if the input value is a valid float greater than zero.
+    - calculate_gross_pay(hours_worked, hourly_rate): Calculates the gross pay based on the hours worked and rate.
+    - calculate_taxes(gross_pay): Calculates the taxes based on the gross pay and the tax rate.
+    - calculate_net_pay(gross_pay, taxes): Calculates the net pay based on the gross pay and taxes.
+"""
+
+TAX_RATE = 18.0  # Tax rate
+TAX_RATE_PERCENTAGE = TAX_RATE / 100  # Tax rate percentage
+MAX_STANDARD_HOURS = 40  # Maximum standard hours for regular pay
+OVERTIME_RATE = 1.5  # Overtime rate multiplier
+
+
+def is_valid_input(value):
+    """
+    Check if the input value is valid, meaning it's not an empty string.
+
+    Args:
+        value: The input value to check.
+        :param value: str
+
+    Returns: True if the input value is not an empty string, False otherwise.
+    """
+    return value != ''
+
+
+def is_valid_float(value):
+    """
+    Check if the input value can be converted to a float.
+
+    This function attempts to convert the input value to a float and returns True if successful,
+    indicating that the input is a valid float. If the conversion raises a ValueError, it returns False.
+
+    Args:
+        value: The input value to check.
+        :param value: str
+
+    Returns: True if the input value can be converted to a float, False otherwise.
+    """
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def is_valid_float_greater_than_zero(value):
+    """
+    Check if the input value is a valid float greater than zero.
+
+    Args:
+        value: The input value to check.
+        :param value: str
+
+    Returns: True if the input value is a valid float greater than zero, False otherwise.
+    """
+    return is_valid_float(value) and float(value) > 0
+
+
+def calculate_gross_pay(hours_worked, hourly_rate):
+    """
+    Calculate the gross pay based on the hours worked and the hourly rate.
+
+    If the hours worked are less than or equal to the maximum standard hours, the gross pay is the product of the
+    hours worked and the hourly rate. If the hours worked exceed the maximum standard hours, the gross pay is the
+    standard pay for the maximum standard hours plus the overtime pay for the additional hours at the overtime rate.
+
+    Args:
+        hours_worked: The number of hours worked.
+        :param hours_worked: float
+
+        hourly_rate: The hourly rate.
+        :param hourly_rate: float
+
+    Returns: The calculated gross pay (e.g., standard pay + overtime pay, if applicable). Overtime pay is calculated at
+    1.5 times the hourly rate for hours worked over 40 hours.
+    """
+    if hours_worked <= MAX_STANDARD_HOURS:
+        return hours_worked * hourly_rate
+    else:
+        standard_pay = MAX_STANDARD_HOURS * hourly_rate
+        overtime_hours = hours_worked - MAX_STANDARD_HOURS
+        overtime_pay = overtime_hours * hourly_rate * OVERTIME_RATE
+        return standard_pay + overtime_pay
+
+
+def calculate_taxes(gross_pay):
+    """
+    Calculate the taxes based on the gross pay and the tax rate.
+
+    Args:
+        gross_pay: The gross pay amount.
+        :param gross_pay: float
+
+    Returns: The calculated tax amount based on the gross pay and the tax rate.
+    """
+    return gross_pay * TAX_RATE_PERCENTAGE
+
+
+def calculate_net_pay(gross_pay, taxes):
+    """
+    Calculate the net pay based on the gross pay and the taxes.
+
+    Args:
+        gross_pay: The gross pay amount.
+        :param gross_pay: float
+
+        taxes: The tax amount.
+        :param taxes: float
+
+    Returns: The calculated net pay after deducting the taxes from the gross pay.
+    """
+    return gross_pay - taxes
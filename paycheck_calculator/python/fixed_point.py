@@ -0,0 +1,184 @@
+"""
+Paycheck Calculator - Python Fixed-Point Arithmetic
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a fixed-point (integer) mode for the Paycheck Calculator. The console application calculates the
+pay details with binary floats, which cannot represent most cent amounts exactly (e.g., 0.18 or 18.25). In this mode,
+hourly rates and pay amounts are stored as integer cents, hours worked are stored as integer hundredths of an hour,
+and the tax rate and overtime rate are stored as integer basis points and hundredths. Every calculation is done with
+integers and rounded exactly once, to the nearest cent with ties rounded up (e.g., 0.5 cents becomes 1 cent), so the
+results are exact and reproducible, and the gross pay is always exactly the taxes plus the net pay.
+
+The rates are derived from TAX_RATE, MAX_STANDARD_HOURS, and OVERTIME_RATE in the core module at call time.
+The vectorized equivalents for int64 NumPy arrays are defined in batch.py. With rates up to $100,000.00 per hour and
+up to 1,000 hours per paycheck, all intermediate values fit in a signed 64-bit integer.
+
+The following functions are defined in this module:
+    - to_cents(amount): Converts a dollar amount to integer cents.
+    - to_hundredths(hours): Converts a number of hours to integer hundredths of an hour.
+    - format_cents(cents): Formats integer cents as a dollar amount with two decimal places.
+    - round_half_up_divide(numerator, denominator): Divides two integers and rounds to the nearest integer.
+    - tax_rate_basis_points(): Returns the tax rate in basis points.
+    - overtime_rate_hundredths(): Returns the overtime rate multiplier in hundredths.
+    - max_standard_hundredths(): Returns the maximum standard hours in hundredths of an hour.
+    - calculate_gross_pay_cents(hours_hundredths, rate_cents): Calculates the gross pay in cents.
+    - calculate_taxes_cents(gross_cents): Calculates the taxes in cents.
+    - calculate_net_pay_cents(gross_cents, taxes_cents): Calculates the net pay in cents.
+
+Example:
+    >>> from paycheck_calculator.python.fixed_point import *
+    >>> gross = calculate_gross_pay_cents(to_hundredths('45.5'), to_cents('18.25'))
+    >>> format_cents(gross)
+    '880.56'
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from . import core
+
+CENTS_PER_DOLLAR = 100  # Cents in one dollar
+HUNDREDTHS_PER_HOUR = 100  # Hundredths of an hour in one hour
+BASIS_POINTS = 10000  # Basis points in 100%
+
+
+def to_cents(amount):
+    """
+    Convert a dollar amount to integer cents.
+
+    The amount is converted through its string representation, so '18.25' and 18.25 both become exactly 1825 cents.
+    Amounts with fractions of a cent are rounded to the nearest cent, with ties rounded up.
+
+    Args:
+        amount: The dollar amount (e.g., a str, float, int, or Decimal).
+        :param amount: str | float | int | Decimal
+
+    Returns: The amount in cents.
+    """
+    return int(Decimal(str(amount)).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_hundredths(hours):
+    """
+    Convert a number of hours to integer hundredths of an hour.
+
+    Args:
+        hours: The number of hours (e.g., a str, float, int, or Decimal).
+        :param hours: str | float | int | Decimal
+
+    Returns: The number of hours in hundredths of an hour.
+    """
+    return int(Decimal(str(hours)).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def format_cents(cents):
+    """
+    Format integer cents as a dollar amount with two decimal places.
+
+    The format matches the amounts shown by display_pay_details() (e.g., 123456 becomes '1,234.56').
+
+    Args:
+        cents: The amount in cents.
+        :param cents: int
+
+    Returns: The formatted amount, without the dollar sign.
+    """
+    sign = '-' if cents < 0 else ''
+    dollars, remainder = divmod(abs(int(cents)), CENTS_PER_DOLLAR)
+    return f'{sign}{dollars:,}.{remainder:02d}'
+
+
+def round_half_up_divide(numerator, denominator):
+    """
+    Divide two integers and round the result to the nearest integer, with ties rounded up.
+
+    The function only uses integer operations, so it works for Python integers and for int64 NumPy arrays alike.
+
+    Args:
+        numerator: The numerator.
+        :param numerator: int
+
+        denominator: The denominator, which must be greater than zero.
+        :param denominator: int
+
+    Returns: The rounded quotient.
+    """
+    return (numerator * 2 + denominator) // (denominator * 2)
+
+
+def tax_rate_basis_points():
+    """
+    Get the tax rate in basis points (e.g., 18% is 1800 basis points).
+
+    Returns: The tax rate in basis points.
+    """
+    return int(Decimal(str(core.TAX_RATE)).scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def overtime_rate_hundredths():
+    """
+    Get the overtime rate multiplier in hundredths (e.g., 1.5 is 150 hundredths).
+
+    Returns: The overtime rate multiplier in hundredths.
+    """
+    return int(Decimal(str(core.OVERTIME_RATE)).scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def max_standard_hundredths():
+    """
+    Get the maximum standard hours in hundredths of an hour.
+
+    Returns: The maximum standard hours in hundredths of an hour.
+    """
+    return to_hundredths(core.MAX_STANDARD_HOURS)
+
+
+def calculate_gross_pay_cents(hours_hundredths, rate_cents):
+    """
+    Calculate the gross pay in cents based on the hours worked and the hourly rate.
+
+    The standard pay and the overtime pay are added together before rounding, so the gross pay is rounded only once.
+
+    Args:
+        hours_hundredths: The number of hours worked in hundredths of an hour.
+        :param hours_hundredths: int
+
+        rate_cents: The hourly rate in cents.
+        :param rate_cents: int
+
+    Returns: The gross pay in cents.
+    """
+    max_standard = max_standard_hundredths()
+    standard_hours = min(hours_hundredths, max_standard)
+    overtime_hours = max(hours_hundredths - max_standard, 0)
+    numerator = (standard_hours * 100 + overtime_hours * overtime_rate_hundredths()) * rate_cents
+    return round_half_up_divide(numerator, HUNDREDTHS_PER_HOUR * 100)
+
+
+def calculate_taxes_cents(gross_cents):
+    """
+    Calculate the taxes in cents based on the gross pay and the tax rate.
+
+    Args:
+        gross_cents: The gross pay in cents.
+        :param gross_cents: int
+
+    Returns: The tax amount in cents.
+    """
+    return round_half_up_divide(gross_cents * tax_rate_basis_points(), BASIS_POINTS)
+
+
+def calculate_net_pay_cents(gross_cents, taxes_cents):
+    """
+    Calculate the net pay in cents based on the gross pay and the taxes.
+
+    Args:
+        gross_cents: The gross pay in cents.
+        :param gross_cents: int
+
+        taxes_cents: The tax amount in cents.
+        :param taxes_cents: int
+
+    Returns: The net pay in cents.
+    """
+    return gross_cents - taxes_cents
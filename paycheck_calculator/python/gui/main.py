@@ -10,181 +10,538 @@
     pay is calculated at 1.5 times the hourly rate for hours worked over 40 hours. The main functionality includes 
     functions to validate user input, calculate pay details, and display the results in the GUI. The application 
     provides a simple graphical user interface for interacting with the user. The module includes Python's Tkinter
-    library, and the Themed Tkinter (ttk) module is used for styling the GUI components. 
+    library, and the Themed Tkinter (ttk) module is used for styling the GUI components. Tkinter is only imported by
+    the functions that build and drive the GUI, so importing this module does not load Tk. The constants, the input
+    validation functions, and the pay calculation functions are defined in the headless core module (core.py) and
+    imported from there.
+
+    The pay details are also recalculated live as the user types. Changes to the inputs are debounced, so the pay
+    details are only recalculated once the user pauses typing, validation errors are shown inline below the inputs
+    instead of in pop-up dialogs, and unchanged inputs or results do not trigger any recalculation or redraw.
+
+    Timesheets (CSV or JSONL files) can be loaded with the 'Load Timesheet...' button. The import runs on a background
+    thread (see timesheet_import.py), and the GUI polls its progress messages with root.after(), so the window keeps
+    repainting and responding while large timesheets are processed, and the import can be cancelled at any time.
+    The imported rows are shown in a virtualized results grid: the Treeview only has one item per visible line, and
+    scrolling, sorting (by clicking a column heading), and filtering (by employee ID) only refill those items, so the
+    memory and redraw time of the grid do not grow with the number of loaded rows (see results_view.py). The totals of
+    an import are added up by the import thread, and if the grid is sorted, the loaded rows are sorted again on a
+    background thread when the import ends, so finishing an import does not block the event loop either.
 
     The following functions are defined in this module:
-        - is_valid_float(value): Checks if the input value can be converted to a float. 
-        - is_valid_float_greater_than_zero(value): Checks if the input value is a valid float greater than zero. 
-        - calculate_gross_pay(hours_worked, hourly_rate): Calculates the gross pay based on the hours worked and rate.
-        - calculate_taxes(gross_pay): Calculates the taxes based on the gross pay and the tax rate. 
-        - calculate_net_pay(gross_pay, taxes): Calculates the net pay based on the gross pay and taxes.
-        - display_pay_details(gross_pay, tax_amount, net_pay): Displays the pay details to the user.
+        - set_if_changed(variable, value): Sets a Tk variable only if its value changed.
+        - validate_inputs(hours_worked, hourly_rate): Validates the inputs and returns an error message, if any.
+        - display_pay_details(gross_pay, tax_amount, net_pay): Displays the pay details (or a Paycheck) to the user.
         - calculate(): Event handler for the 'Calculate' button click.
+        - schedule_recalculation(*args): Event handler for changes to the hours worked and hourly rate inputs.
+        - recalculate(): Recalculates the pay details from the current inputs.
+        - load_timesheet(): Event handler for the 'Load Timesheet...' button click.
+        - cancel_timesheet_import(): Event handler for the 'Cancel' button click.
+        - poll_timesheet_import(): Applies the progress messages of the running timesheet import.
+        - finish_timesheet_import(status, processed, rejected, totals): Displays the summary of a finished timesheet
+            import.
+        - start_results_sort(column, descending, scroll_to_top): Sorts the results on a background thread.
+        - poll_results_sort(job): Applies the background sort of the results when it is done.
+        - format_result_row(row): Formats a result row for the results grid.
+        - render_results(): Shows the visible window of the results in the results grid.
+        - scroll_results(action, amount, unit): Scrolls the results grid.
+        - scroll_results_with_wheel(event): Event handler for the mouse wheel over the results grid.
+        - sort_results(column): Event handler for a results grid heading click.
+        - schedule_filter(*args): Event handler for changes to the results filter.
+        - apply_filter(): Applies the results filter.
         - setup_gui(root): Sets up the graphical user interface for the application. 
     """
 
-import tkinter as tk
-from tkinter import messagebox
+import queue
+import threading
+
+from ..core import (
+    TAX_RATE,
+    TAX_RATE_PERCENTAGE,
+    MAX_STANDARD_HOURS,
+    OVERTIME_RATE,
+    is_valid_float,
+    is_valid_float_greater_than_zero,
+    calculate_gross_pay,
+    calculate_taxes,
+    calculate_net_pay,
+)
+from ..records import calculate_paycheck
+from ..results_view import COLUMNS as RESULT_COLUMNS, ResultsView
+from ..timesheet_import import TimesheetImport
+
+POLL_INTERVAL_MS = 16  # How often the GUI polls the timesheet import (about once per frame)
+MAX_MESSAGES_PER_POLL = 8  # Upper bound on the work done by one poll, so the event loop is never blocked
+
+VISIBLE_ROWS = 15  # Number of rows in the results grid; only these rows have Treeview items
+FILTER_DELAY_MS = 150  # Delay before the results filter is applied, so typing a filter does not rescan on every key
+RESULT_HEADINGS = ("Employee", "Hours", "Rate", "Gross Pay", "Taxes", "Net Pay")
+
+timesheet_job = None  # The running timesheet import, if any
+loaded_rows = []  # The (employee id, hours worked, hourly rate, gross pay, taxes, net pay) rows of the last import
+results_view = ResultsView(loaded_rows)  # The sort order and filter of the results grid
+results_top = 0  # Position of the first visible row of the results grid
+filter_job = None  # The scheduled filter update, if any
+sort_job = None  # The queue that receives the result of the running background sort of the results, if any
+sort_request = None  # The (column, descending, scroll to top) of the running background sort, if any
+
+RECALCULATE_DELAY_MS = 100  # Delay before the pay details are recalculated, so typing does not recalculate every key
+recalculate_job = None  # The scheduled recalculation, if any
+last_inputs = None  # The (hours worked, hourly rate) inputs of the last recalculation
+
+
+def set_if_changed(variable, value):
+    """
+    Set a Tk variable only if its value actually changed, so the widgets that display it are not redrawn needlessly.
+
+    Args:
+        variable: The Tk variable.
+        :param variable: tk.Variable
+
+        value: The new value.
+        :param value: str
 
-TAX_RATE = 18.0
-TAX_RATE_PERCENTAGE = TAX_RATE / 100
-MAX_STANDARD_HOURS = 40
-OVERTIME_RATE = 1.5
+    Returns: None
+    """
+    if variable.get() != value:
+        variable.set(value)
 
 
-def is_valid_float(value):
+def validate_inputs(hours_worked, hourly_rate):
     """
-    Check if the input value can be converted to a float. 
+    Validate the hours worked and hourly rate entered by the user.
 
     Args:
-        value: The input value to check. 
-        :param value: str
+        hours_worked: The number of hours worked, as entered.
+        :param hours_worked: str
 
-    Returns: True if the value can be converted to a float, False otherwise. 
+        hourly_rate: The hourly rate, as entered.
+        :param hourly_rate: str
+
+    Returns: An error message, or None if both inputs are valid.
     """
-    try:
-        float(value)
-        return True
-    except ValueError:
-        return False
+    if not hours_worked:
+        return "Please enter the number of hours worked."
+    if not hourly_rate:
+        return "Please enter the hourly rate."
+    if not is_valid_float_greater_than_zero(hours_worked):
+        return "Please enter a valid number of hours worked greater than zero."
+    if not is_valid_float_greater_than_zero(hourly_rate):
+        return "Please enter a valid hourly rate greater than zero."
+    return None
 
 
-def is_valid_float_greater_than_zero(value):
+def display_pay_details(gross_pay, tax_amount=None, net_pay=None):
     """
-    Check if the input value is a valid float greater than zero. 
+    Display the pay details to the user. 
+
+    The function displays the pay details to the user in the GUI. The pay details include the gross pay, tax amount, 
+    and net pay. The function formats the pay details as a string and sets the result variable to display the 
+    formatted pay details in the GUI. The pay details can also be passed as a single Paycheck record (or a
+    PaycheckView of a columnar batch).
 
     Args:
-        value: The input value to check. 
-        :param value: str 
+        gross_pay: The gross pay amount, or a record with gross_pay, taxes, and net_pay fields.
+        :param gross_pay: float | Paycheck
+
+        tax_amount: The tax amount. Omitted when a record is passed.
+        :param tax_amount: float
+
+        net_pay: The net pay amount. Omitted when a record is passed.
+        :param net_pay: float
 
-    Returns: True if the value is a valid float greater than zero, False otherwise.
+    Returns: None
     """
-    return is_valid_float(value) and float(value) > 0
+    if tax_amount is None:
+        gross_pay, tax_amount, net_pay = gross_pay.gross_pay, gross_pay.taxes, gross_pay.net_pay
+    set_if_changed(result_var, f"Gross Pay: ${gross_pay:,.2f}\nTaxes: ${tax_amount:,.2f}\nNet Pay: ${net_pay:,.2f}")
 
 
-def calculate_gross_pay(hours_worked, hourly_rate):
+def calculate():
     """
-    Calculate the gross pay based on the hours worked and hourly rate. 
+    Event handler for the 'Calculate' button click.
 
-    The function calculates the gross pay based on the number of hours worked and the hourly rate. 
-    If the hours worked are less than or equal to the maximum standard hours, the function calculates the pay
-    as a product of hours worked and the hourly rate. If the hours worked exceed the maximum standard hours,
-    the function calculates the standard pay for the maximum standard hours and adds the overtime pay for the 
-    additional hours worked at the overtime rate. 
+    The function is called when the user clicks the 'Calculate' button in the GUI. It retrieves the input values 
+    for the hours worked and hourly rate from the input fields, validates the input values, calculates the gross pay,
+    taxes, and net pay based on the input values, and displays the pay details in the GUI. If the input values are 
+    invalid, the function displays an error message to the user as a pop-up dialog. If the input values are valid,
+    the function calculates the pay details and displays them in the GUI at the bottom of the window.
+    """
+    from tkinter import messagebox
 
-    Args:
-        hours_worked: The number of hours worked. 
-        :param hours_worked: float
+    hours_worked = hours_var.get().strip()
+    hourly_rate = rate_var.get().strip()
 
-        hourly_rate: The hourly rate. 
-        :param hourly_rate: float
+    error = validate_inputs(hours_worked, hourly_rate)
+    if error:
+        messagebox.showerror("Invalid Input", error)
+        return
+
+    display_pay_details(calculate_paycheck(float(hours_worked), float(hourly_rate)))
 
-    Returns: The gross pay based on the hours worked and hourly rate (e.g., standard pay + overtime pay).
+
+def schedule_recalculation(*args):
     """
-    if hours_worked <= MAX_STANDARD_HOURS:
-        return hours_worked * hourly_rate
-    else:
-        standard_pay = MAX_STANDARD_HOURS * hourly_rate
-        overtime_hours = hours_worked - MAX_STANDARD_HOURS
-        overtime_pay = overtime_hours * hourly_rate * OVERTIME_RATE
-        return standard_pay + overtime_pay
+    Event handler for changes to the hours worked and hourly rate inputs.
+
+    The function recalculates the pay details after RECALCULATE_DELAY_MS, and restarts the delay if an input changes
+    again, so the pay details are only recalculated once the user pauses typing.
+    """
+    global recalculate_job
+    if recalculate_job is not None:
+        window.after_cancel(recalculate_job)
+    recalculate_job = window.after(RECALCULATE_DELAY_MS, recalculate)
 
 
-def calculate_taxes(gross_pay):
+def recalculate():
     """
-    Calculate the taxes based on the gross pay and the tax rate. 
+    Recalculate the pay details from the current inputs, showing validation errors inline instead of in a pop-up.
 
-    The function calculates the taxes based on the gross pay and the tax rate. The tax amount is calculated as the 
-    product of the gross pay and the tax rate percentage constant. 
+    Nothing is recalculated if the inputs did not change since the last recalculation, and nothing is shown while
+    both inputs are empty.
+    """
+    global recalculate_job, last_inputs
+    recalculate_job = None
 
-    Args:
-        gross_pay: The gross pay amount. 
-        :param gross_pay: float
+    hours_worked = hours_var.get().strip()
+    hourly_rate = rate_var.get().strip()
+    if (hours_worked, hourly_rate) == last_inputs:
+        return
+    last_inputs = (hours_worked, hourly_rate)
 
-    Returns: The calculated tax amount based on the gross pay and tax rate. 
+    if not hours_worked and not hourly_rate:
+        set_if_changed(error_var, "")
+        set_if_changed(result_var, "")
+        return
+
+    error = validate_inputs(hours_worked, hourly_rate)
+    if error:
+        set_if_changed(error_var, error)
+        set_if_changed(result_var, "")
+        return
+
+    set_if_changed(error_var, "")
+    display_pay_details(calculate_paycheck(float(hours_worked), float(hourly_rate)))
+
+
+def load_timesheet():
+    """
+    Event handler for the 'Load Timesheet...' button click.
+
+    The function asks the user for a timesheet file and starts importing it on a background thread. The buttons are
+    switched so the import can be cancelled but not started twice, and the progress of the import is polled with
+    poll_timesheet_import().
     """
-    return gross_pay * TAX_RATE_PERCENTAGE
+    from tkinter import filedialog
+
+    global timesheet_job
+    if timesheet_job is not None:
+        return
+
+    path = filedialog.askopenfilename(title="Load Timesheet",
+                                      filetypes=[("Timesheets", "*.csv *.jsonl"), ("All Files", "*.*")])
+    if not path:
+        return
 
+    global sort_job, sort_request
+    sort_job = sort_request = None
+    results_view.clear()
+    filter_var.set("")
+    scroll_results('moveto', 0)
+    progress_var.set(0)
+    status_var.set("Loading timesheet...")
+    load_button.config(state="disabled")
+    cancel_button.config(state="normal")
 
-def calculate_net_pay(gross_pay, taxes):
+    timesheet_job = TimesheetImport(path)
+    timesheet_job.start()
+    window.after(POLL_INTERVAL_MS, poll_timesheet_import)
+
+
+def cancel_timesheet_import():
     """
-    Calculate the net pay based on the gross pay and taxes. 
+    Event handler for the 'Cancel' button click.
 
-    The function calculates the net pay based on the gross pay and the taxes. The net pay is calculated as the 
-    difference between the gross pay and the taxes. 
+    The function asks the running timesheet import to stop. The import sends a 'cancelled' message when it has
+    stopped, which is handled by poll_timesheet_import().
+    """
+    if timesheet_job is not None:
+        timesheet_job.cancel()
+        status_var.set("Cancelling...")
 
-    Args:
-        gross_pay: The gross pay amount. 
-        :param gross_pay: float 
 
-        taxes: The tax amount. 
-        :param taxes: float
+def poll_timesheet_import():
+    """
+    Apply the progress messages of the running timesheet import.
 
-    Returns: The calculated net pay after deducting the taxes from the gross pay. 
+    The function is called on the main thread with root.after(). It applies at most MAX_MESSAGES_PER_POLL messages,
+    so a single poll never blocks the event loop, and schedules itself again until the import has finished. If the
+    worker thread has stopped without sending a final message, the import is finished as failed, so the GUI never
+    waits for it forever.
     """
-    return gross_pay - taxes
+    global timesheet_job
+    if timesheet_job is None:
+        return
 
+    running = timesheet_job.is_running()  # Checked before the messages are read, so no final message is missed
+    messages = timesheet_job.get_messages(MAX_MESSAGES_PER_POLL)
+    if not running and not messages:
+        timesheet_job = None
+        finish_timesheet_import("Import failed (the import stopped unexpectedly)", len(loaded_rows), 0, None)
+        return
 
-def display_pay_details(gross_pay, tax_amount, net_pay):
+    for message in messages:
+        kind = message[0]
+        if kind == 'rows':
+            _, rows, rejected, bytes_read, total_bytes = message
+            results_view.extend(rows)
+            render_results()
+            progress_var.set(100 * bytes_read / total_bytes if total_bytes else 100)
+            status_var.set(f"Loaded {len(loaded_rows):,} rows ({rejected:,} rejected)...")
+        elif kind == 'error':
+            _, error, processed, rejected, totals = message
+            timesheet_job = None
+            finish_timesheet_import(f"Import failed ({error})", processed, rejected, totals)
+            return
+        else:
+            _, processed, rejected, totals = message
+            timesheet_job = None
+            status = "Import cancelled" if kind == 'cancelled' else "Import finished"
+            finish_timesheet_import(status, processed, rejected, totals)
+            return
+
+    window.after(POLL_INTERVAL_MS, poll_timesheet_import)
+
+
+def finish_timesheet_import(status, processed, rejected, totals):
     """
-    Display the pay details to the user. 
+    Display the summary of a finished timesheet import.
 
-    The function displays the pay details to the user in the GUI. The pay details include the gross pay, tax amount, 
-    and net pay. The function formats the pay details as a string and sets the result variable to display the 
-    formatted pay details in the GUI. 
+    The function re-enables the buttons and displays the number of processed and rejected rows and the total gross
+    pay, taxes, and net pay of the loaded rows (which were added up by the import thread) in the status line, so the
+    pay details of the single quote above are left as they are. If the results are sorted, the rows that were loaded
+    since the sort are sorted in on a background thread.
 
     Args:
-        gross_pay: The gross pay amount.
-        :param gross_pay: float
+        status: The status of the import.
+        :param status: str
 
-        tax_amount: The tax amount.
-        :param tax_amount: float
+        processed: The number of processed rows.
+        :param processed: int
 
-        net_pay: The net pay amount.
-        :param net_pay: float
+        rejected: The number of rejected rows.
+        :param rejected: int
+
+        totals: The total (gross pay, taxes, net pay) of the loaded rows, or None if they are not known.
+        :param totals: tuple[float, float, float]
 
     Returns: None
     """
-    result_var.set(f"Gross Pay: ${gross_pay:,.2f}\nTaxes: ${tax_amount:,.2f}\nNet Pay: ${net_pay:,.2f}")
+    load_button.config(state="normal")
+    cancel_button.config(state="disabled")
+    summary = f"{status}: {processed:,} rows processed, {rejected:,} rejected."
+    if totals is not None:
+        gross_pay, tax_amount, net_pay = totals
+        summary += (f"\nTimesheet Totals - Gross Pay: ${gross_pay:,.2f}, Taxes: ${tax_amount:,.2f}, "
+                    f"Net Pay: ${net_pay:,.2f}")
+    status_var.set(summary)
+
+    if sort_request is not None:
+        start_results_sort(*sort_request)
+    elif results_view.sort_column is not None:
+        start_results_sort(results_view.sort_column, results_view.descending)
+    render_results()
+
+
+def start_results_sort(column, descending=False, scroll_to_top=False):
+    """
+    Sort the results by a column on a background thread.
 
+    The sort is prepared on the main thread (which only copies the rows and the current order), computed on a daemon
+    thread, and applied by poll_results_sort(). Starting a new sort replaces the running one, whose result is then
+    ignored.
 
-def calculate():
+    Args:
+        column: The column name.
+        :param column: str
+
+        descending: True to sort from the largest to the smallest value.
+        :param descending: bool
+
+        scroll_to_top: True to show the first rows once the sort is applied.
+        :param scroll_to_top: bool
+
+    Returns: None
     """
-    Event handler for the 'Calculate' button click.
+    global sort_job, sort_request
+    compute = results_view.prepare_sort(column, descending)
+    sort_job = queue.Queue(maxsize=1)
+    sort_request = (column, descending, scroll_to_top)
+    job = sort_job
+    threading.Thread(target=lambda: job.put(compute()), name='results-sort', daemon=True).start()
+    window.after(POLL_INTERVAL_MS, lambda: poll_results_sort(job))
 
-    The function is called when the user clicks the 'Calculate' button in the GUI. It retrieves the input values 
-    for the hours worked and hourly rate from the input fields, validates the input values, calculates the gross pay,
-    taxes, and net pay based on the input values, and displays the pay details in the GUI. If the input values are 
-    invalid, the function displays an error message to the user as a pop-up dialog. If the input values are valid,
-    the function calculates the pay details and displays them in the GUI at the bottom of the window.
+
+def poll_results_sort(job):
     """
-    hours_worked = hours_var.get().strip()
-    hourly_rate = rate_var.get().strip()
+    Apply the background sort of the results when it is done, and otherwise check again after POLL_INTERVAL_MS.
 
-    if not hours_worked:
-        messagebox.showerror("Invalid Input", "Please enter the number of hours worked.")
-        return
+    If rows were added while the sort was running (e.g., by a running import), the result is stale and the sort is
+    started again.
 
-    if not hourly_rate:
-        messagebox.showerror("Invalid Input", "Please enter the hourly rate.")
+    Args:
+        job: The queue of the sort to poll. Polling stops once a newer sort has replaced it.
+        :param job: queue.Queue
+
+    Returns: None
+    """
+    global sort_job, sort_request
+    if job is not sort_job:
         return
 
-    if not is_valid_float_greater_than_zero(hours_worked):
-        messagebox.showerror("Invalid Input", "Please enter a valid number of hours worked greater than zero.")
+    try:
+        result = job.get_nowait()
+    except queue.Empty:
+        window.after(POLL_INTERVAL_MS, lambda: poll_results_sort(job))
         return
 
-    if not is_valid_float_greater_than_zero(hourly_rate):
-        messagebox.showerror("Invalid Input", "Please enter a valid hourly rate greater than zero.")
+    if not results_view.apply_sort(result):
+        start_results_sort(*sort_request)
         return
 
-    hours_worked = float(hours_worked)
-    hourly_rate = float(hourly_rate)
+    scroll_to_top = sort_request[2]
+    sort_job = sort_request = None
+    if scroll_to_top:
+        scroll_results('moveto', 0)
+    else:
+        render_results()
+
+
+def format_result_row(row):
+    """
+    Format a result row for the results grid.
 
-    gross_pay = calculate_gross_pay(hours_worked, hourly_rate)
-    tax_amount = calculate_taxes(gross_pay)
-    net_pay = calculate_net_pay(gross_pay, tax_amount)
+    Args:
+        row: The (employee id, hours worked, hourly rate, gross pay, taxes, net pay) row.
+        :param row: tuple
 
-    display_pay_details(gross_pay, tax_amount, net_pay)
+    Returns: A tuple of the formatted values.
+    """
+    employee_id, hours_worked, hourly_rate, gross_pay, tax_amount, net_pay = row
+    return (employee_id, f"{hours_worked:,.2f}", f"${hourly_rate:,.2f}", f"${gross_pay:,.2f}", f"${tax_amount:,.2f}",
+            f"${net_pay:,.2f}")
+
+
+def render_results():
+    """
+    Show the visible window of the results in the results grid.
+
+    The results grid has a fixed set of VISIBLE_ROWS Treeview items, which are reused for whatever rows are visible,
+    so rendering only formats the visible rows, no matter how many rows are loaded.
+    """
+    global results_top
+    total = len(results_view)
+    results_top = max(0, min(results_top, total - VISIBLE_ROWS))
+
+    rows = results_view.get_rows(results_top, VISIBLE_ROWS)
+    for position, item in enumerate(result_items):
+        values = format_result_row(rows[position]) if position < len(rows) else ()
+        results_tree.item(item, values=values)
+
+    if total:
+        results_scrollbar.set(results_top / total, (results_top + len(rows)) / total)
+    else:
+        results_scrollbar.set(0, 1)
+    results_count_var.set(f"{total:,} of {len(loaded_rows):,} rows")
+
+
+def scroll_results(action, amount, unit=None):
+    """
+    Scroll the results grid. This is the command of the results scrollbar.
+
+    Args:
+        action: 'moveto' to scroll to a fraction of the rows, or 'scroll' to scroll by units or pages.
+        :param action: str
+
+        amount: The fraction of the rows for 'moveto', or the number of units or pages for 'scroll'.
+        :param amount: str
+
+        unit: 'units' (rows) or 'pages', for 'scroll'.
+        :param unit: str
+
+    Returns: None
+    """
+    global results_top
+    if action == 'moveto':
+        results_top = int(float(amount) * len(results_view))
+    elif unit == 'pages':
+        results_top += int(amount) * VISIBLE_ROWS
+    else:
+        results_top += int(amount)
+    render_results()
+
+
+def scroll_results_with_wheel(event):
+    """
+    Event handler for the mouse wheel over the results grid.
+
+    Args:
+        event: The mouse wheel event.
+        :param event: tk.Event
+
+    Returns: 'break', so the Treeview does not scroll its own (fixed) items.
+    """
+    if event.num == 4 or event.delta > 0:
+        scroll_results('scroll', -3, 'units')
+    else:
+        scroll_results('scroll', 3, 'units')
+    return "break"
+
+
+def sort_results(column):
+    """
+    Event handler for a results grid heading click.
+
+    The function sorts the results by the column on a background thread, so sorting a large timesheet does not block
+    the event loop, and shows the sort order in the headings right away. Clicking the same heading again reverses the
+    sort order.
+
+    Args:
+        column: The column name.
+        :param column: str
+
+    Returns: None
+    """
+    current_column, current_descending = (sort_request[:2] if sort_request is not None
+                                          else (results_view.sort_column, results_view.descending))
+    descending = current_column == column and not current_descending
+    start_results_sort(column, descending, scroll_to_top=True)
+    for name, heading in zip(RESULT_COLUMNS, RESULT_HEADINGS):
+        arrow = (" \u25bc" if descending else " \u25b2") if name == column else ""
+        results_tree.heading(name, text=heading + arrow)
+
+
+def schedule_filter(*args):
+    """
+    Event handler for changes to the results filter.
+
+    The function applies the filter after FILTER_DELAY_MS, and restarts the delay if the filter changes again, so the
+    rows are only scanned once the user pauses typing.
+    """
+    global filter_job
+    if filter_job is not None:
+        window.after_cancel(filter_job)
+    filter_job = window.after(FILTER_DELAY_MS, apply_filter)
+
+
+def apply_filter():
+    """
+    Apply the results filter and show the first matching rows.
+    """
+    global filter_job
+    filter_job = None
+    results_view.filter(filter_var.get())
+    scroll_results('moveto', 0)
 
 
 def setup_gui(root):
@@ -202,33 +559,93 @@ def setup_gui(root):
 
     Returns: None
     """
+    import tkinter as tk
+    from tkinter import ttk
+
+    global window
+    window = root
     root.title("Paycheck Calculator")
 
     # Hourly Rate Input
     tk.Label(root, text="Hourly Rate:").grid(row=0, column=0, padx=10, pady=5, sticky="e")
     global rate_var
     rate_var = tk.StringVar()
+    rate_var.trace_add("write", schedule_recalculation)
     tk.Entry(root, textvariable=rate_var).grid(row=0, column=1, padx=10, pady=5)
 
     # Hours Worked Input
     tk.Label(root, text="Hours Worked:").grid(row=1, column=0, padx=10, pady=5, sticky="e")
     global hours_var
     hours_var = tk.StringVar()
+    hours_var.trace_add("write", schedule_recalculation)
     tk.Entry(root, textvariable=hours_var).grid(row=1, column=1, padx=10, pady=5)
 
     # Calculate Button
     tk.Button(root, text="Calculate", command=calculate).grid(row=2, column=0, columnspan=2, pady=10)
 
+    # Inline Validation Errors
+    global error_var
+    error_var = tk.StringVar()
+    tk.Label(root, textvariable=error_var, fg="red").grid(row=3, column=0, columnspan=2, padx=10)
+
     # Result Display
     global result_var
     result_var = tk.StringVar()
-    tk.Label(root, textvariable=result_var, justify="left").grid(row=3, column=0, columnspan=2, padx=10, pady=10)
+    tk.Label(root, textvariable=result_var, justify="left").grid(row=4, column=0, columnspan=2, padx=10, pady=10)
+
+    # Timesheet Import
+    global load_button, cancel_button
+    load_button = tk.Button(root, text="Load Timesheet...", command=load_timesheet)
+    load_button.grid(row=5, column=0, padx=10, pady=5, sticky="ew")
+    cancel_button = tk.Button(root, text="Cancel", command=cancel_timesheet_import, state="disabled")
+    cancel_button.grid(row=5, column=1, padx=10, pady=5, sticky="ew")
+
+    global progress_var
+    progress_var = tk.DoubleVar()
+    ttk.Progressbar(root, variable=progress_var, maximum=100).grid(row=6, column=0, columnspan=2, padx=10, pady=5,
+                                                                    sticky="ew")
+
+    global status_var
+    status_var = tk.StringVar()
+    tk.Label(root, textvariable=status_var, justify="left").grid(row=7, column=0, columnspan=2, padx=10, pady=5)
+
+    # Results Filter
+    tk.Label(root, text="Filter Employees:").grid(row=8, column=0, padx=10, pady=5, sticky="e")
+    global filter_var
+    filter_var = tk.StringVar()
+    filter_var.trace_add("write", schedule_filter)
+    tk.Entry(root, textvariable=filter_var).grid(row=8, column=1, padx=10, pady=5)
+
+    # Results Grid
+    frame = tk.Frame(root)
+    frame.grid(row=9, column=0, columnspan=2, padx=10, pady=5, sticky="nsew")
+    global results_tree, result_items
+    results_tree = ttk.Treeview(frame, columns=RESULT_COLUMNS, show="headings", height=VISIBLE_ROWS,
+                                selectmode="none")
+    for name, heading in zip(RESULT_COLUMNS, RESULT_HEADINGS):
+        results_tree.heading(name, text=heading, command=lambda column=name: sort_results(column))
+        results_tree.column(name, width=100, anchor="w" if name == 'employee_id' else "e")
+    result_items = [results_tree.insert("", "end", values=()) for _ in range(VISIBLE_ROWS)]
+    results_tree.grid(row=0, column=0, sticky="nsew")
+
+    global results_scrollbar
+    results_scrollbar = ttk.Scrollbar(frame, orient="vertical", command=scroll_results)
+    results_scrollbar.grid(row=0, column=1, sticky="ns")
+    for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+        results_tree.bind(sequence, scroll_results_with_wheel)
+
+    global results_count_var
+    results_count_var = tk.StringVar()
+    tk.Label(root, textvariable=results_count_var).grid(row=10, column=0, columnspan=2, padx=10, pady=5)
+    render_results()
 
 
 if __name__ == '__main__':
     """
     Main code block of the Paycheck Calculator GUI application.
     """
+    import tkinter as tk
+
     root = tk.Tk()
     setup_gui(root)
     root.mainloop()
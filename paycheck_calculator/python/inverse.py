@@ -0,0 +1,143 @@
+"""
+Paycheck Calculator - Python Net-to-Gross Inverse Solver
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a batch inverse solver for the Paycheck Calculator. The usual question is "what do I take home
+for these hours at this rate", but planning often asks the reverse: what hourly rate (or how many hours) produces a
+target net pay. Searching for the answer with bisection needs dozens of forward calculate_gross_pay() and
+calculate_net_pay() calls per target. This module instead inverts the pay pipeline in closed form, because every step
+of it is piecewise linear:
+    - The net pay is gross pay times (1 - TAX_RATE_PERCENTAGE) with the flat tax, or, with a progressive tax schedule
+      (see tax_schedule.py), a linear function of the gross pay inside each bracket, with a slope of 1 minus the
+      bracket's marginal rate. The bracket of a target net pay is found with one binary search over the net pay at the
+      start of each bracket.
+    - The gross pay is the hourly rate times the paid hours, where the paid hours are the hours worked up to
+      MAX_STANDARD_HOURS plus OVERTIME_RATE times the overtime hours. The only kink is at MAX_STANDARD_HOURS.
+
+Every function accepts NumPy arrays of targets and solves them all at once, so each answer costs a few array
+operations instead of thousands of forward evaluations. Targets that cannot be reached (e.g., a negative net pay, zero
+hours worked, or a non-positive hourly rate) are returned as NaN. The constants are read from the core module
+(core.py) at call time, like in the batch engine (batch.py).
+
+The following functions are defined in this module:
+    - calculate_gross_for_net_batch(net_pay, schedule): Calculates the gross pay that produces each net pay.
+    - calculate_paid_hours_batch(hours_worked): Calculates the paid hours, with overtime hours weighted.
+    - solve_hourly_rate_batch(net_pay, hours_worked, schedule): Calculates the hourly rate that produces each net pay.
+    - solve_hours_worked_batch(net_pay, hourly_rate, schedule): Calculates the hours worked that produce each net pay.
+
+Example:
+    >>> from paycheck_calculator.python.inverse import solve_hourly_rate_batch
+    >>> solve_hourly_rate_batch([779.0, 1000.0], 45)
+    array([20.        , 25.67394095])
+"""
+
+import numpy as np
+
+from . import core
+from .batch import as_float_array
+
+
+def calculate_gross_for_net_batch(net_pay, schedule=None):
+    """
+    Calculate the gross pay that produces each target net pay.
+
+    With the flat tax, the gross pay is net pay / (1 - TAX_RATE_PERCENTAGE). With a tax schedule, the bracket of each
+    target is found by searching the net pay at the start of every bracket (start - cumulative tax), and the gross pay
+    is the bracket start plus the rest of the net pay divided by 1 minus the bracket's marginal rate.
+
+    Args:
+        net_pay: The target net pay for each row.
+        :param net_pay: array-like
+
+        schedule: The progressive tax schedule, or None for the flat TAX_RATE.
+        :param schedule: TaxSchedule
+
+    Returns: A float64 array with the gross pay for each row, or NaN where the net pay is negative.
+    """
+    net_pay = as_float_array(net_pay)
+
+    if schedule is None:
+        gross_pay = net_pay / (1 - core.TAX_RATE_PERCENTAGE)
+    else:
+        starts = as_float_array(schedule.starts)
+        slopes = 1 - as_float_array(schedule.rates)
+        if np.any(slopes <= 0):
+            raise ValueError('A tax schedule with a marginal rate of 100% or more cannot be inverted.')
+        net_starts = starts - as_float_array(schedule.cumulative)
+
+        index = np.maximum(np.searchsorted(net_starts, net_pay, side='right') - 1, 0)
+        gross_pay = starts[index] + (net_pay - net_starts[index]) / slopes[index]
+
+    return np.where(net_pay >= 0, gross_pay, np.nan)
+
+
+def calculate_paid_hours_batch(hours_worked):
+    """
+    Calculate the paid hours for each number of hours worked.
+
+    The paid hours are the hours worked up to MAX_STANDARD_HOURS, plus the overtime hours times OVERTIME_RATE, so the
+    gross pay is the hourly rate times the paid hours.
+
+    Args:
+        hours_worked: The number of hours worked for each row.
+        :param hours_worked: array-like
+
+    Returns: A float64 array with the paid hours for each row.
+    """
+    hours_worked = as_float_array(hours_worked)
+    overtime_hours = core.MAX_STANDARD_HOURS + (hours_worked - core.MAX_STANDARD_HOURS) * core.OVERTIME_RATE
+    return np.where(hours_worked <= core.MAX_STANDARD_HOURS, hours_worked, overtime_hours)
+
+
+def solve_hourly_rate_batch(net_pay, hours_worked, schedule=None):
+    """
+    Calculate the hourly rate that produces each target net pay for a number of hours worked.
+
+    Args:
+        net_pay: The target net pay for each row.
+        :param net_pay: array-like
+
+        hours_worked: The number of hours worked for each row (broadcast against net_pay).
+        :param hours_worked: array-like
+
+        schedule: The progressive tax schedule, or None for the flat TAX_RATE.
+        :param schedule: TaxSchedule
+
+    Returns: A float64 array with the hourly rate for each row, or NaN where the net pay cannot be reached.
+    """
+    gross_pay = calculate_gross_for_net_batch(net_pay, schedule)
+    paid_hours = calculate_paid_hours_batch(hours_worked)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hourly_rate = gross_pay / paid_hours
+    return np.where(paid_hours > 0, hourly_rate, np.nan)
+
+
+def solve_hours_worked_batch(net_pay, hourly_rate, schedule=None):
+    """
+    Calculate the number of hours worked that produces each target net pay at an hourly rate.
+
+    The paid hours are the gross pay divided by the hourly rate. Up to MAX_STANDARD_HOURS they are the hours worked,
+    and above it every OVERTIME_RATE paid hours are one hour worked.
+
+    Args:
+        net_pay: The target net pay for each row.
+        :param net_pay: array-like
+
+        hourly_rate: The hourly rate for each row (broadcast against net_pay).
+        :param hourly_rate: array-like
+
+        schedule: The progressive tax schedule, or None for the flat TAX_RATE.
+        :param schedule: TaxSchedule
+
+    Returns: A float64 array with the hours worked for each row, or NaN where the net pay cannot be reached.
+    """
+    gross_pay = calculate_gross_for_net_batch(net_pay, schedule)
+    hourly_rate = as_float_array(hourly_rate)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        paid_hours = gross_pay / hourly_rate
+    overtime_hours = core.MAX_STANDARD_HOURS + (paid_hours - core.MAX_STANDARD_HOURS) / core.OVERTIME_RATE
+    hours_worked = np.where(paid_hours <= core.MAX_STANDARD_HOURS, paid_hours, overtime_hours)
+    return np.where(hourly_rate > 0, hours_worked, np.nan)
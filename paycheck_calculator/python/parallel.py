@@ -0,0 +1,262 @@
+"""
+Paycheck Calculator - Python Parallel Payroll Runs
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a parallel executor for the Paycheck Calculator. A large timesheet file (CSV or JSONL, in the
+same layout as the streaming mode in stream.py) is split into byte-range shards that end on line boundaries. Each
+shard is sent to a worker process of a concurrent.futures.ProcessPoolExecutor, which reads only its own byte range,
+validates the rows with the rules from the console application, and calculates the gross pay, taxes, and net pay with
+the vectorized batch engine. The outputs are merged back in input order, so the results are the same as those of a
+single-process streaming run. Rows must not contain embedded line breaks (e.g., quoted CSV values spanning lines),
+since shards are cut at line boundaries.
+
+The worker count and the chunk (shard) size are configurable. Each worker only holds one shard at a time, so the
+chunk size bounds the memory used per worker.
+
+The following functions are defined in this module:
+    - find_shards(path, chunk_size, skip_header): Splits the file into byte ranges that end on line boundaries.
+    - process_shard(path, start, end, input_format, header): Processes one shard in a worker process.
+    - process_timesheet_parallel(path, output, rejects, input_format, workers, chunk_size): Processes the whole file.
+    - main(argv): Command line entry point for parallel runs.
+
+Usage (from the repository root):
+    python -m paycheck_calculator.python.parallel timesheet.csv --workers 32 --output pay.csv --rejects rejects.csv
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import calculate_pay_batch
+from .stream import (
+    INPUT_FORMATS,
+    OUTPUT_FIELDS,
+    REJECT_FIELDS,
+    detect_format,
+    format_amount,
+    parse_rows,
+    validate_rows,
+)
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # Shard size in bytes
+
+
+def find_shards(path, chunk_size=DEFAULT_CHUNK_SIZE, skip_header=False):
+    """
+    Split the file into byte ranges that end on line boundaries.
+
+    The file is cut every chunk_size bytes, and each cut is moved forward to the start of the next line, so no line is
+    split between two shards. Only the bytes around each cut are read, not the whole file.
+
+    Args:
+        path: The path of the timesheet file.
+        :param path: str
+
+        chunk_size: The approximate size of each shard in bytes.
+        :param chunk_size: int
+
+        skip_header: Whether the first line is a header that should not be part of any shard.
+        :param skip_header: bool
+
+    Returns: A tuple with the header line (bytes, empty if skip_header is False) and a list of (start, end) offsets.
+    """
+    if chunk_size <= 0:
+        raise ValueError('The chunk size must be greater than zero.')
+
+    shards = []
+    with open(path, 'rb') as file:
+        header = file.readline() if skip_header else b''
+        start = file.tell()
+        size = os.fstat(file.fileno()).st_size
+        while start < size:
+            file.seek(min(start + chunk_size, size))
+            file.readline()
+            end = min(file.tell(), size)
+            shards.append((start, end))
+            start = end
+    return header, shards
+
+
+def process_shard(path, start, end, input_format, header=b''):
+    """
+    Process one shard of the timesheet file in a worker process.
+
+    The shard is read, parsed, and validated with the streaming pipeline, and the valid rows are calculated in a
+    single vectorized pass. The line numbers of the rejected rows are relative to the start of the shard (starting at
+    1), and are turned into file line numbers by process_timesheet_parallel().
+
+    Args:
+        path: The path of the timesheet file.
+        :param path: str
+
+        start: The byte offset where the shard starts.
+        :param start: int
+
+        end: The byte offset where the shard ends.
+        :param end: int
+
+        input_format: The timesheet format ('csv' or 'jsonl').
+        :param input_format: str
+
+        header: The CSV header line, prepended to the shard so its rows can be parsed.
+        :param header: bytes
+
+    Returns: A tuple with the CSV output text, the list of rejected (line, reason, row) tuples, the number of
+    processed rows, and the number of lines in the shard.
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    lines = [line.decode('utf-8') for line in io.BytesIO(data)]
+    header_lines = 0
+    if header:
+        lines.insert(0, header.decode('utf-8'))
+        header_lines = 1
+
+    rejected = []
+
+    def on_reject(line_number, reason, row):
+        rejected.append((line_number - header_lines, reason, '' if row is None else json.dumps(row)))
+
+    employee_ids = []
+    hours = []
+    rates = []
+    for _, employee_id, hours_worked, hourly_rate in validate_rows(parse_rows(lines, input_format), on_reject):
+        employee_ids.append(employee_id)
+        hours.append(hours_worked)
+        rates.append(hourly_rate)
+
+    gross_pay, taxes, net_pay = calculate_pay_batch(hours, rates)
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    for index, employee_id in enumerate(employee_ids):
+        writer.writerow([employee_id, hours[index], rates[index], format_amount(gross_pay[index]),
+                         format_amount(taxes[index]), format_amount(net_pay[index])])
+
+    return output.getvalue(), rejected, len(employee_ids), len(lines) - header_lines
+
+
+def process_timesheet_parallel(path, output, rejects=None, input_format=None, workers=None,
+                               chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Process a timesheet file on a pool of worker processes and merge the results in input order.
+
+    The output has the same layout as process_timesheet() in stream.py: a CSV header with the columns in OUTPUT_FIELDS,
+    followed by one row per valid timesheet row, and the rejected rows (if rejects is given) with their line numbers
+    in the file.
+
+    Args:
+        path: The path of the timesheet file.
+        :param path: str
+
+        output: The text stream to write the results to.
+        :param output: io.TextIOBase
+
+        rejects: The text stream to write the invalid rows to.
+        :param rejects: io.TextIOBase
+
+        input_format: The timesheet format ('csv' or 'jsonl'). Defaults to the format detected from the extension.
+        :param input_format: str
+
+        workers: The number of worker processes. Defaults to the number of CPUs.
+        :param workers: int
+
+        chunk_size: The approximate size of each shard in bytes.
+        :param chunk_size: int
+
+    Returns: A tuple with the number of processed rows and the number of rejected rows.
+    """
+    input_format = input_format or detect_format(path)
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(f'Unsupported input format: {input_format}')
+
+    header, shards = find_shards(path, chunk_size, skip_header=input_format == 'csv')
+    header_lines = 1 if header else 0
+
+    csv.writer(output).writerow(OUTPUT_FIELDS)
+    reject_writer = None
+    if rejects is not None:
+        reject_writer = csv.writer(rejects)
+        reject_writer.writerow(REJECT_FIELDS)
+
+    processed = 0
+    rejected = 0
+    line_offset = header_lines
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(process_shard,
+                               [path] * len(shards),
+                               [start for start, _ in shards],
+                               [end for _, end in shards],
+                               [input_format] * len(shards),
+                               [header] * len(shards))
+        for text, shard_rejects, shard_processed, shard_lines in results:
+            output.write(text)
+            if reject_writer is not None:
+                for line_number, reason, row in shard_rejects:
+                    reject_writer.writerow([line_offset + line_number, reason, row])
+            processed += shard_processed
+            rejected += len(shard_rejects)
+            line_offset += shard_lines
+
+    return processed, rejected
+
+
+def main(argv=None):
+    """
+    Command line entry point for parallel runs.
+
+    Args:
+        argv: The command line arguments, without the program name. Defaults to sys.argv[1:].
+        :param argv: list[str]
+
+    Returns: The exit status (0 if every row was processed, 1 if any row was rejected). A file that cannot be opened
+    and a worker count or chunk size below 1 are reported as usage errors, with exit status 2.
+    """
+    parser = argparse.ArgumentParser(description='Calculate the pay details for a timesheet on several processes.')
+    parser.add_argument('input', help='The timesheet file.')
+    parser.add_argument('--format', choices=INPUT_FORMATS, help='The timesheet format (default: from the extension).')
+    parser.add_argument('--output', default='-', help="The results file, or '-' for standard output.")
+    parser.add_argument('--rejects', default='-', help="The rejected rows file, or '-' for standard error.")
+    parser.add_argument('--workers', type=int, default=None, help='The number of worker processes (default: CPUs).')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='The shard size in bytes.')
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+
+    opened = []
+
+    def open_file(path, mode):
+        stream = open(path, mode, newline='', encoding='utf-8')
+        opened.append(stream)
+        return stream
+
+    try:
+        open_file(args.input, 'r').close()  # The workers open the input themselves; check that it can be read
+        output = sys.stdout if args.output == '-' else open_file(args.output, 'w')
+        rejects = sys.stderr if args.rejects == '-' else open_file(args.rejects, 'w')
+    except OSError as error:
+        for stream in opened:
+            stream.close()
+        parser.error(f"cannot open '{error.filename}': {error.strerror}")
+
+    try:
+        processed, rejected = process_timesheet_parallel(args.input, output, rejects, args.format,
+                                                         args.workers, args.chunk_size)
+    finally:
+        for stream in opened:
+            stream.close()
+
+    return 1 if rejected else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Paycheck Calculator - Python Quote Cache
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a bounded cache for paycheck quotes. Most employees share a small set of standard hourly rates
+and standard 40-hour weeks, so the same (hours worked, hourly rate) pairs are calculated over and over again. The
+QuoteCache class keeps the gross pay, taxes, and net pay of recently calculated pairs, and only runs the
+calculate_gross_pay() -> calculate_taxes() -> calculate_net_pay() pipeline for pairs it has not seen.
+
+The cache key is the normalized hours worked and hourly rate (converted to floats, so 40, '40', and 40.0 share an
+entry) together with the tax schedule (None for the flat TAX_RATE, or a TaxSchedule from tax_schedule.py). The cache
+has a configurable maximum size and eviction policy ('lru' evicts the least recently used quote, and 'fifo' evicts the
+oldest quote), and it counts hits, misses, evictions, and invalidations. The whole cache is invalidated automatically
+when TAX_RATE, TAX_RATE_PERCENTAGE, MAX_STANDARD_HOURS, or OVERTIME_RATE in the core module (core.py) change.
+
+Example:
+    >>> from paycheck_calculator.python.quote_cache import QuoteCache
+    >>> cache = QuoteCache(maxsize=1024)
+    >>> gross, taxes, net = cache.get_quote(40, 25.0)
+    >>> cache.stats()['misses']
+    1
+"""
+
+from collections import OrderedDict
+
+from . import core
+from .tax_schedule import calculate_progressive_taxes
+
+EVICTION_POLICIES = ('lru', 'fifo')
+DEFAULT_MAXSIZE = 4096  # Default number of cached quotes
+
+
+def get_pay_constants():
+    """
+    Get the current values of the constants that the pay calculation depends on.
+
+    Returns: A tuple of TAX_RATE, TAX_RATE_PERCENTAGE, MAX_STANDARD_HOURS, and OVERTIME_RATE.
+    """
+    return core.TAX_RATE, core.TAX_RATE_PERCENTAGE, core.MAX_STANDARD_HOURS, core.OVERTIME_RATE
+
+
+def calculate_quote(hours_worked, hourly_rate, schedule=None):
+    """
+    Calculate the gross pay, taxes, and net pay without using the cache.
+
+    Args:
+        hours_worked: The number of hours worked.
+        :param hours_worked: float
+
+        hourly_rate: The hourly rate.
+        :param hourly_rate: float
+
+        schedule: The progressive tax schedule, or None for the flat TAX_RATE.
+        :param schedule: TaxSchedule
+
+    Returns: A tuple with the gross pay, taxes, and net pay.
+    """
+    gross_pay = core.calculate_gross_pay(hours_worked, hourly_rate)
+    if schedule is None:
+        tax_amount = core.calculate_taxes(gross_pay)
+    else:
+        tax_amount = calculate_progressive_taxes(gross_pay, schedule)
+    net_pay = core.calculate_net_pay(gross_pay, tax_amount)
+    return gross_pay, tax_amount, net_pay
+
+
+class QuoteCache:
+    """
+    A bounded cache of paycheck quotes keyed on (hours worked, hourly rate, tax schedule).
+
+    Args:
+        maxsize: The maximum number of quotes to keep. Must be greater than zero.
+        :param maxsize: int
+
+        policy: The eviction policy ('lru' or 'fifo').
+        :param policy: str
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, policy='lru'):
+        if maxsize <= 0:
+            raise ValueError('The cache size must be greater than zero.')
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f'Unsupported eviction policy: {policy}')
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._quotes = OrderedDict()
+        self._constants = get_pay_constants()
+
+    def __len__(self):
+        return len(self._quotes)
+
+    def get_quote(self, hours_worked, hourly_rate, schedule=None):
+        """
+        Get the gross pay, taxes, and net pay for the hours worked and hourly rate, calculating them on a miss.
+
+        Args:
+            hours_worked: The number of hours worked.
+            :param hours_worked: float | str
+
+            hourly_rate: The hourly rate.
+            :param hourly_rate: float | str
+
+            schedule: The progressive tax schedule, or None for the flat TAX_RATE.
+            :param schedule: TaxSchedule
+
+        Returns: A tuple with the gross pay, taxes, and net pay.
+        """
+        constants = get_pay_constants()
+        if constants != self._constants:
+            self.invalidate()
+            self._constants = constants
+
+        key = (float(hours_worked), float(hourly_rate), schedule)
+        quote = self._quotes.get(key)
+        if quote is not None:
+            self.hits += 1
+            if self.policy == 'lru':
+                self._quotes.move_to_end(key)
+            return quote
+
+        self.misses += 1
+        quote = calculate_quote(key[0], key[1], schedule)
+        self._quotes[key] = quote
+        if len(self._quotes) > self.maxsize:
+            self._quotes.popitem(last=False)
+            self.evictions += 1
+        return quote
+
+    def invalidate(self):
+        """
+        Remove every quote from the cache and count the invalidation. The hit and miss counters are kept.
+
+        Returns: None
+        """
+        self._quotes.clear()
+        self.invalidations += 1
+
+    def clear(self):
+        """
+        Remove every quote from the cache and reset all counters.
+
+        Returns: None
+        """
+        self._quotes.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self):
+        """
+        Get the cache counters.
+
+        Returns: A dictionary with the hits, misses, evictions, invalidations, current size, and maximum size.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self._quotes),
+            'maxsize': self.maxsize,
+        }
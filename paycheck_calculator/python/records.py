@@ -0,0 +1,56 @@
+"""
+Paycheck Calculator - Python Paycheck Records
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains the Paycheck record type of the Paycheck Calculator. The console and GUI applications used to
+pass the hours worked, hourly rate, gross pay, taxes, and net pay around as loose floats, and a batch of paychecks kept
+as one dictionary per row costs several hundred bytes per paycheck for the dictionary alone, which adds up to
+gigabytes at 10 million paychecks. A Paycheck is a named tuple: it is immutable, has no per-instance __dict__ (its
+__slots__ are empty), and is built as fast as a plain tuple, while its fields can still be read by name.
+
+For batches that are stored as columns (see PayrollColumns in columnar.py), PayrollColumns[index] returns a
+PaycheckView instead, which reads the fields from the columns without copying them.
+
+The following functions are defined in this module:
+    - calculate_paycheck(hours_worked, hourly_rate): Calculates the pay details as a Paycheck record.
+
+Example:
+    >>> from paycheck_calculator.python.records import calculate_paycheck
+    >>> calculate_paycheck(45, 20.0).net_pay
+    779.0
+"""
+
+from collections import namedtuple
+
+from .core import calculate_gross_pay, calculate_taxes, calculate_net_pay
+
+Paycheck = namedtuple('Paycheck', ['hours_worked', 'hourly_rate', 'gross_pay', 'taxes', 'net_pay'])
+Paycheck.__doc__ = """
+The pay details of one paycheck, as an immutable record without a per-instance dictionary.
+
+Attributes:
+    hours_worked: The number of hours worked.
+    hourly_rate: The hourly rate.
+    gross_pay: The gross pay.
+    taxes: The taxes.
+    net_pay: The net pay.
+"""
+
+
+def calculate_paycheck(hours_worked, hourly_rate):
+    """
+    Calculate the gross pay, taxes, and net pay as a Paycheck record.
+
+    Args:
+        hours_worked: The number of hours worked.
+        :param hours_worked: float
+
+        hourly_rate: The hourly rate.
+        :param hourly_rate: float
+
+    Returns: The Paycheck record.
+    """
+    gross_pay = calculate_gross_pay(hours_worked, hourly_rate)
+    tax_amount = calculate_taxes(gross_pay)
+    return Paycheck(hours_worked, hourly_rate, gross_pay, tax_amount, calculate_net_pay(gross_pay, tax_amount))
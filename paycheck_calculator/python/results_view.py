@@ -0,0 +1,286 @@
+"""
+Paycheck Calculator - Python Results View
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains the model behind the virtualized results grid of the Paycheck Calculator GUI. Inserting every
+imported paycheck into a ttk.Treeview creates one Tk item per row, so a 500k-row timesheet freezes the window for tens
+of seconds and keeps hundreds of megabytes of widget state alive. Instead, the GUI keeps a fixed number of Treeview
+items (one per visible line) and asks the ResultsView class which rows they should show.
+
+The ResultsView class keeps the rows in a plain list and an ordering of row indices, which is the only thing that
+sorting and filtering change. Sorting builds the key column once and sorts the indices by it, and filtering by an
+employee ID substring is incremental: when the new filter text contains the previous one (the user kept typing), only
+the rows that matched the previous filter are checked again. The lowercase employee IDs are kept in a list next to the
+rows, so a filter never lowercases the IDs again, and a filter over most of the rows first builds a match mask in row
+order and then picks the matching indices in view order with itertools.compress(). Rendering a window of rows only
+touches the rows in the window, so the redraw time does not depend on the number of loaded rows.
+
+Sorting a large view takes longer than a frame, so it can also be done on a worker thread: prepare_sort() copies
+what the sort needs and returns a function that computes the new order without touching the view, and apply_sort()
+installs the result on the main thread, unless the view changed in the meantime. The worker sorts the indices in
+chunks of SORT_CHUNK_SIZE and merges the chunks with heapq.merge(), so it never holds the GIL for long and the main
+thread keeps running while it sorts.
+
+This module has no GUI imports, so the view can also be driven and tested headlessly.
+
+Example:
+    >>> from paycheck_calculator.python.results_view import ResultsView
+    >>> view = ResultsView([('E001', 40.0, 20.0, 800.0, 144.0, 656.0), ('E002', 45.0, 20.0, 950.0, 171.0, 779.0)])
+    >>> view.sort('net_pay', descending=True)
+    >>> view.get_rows(0, 1)[0][0]
+    'E002'
+"""
+
+import heapq
+from itertools import compress
+
+COLUMNS = ('employee_id', 'hours_worked', 'hourly_rate', 'gross_pay', 'taxes', 'net_pay')
+SORT_CHUNK_SIZE = 16384  # Indices sorted at a time by sort_indices(), about 2-3 ms of holding the GIL per chunk
+
+
+def sort_indices(rows, indices, column, descending=False, chunk_size=SORT_CHUNK_SIZE):
+    """
+    Sort row indices by a column, in chunks, for use on a worker thread.
+
+    A single list.sort() holds the GIL until it is done, which would stall the main thread for the whole sort. The
+    indices are instead sorted in chunks and the chunks are merged with heapq.merge(), which runs as Python code and
+    lets the other threads run in between. The result is the same stable sort as list.sort().
+
+    Args:
+        rows: The rows.
+        :param rows: list[tuple]
+
+        indices: The row indices to sort, in their current order.
+        :param indices: list[int]
+
+        column: The column name, one of COLUMNS.
+        :param column: str
+
+        descending: True to sort from the largest to the smallest value.
+        :param descending: bool
+
+        chunk_size: The number of indices sorted at a time.
+        :param chunk_size: int
+
+    Returns: A new list of the sorted indices.
+    """
+    position = COLUMNS.index(column)
+    keys = [row[position] for row in rows]
+    key = keys.__getitem__
+    chunks = [sorted(indices[start:start + chunk_size], key=key, reverse=descending)
+              for start in range(0, len(indices), chunk_size)]
+    if len(chunks) == 1:
+        return chunks[0]
+    return list(heapq.merge(*chunks, key=key, reverse=descending))
+
+
+def filter_indices(ids, indices, text):
+    """
+    Get the row indices whose lowercase employee ID contains the filter text, keeping their order.
+
+    When most of the rows are candidates, the IDs are tested in row order into a list of booleans, and the matching
+    indices are picked with itertools.compress(), which is faster than indexing the IDs in view order. A small set of
+    candidates (e.g., the matches of the previous filter) is tested directly.
+
+    Args:
+        ids: The lowercase employee ID of each row.
+        :param ids: list[str]
+
+        indices: The candidate row indices, in view order.
+        :param indices: list[int]
+
+        text: The lowercase filter text.
+        :param text: str
+
+    Returns: A new list of the matching indices.
+    """
+    if len(indices) * 4 < len(ids):
+        return [index for index in indices if text in ids[index]]
+    mask = [text in employee_id for employee_id in ids]
+    return list(compress(indices, map(mask.__getitem__, indices)))
+
+
+class ResultsView:
+    """
+    A sorted and filtered view over a list of (employee id, hours worked, hourly rate, gross pay, taxes, net pay) rows.
+
+    Args:
+        rows: The rows of the view. The list is used as-is (not copied), and extend() and clear() update it in place.
+        :param rows: list[tuple]
+    """
+
+    def __init__(self, rows=None):
+        self.rows = [] if rows is None else rows
+        self.sort_column = None
+        self.descending = False
+        self.filter_text = ''
+        self._ids = [row[0].lower() for row in self.rows]  # The lowercase employee ID of each row, for the filter
+        self._sorted = list(range(len(self.rows)))  # Indices of all rows, in sort order
+        self.order = self._sorted  # Indices of the rows that match the filter, in sort order
+        self._version = 0  # Changed by every change to the rows or the sort order, to detect stale background sorts
+
+    def __len__(self):
+        return len(self.order)
+
+    def extend(self, rows):
+        """
+        Add rows to the view, e.g., a chunk of a running timesheet import.
+
+        New rows are added after the existing rows, even if the view is sorted. Call sort() again to sort them in.
+
+        Args:
+            rows: The rows to add.
+            :param rows: list[tuple]
+
+        Returns: None
+        """
+        start = len(self.rows)
+        self.rows.extend(rows)
+        self._ids.extend(row[0].lower() for row in rows)
+        self._version += 1
+        indices = range(start, len(self.rows))
+        self._sorted.extend(indices)
+        if self.order is not self._sorted:
+            ids = self._ids
+            text = self.filter_text
+            self.order.extend(index for index in indices if text in ids[index])
+
+    def clear(self):
+        """
+        Remove all rows from the view and reset the filter.
+
+        Returns: None
+        """
+        self.rows.clear()
+        self._ids = []  # A new list, so a running background sort keeps reading the old IDs
+        self._version += 1
+        self.filter_text = ''
+        self._sorted = []
+        self.order = self._sorted
+
+    def sort(self, column, descending=False):
+        """
+        Sort the view by a column. The sort is stable, so rows with equal values keep their previous order.
+
+        Args:
+            column: The column name, one of COLUMNS.
+            :param column: str
+
+            descending: True to sort from the largest to the smallest value.
+            :param descending: bool
+
+        Returns: None
+        """
+        position = COLUMNS.index(column)
+        keys = [row[position] for row in self.rows]
+        self._sorted.sort(key=keys.__getitem__, reverse=descending)
+        self.sort_column = column
+        self.descending = descending
+        self._version += 1
+        self._apply_filter()
+
+    def prepare_sort(self, column, descending=False):
+        """
+        Prepare a sort of the view that can run on a worker thread.
+
+        The rows, the current order, and the filter are copied here, on the calling thread, so the returned function
+        does not read the view while it runs and the view can keep being used (scrolled, filtered, or extended)
+        meanwhile.
+
+        Args:
+            column: The column name, one of COLUMNS.
+            :param column: str
+
+            descending: True to sort from the largest to the smallest value.
+            :param descending: bool
+
+        Returns: A function without arguments that computes the sort and returns the result to pass to apply_sort().
+        """
+        rows = list(self.rows)
+        ids = self._ids  # Only appended to or replaced, never changed in place, so it does not need a copy
+        indices = list(self._sorted)
+        text = self.filter_text
+        version = self._version
+
+        def compute():
+            sorted_indices = sort_indices(rows, indices, column, descending)
+            order = filter_indices(ids, sorted_indices, text) if text else None
+            return version, column, descending, sorted_indices, text, order
+
+        return compute
+
+    def apply_sort(self, result):
+        """
+        Apply a sort computed by the function from prepare_sort().
+
+        The result is discarded if the rows or the sort order changed since prepare_sort() was called. If only the
+        filter changed, the new filter is applied to the sorted rows.
+
+        Args:
+            result: The result of the function from prepare_sort().
+            :param result: tuple
+
+        Returns: True if the sort was applied, False if it was discarded.
+        """
+        version, column, descending, sorted_indices, text, order = result
+        if version != self._version:
+            return False
+
+        self._sorted = sorted_indices
+        self.sort_column = column
+        self.descending = descending
+        self._version += 1
+        if text == self.filter_text and order is not None:
+            self.order = order
+        else:
+            self._apply_filter()
+        return True
+
+    def _apply_filter(self):
+        """
+        Rebuild the filtered order from the sorted order.
+
+        Returns: None
+        """
+        if self.filter_text:
+            self.order = filter_indices(self._ids, self._sorted, self.filter_text)
+        else:
+            self.order = self._sorted
+
+    def filter(self, text):
+        """
+        Only show the rows whose employee ID contains the text (case-insensitive).
+
+        Args:
+            text: The filter text. An empty string shows all rows.
+            :param text: str
+
+        Returns: None
+        """
+        text = text.strip().lower()
+        if text == self.filter_text:
+            return
+
+        if not text:
+            self.order = self._sorted
+        else:
+            candidates = self.order if self.filter_text in text else self._sorted
+            self.order = filter_indices(self._ids, candidates, text)
+        self.filter_text = text
+
+    def get_rows(self, start, count):
+        """
+        Get a window of the rows in view order.
+
+        Args:
+            start: The position of the first row in the view.
+            :param start: int
+
+            count: The maximum number of rows.
+            :param count: int
+
+        Returns: A list of at most count rows.
+        """
+        rows = self.rows
+        return [rows[index] for index in self.order[start:start + count]]
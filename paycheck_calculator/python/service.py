@@ -0,0 +1,531 @@
+"""
+Paycheck Calculator - Python Quote Service
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a local JSON quote service for the Paycheck Calculator, built on asyncio and the standard library
+(plus NumPy for the batch engine). Internal tools can request paycheck quotes over HTTP instead of starting the
+console application for every quote.
+
+Concurrent requests are collected into small batches by the QuoteBatcher: the first request of a batch waits at most
+a short time window (2 ms by default) for more requests to arrive, and the whole batch is then calculated in one pass
+with calculate_pay_batch(). The service keeps latency histograms of the requests and of the batch sizes.
+
+Endpoints:
+    - POST /quote: Calculates one quote. The body is a JSON object with 'hours_worked' and 'hourly_rate', and the
+      response has the hours worked, hourly rate, gross pay, taxes, and net pay. Invalid or non-finite input returns
+      status 400.
+    - GET /metrics: Returns the request latency histogram, the batch size histogram, and the request counters.
+    - GET /health: Returns {"status": "ok"}.
+
+Malformed requests (e.g., an invalid Content-Length header) get a JSON 400 response, and unexpected errors while
+handling a request get a JSON 500 response, so a client always gets an answer instead of a dropped connection.
+
+Usage (from the repository root):
+    python -m paycheck_calculator.python.service --port 8765
+    python -m paycheck_calculator.python.service_load --port 8765 --requests 10000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from bisect import bisect_left
+
+from .batch import calculate_pay_batch
+from .core import is_valid_input, is_valid_float_greater_than_zero
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_BATCH_SIZE = 256  # Maximum quotes per batch
+DEFAULT_BATCH_WINDOW = 0.002  # Seconds the first quote of a batch waits for more quotes
+LATENCY_BUCKETS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000]
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class Histogram:
+    """
+    A histogram with fixed bucket upper bounds, plus a count, sum, and maximum.
+
+    Args:
+        bounds: The upper bound of each bucket, in increasing order. Values above the last bound go to an overflow
+            bucket.
+        :param bounds: list[float]
+    """
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, value):
+        """
+        Add a value to the histogram.
+
+        Args:
+            value: The value to add.
+            :param value: float
+
+        Returns: None
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, fraction):
+        """
+        Estimate a quantile as the upper bound of the bucket that contains it.
+
+        Args:
+            fraction: The quantile, between 0 and 1 (e.g., 0.99 for the 99th percentile).
+            :param fraction: float
+
+        Returns: The estimated quantile, or 0 if the histogram is empty.
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            if running >= target:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def snapshot(self):
+        """
+        Get the histogram as a JSON-serializable dictionary.
+
+        Returns: A dictionary with the buckets, count, sum, mean, maximum, and estimated percentiles.
+        """
+        buckets = [{'le': bound, 'count': count} for bound, count in zip(self.bounds, self.counts)]
+        buckets.append({'le': 'inf', 'count': self.counts[-1]})
+        return {
+            'buckets': buckets,
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.maximum,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
+class QuoteBatcher:
+    """
+    Collects concurrent quote requests into small batches and calculates each batch in one pass.
+
+    Args:
+        max_batch_size: The maximum number of quotes per batch.
+        :param max_batch_size: int
+
+        max_delay: The maximum time in seconds that the first quote of a batch waits for more quotes.
+        :param max_delay: float
+    """
+
+    def __init__(self, max_batch_size=DEFAULT_BATCH_SIZE, max_delay=DEFAULT_BATCH_WINDOW):
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        """
+        Start the background task that calculates the batches.
+
+        Returns: None
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the background task.
+
+        Returns: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def quote(self, hours_worked, hourly_rate):
+        """
+        Calculate a quote as part of the next batch.
+
+        Args:
+            hours_worked: The number of hours worked.
+            :param hours_worked: float
+
+            hourly_rate: The hourly rate.
+            :param hourly_rate: float
+
+        Returns: A tuple with the gross pay, taxes, and net pay.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((hours_worked, hourly_rate, future))
+        return await future
+
+    async def _collect(self):
+        """
+        Wait for the first quote and then collect more until the batch is full or the time window has passed.
+
+        Returns: A list of (hours worked, hourly rate, future) tuples.
+        """
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        """
+        Calculate the batches until the task is cancelled.
+
+        Returns: None
+        """
+        while True:
+            batch = await self._collect()
+            self.batch_sizes.observe(len(batch))
+            try:
+                gross_pay, taxes, net_pay = calculate_pay_batch([item[0] for item in batch],
+                                                                [item[1] for item in batch])
+            except Exception as error:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for index, (_, _, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result((float(gross_pay[index]), float(taxes[index]), float(net_pay[index])))
+
+
+def parse_quote_request(body):
+    """
+    Parse and validate the JSON body of a quote request.
+
+    The hours worked and hourly rate are validated with the same rules as the console application, and must also be
+    finite (the console rules accept 'inf', which cannot be serialized as standard JSON).
+
+    Args:
+        body: The request body.
+        :param body: bytes
+
+    Returns: A tuple with the hours worked and hourly rate as floats.
+    """
+    try:
+        data = json.loads(body or b'null')
+    except ValueError:
+        raise ValueError('The request body must be a JSON object.') from None
+    if not isinstance(data, dict):
+        raise ValueError('The request body must be a JSON object.')
+
+    values = []
+    for field in ('hours_worked', 'hourly_rate'):
+        value = data.get(field)
+        value = '' if value is None else str(value).strip()
+        if not (is_valid_input(value) and is_valid_float_greater_than_zero(value) and math.isfinite(float(value))):
+            raise ValueError(f'Invalid {field}: {value!r}')
+        values.append(float(value))
+    return tuple(values)
+
+
+class QuoteService:
+    """
+    A local HTTP/1.1 JSON service for paycheck quotes, with request micro-batching and latency histograms.
+
+    Args:
+        max_batch_size: The maximum number of quotes per batch.
+        :param max_batch_size: int
+
+        max_delay: The maximum time in seconds that the first quote of a batch waits for more quotes.
+        :param max_delay: float
+    """
+
+    def __init__(self, max_batch_size=DEFAULT_BATCH_SIZE, max_delay=DEFAULT_BATCH_WINDOW):
+        self.batcher = QuoteBatcher(max_batch_size, max_delay)
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.requests = 0
+        self.errors = 0
+        self._server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Start the batcher and listen for connections.
+
+        Args:
+            host: The host to listen on.
+            :param host: str
+
+            port: The port to listen on, or 0 for any free port.
+            :param port: int
+
+        Returns: The (host, port) address the service is listening on.
+        """
+        self.batcher.start()
+        self._server = await asyncio.start_server(self.handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        """
+        Stop listening and stop the batcher.
+
+        Returns: None
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def serve_forever(self):
+        """
+        Serve requests until the task is cancelled.
+
+        Returns: None
+        """
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Handle the requests of one connection. Connections are kept alive until the client closes them or sends
+        'Connection: close'.
+
+        A request with an invalid Content-Length header or an overlong request line or header gets a 400 response and
+        the connection is closed, since the rest of the stream cannot be parsed. Any other error while handling a
+        request gets a 500 response.
+
+        Args:
+            reader: The stream reader of the connection.
+            :param reader: asyncio.StreamReader
+
+            writer: The stream writer of the connection.
+            :param writer: asyncio.StreamWriter
+
+        Returns: None
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    message = f"Invalid Content-Length: {headers['content-length']!r}"
+                    await self.write_response(writer, *self.error(400, message), False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                start = time.perf_counter()
+                method, path, *_ = request_line.decode('latin-1').split() + ['', '']
+                try:
+                    status, payload = await self.handle_request(method, path, body)
+                    data = json.dumps(payload, allow_nan=False).encode('utf-8')
+                except Exception:
+                    status, payload = self.error(500, 'Internal server error.')
+                    data = json.dumps(payload).encode('utf-8')
+                self.latency_ms.observe((time.perf_counter() - start) * 1000)
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self.write_response(writer, status, data, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ValueError:
+            # StreamReader.readline() raises ValueError for a line longer than the stream limit.
+            try:
+                await self.write_response(writer, *self.error(400, 'The request line or a header is too long.'), False)
+            except ConnectionError:
+                pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def write_response(self, writer, status, payload, keep_alive):
+        """
+        Write an HTTP response with a JSON body.
+
+        Args:
+            writer: The stream writer of the connection.
+            :param writer: asyncio.StreamWriter
+
+            status: The HTTP status code.
+            :param status: int
+
+            payload: The JSON-serializable response, or the already encoded JSON body.
+            :param payload: dict | bytes
+
+            keep_alive: True to keep the connection open for more requests.
+            :param keep_alive: bool
+
+        Returns: None
+        """
+        data = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+        writer.write(f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+                     f'Content-Type: application/json\r\n'
+                     f'Content-Length: {len(data)}\r\n'
+                     f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1') + data)
+        await writer.drain()
+
+    async def handle_request(self, method, path, body):
+        """
+        Route a request to its endpoint.
+
+        Args:
+            method: The HTTP method.
+            :param method: str
+
+            path: The request path.
+            :param path: str
+
+            body: The request body.
+            :param body: bytes
+
+        Returns: A tuple with the HTTP status code and the JSON-serializable response.
+        """
+        self.requests += 1
+        if path == '/quote':
+            if method != 'POST':
+                return self.error(405, 'Use POST for /quote.')
+            try:
+                hours_worked, hourly_rate = parse_quote_request(body)
+            except ValueError as error:
+                return self.error(400, str(error))
+            gross_pay, taxes, net_pay = await self.batcher.quote(hours_worked, hourly_rate)
+            if not all(map(math.isfinite, (gross_pay, taxes, net_pay))):
+                return self.error(400, 'The quote is out of range.')
+            return 200, {
+                'hours_worked': hours_worked,
+                'hourly_rate': hourly_rate,
+                'gross_pay': gross_pay,
+                'taxes': taxes,
+                'net_pay': net_pay,
+            }
+        elif path == '/metrics':
+            return 200, self.metrics()
+        elif path == '/health':
+            return 200, {'status': 'ok'}
+        return self.error(404, f'Unknown path: {path}')
+
+    def error(self, status, message):
+        """
+        Count an error and build its response.
+
+        Args:
+            status: The HTTP status code.
+            :param status: int
+
+            message: The error message.
+            :param message: str
+
+        Returns: A tuple with the HTTP status code and the error response.
+        """
+        self.errors += 1
+        return status, {'error': message}
+
+    def metrics(self):
+        """
+        Get the service metrics.
+
+        Returns: A dictionary with the request counters, the latency histogram (in milliseconds), and the batch size
+        histogram.
+        """
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'latency_ms': self.latency_ms.snapshot(),
+            'batch_size': self.batcher.batch_sizes.snapshot(),
+        }
+
+
+async def serve(host, port, max_batch_size, max_delay):
+    """
+    Run the quote service until it is interrupted.
+
+    Args:
+        host: The host to listen on.
+        :param host: str
+
+        port: The port to listen on.
+        :param port: int
+
+        max_batch_size: The maximum number of quotes per batch.
+        :param max_batch_size: int
+
+        max_delay: The maximum time in seconds that the first quote of a batch waits for more quotes.
+        :param max_delay: float
+
+    Returns: None
+    """
+    service = QuoteService(max_batch_size, max_delay)
+    host, port = await service.start(host, port)
+    print(f'Paycheck quote service listening on http://{host}:{port}', flush=True)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    """
+    Command line entry point for the quote service.
+
+    Args:
+        argv: The command line arguments, without the program name. Defaults to sys.argv[1:].
+        :param argv: list[str]
+
+    Returns: None
+    """
+    parser = argparse.ArgumentParser(description='Serve paycheck quotes over HTTP on localhost.')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='The host to listen on.')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='The port to listen on.')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Maximum quotes per batch.')
+    parser.add_argument('--batch-window-ms', type=float, default=DEFAULT_BATCH_WINDOW * 1000,
+                        help='Milliseconds the first quote of a batch waits for more quotes.')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.batch_size, args.batch_window_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+Paycheck Calculator - Python Quote Service Load Generator
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a load-generator client for the quote service in service.py. It opens a number of concurrent
+keep-alive connections to the service and sends POST /quote requests with a synthetic mix of hours worked and hourly
+rates, then reports the throughput and the client-side latency percentiles as JSON, together with the service's own
+/metrics. With --spawn-server, the service is started in the same process on a free localhost port, so the whole test
+runs on localhost without any setup.
+
+Usage (from the repository root):
+    python -m paycheck_calculator.python.service_load --spawn-server --requests 10000 --concurrency 64
+    python -m paycheck_calculator.python.service_load --port 8765 --requests 10000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from .service import DEFAULT_HOST, DEFAULT_PORT, QuoteService
+
+
+async def send_request(reader, writer, method, path, payload=None):
+    """
+    Send one HTTP/1.1 request on a keep-alive connection and read the response.
+
+    Args:
+        reader: The stream reader of the connection.
+        :param reader: asyncio.StreamReader
+
+        writer: The stream writer of the connection.
+        :param writer: asyncio.StreamWriter
+
+        method: The HTTP method.
+        :param method: str
+
+        path: The request path.
+        :param path: str
+
+        payload: The JSON-serializable request body, if any.
+        :param payload: object
+
+    Returns: A tuple with the HTTP status code and the decoded JSON response.
+    """
+    body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+    writer.write(f'{method} {path} HTTP/1.1\r\n'
+                 f'Host: localhost\r\n'
+                 f'Content-Type: application/json\r\n'
+                 f'Content-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if not line.strip():
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+def percentile(sorted_values, fraction):
+    """
+    Get a percentile of sorted values with the nearest-rank method.
+
+    Args:
+        sorted_values: The values, in increasing order.
+        :param sorted_values: list[float]
+
+        fraction: The percentile, between 0 and 1.
+        :param fraction: float
+
+    Returns: The percentile, or 0 if there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_load(host, port, requests, concurrency, seed=0):
+    """
+    Send quote requests to the service over concurrent keep-alive connections.
+
+    Args:
+        host: The host of the service.
+        :param host: str
+
+        port: The port of the service.
+        :param port: int
+
+        requests: The total number of quote requests.
+        :param requests: int
+
+        concurrency: The number of concurrent connections.
+        :param concurrency: int
+
+        seed: The random seed of the hours worked and hourly rates.
+        :param seed: int
+
+    Returns: A dictionary with the request counts, throughput, client latency percentiles, and service metrics.
+    """
+    generator = random.Random(seed)
+    payloads = [{'hours_worked': round(generator.uniform(1, 80), 2),
+                 'hourly_rate': round(generator.uniform(10, 200), 2)}
+                for _ in range(requests)]
+    latencies_ms = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while next_index < len(payloads):
+                payload = payloads[next_index]
+                next_index += 1
+                start = time.perf_counter()
+                status, _ = await send_request(reader, writer, 'POST', '/quote', payload)
+                latencies_ms.append((time.perf_counter() - start) * 1000)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, metrics = await send_request(reader, writer, 'GET', '/metrics')
+    finally:
+        writer.close()
+
+    latencies_ms.sort()
+    return {
+        'requests': len(latencies_ms),
+        'errors': errors,
+        'concurrency': concurrency,
+        'seconds': elapsed,
+        'requests_per_second': len(latencies_ms) / elapsed if elapsed else 0.0,
+        'latency_ms': {
+            'p50': percentile(latencies_ms, 0.5),
+            'p95': percentile(latencies_ms, 0.95),
+            'p99': percentile(latencies_ms, 0.99),
+            'max': latencies_ms[-1] if latencies_ms else 0.0,
+        },
+        'service': metrics,
+    }
+
+
+async def run_with_server(requests, concurrency, seed=0):
+    """
+    Start the quote service on a free localhost port, run the load against it, and stop it.
+
+    Args:
+        requests: The total number of quote requests.
+        :param requests: int
+
+        concurrency: The number of concurrent connections.
+        :param concurrency: int
+
+        seed: The random seed of the hours worked and hourly rates.
+        :param seed: int
+
+    Returns: The load report from run_load().
+    """
+    service = QuoteService()
+    host, port = await service.start(DEFAULT_HOST, 0)
+    try:
+        return await run_load(host, port, requests, concurrency, seed)
+    finally:
+        await service.stop()
+
+
+def main(argv=None):
+    """
+    Command line entry point for the load generator.
+
+    Args:
+        argv: The command line arguments, without the program name. Defaults to sys.argv[1:].
+        :param argv: list[str]
+
+    Returns: None
+    """
+    parser = argparse.ArgumentParser(description='Generate load against the paycheck quote service.')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='The host of the service.')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='The port of the service.')
+    parser.add_argument('--requests', type=int, default=10000, help='The total number of quote requests.')
+    parser.add_argument('--concurrency', type=int, default=64, help='The number of concurrent connections.')
+    parser.add_argument('--seed', type=int, default=0, help='The random seed of the request mix.')
+    parser.add_argument('--spawn-server', action='store_true',
+                        help='Start the service in this process on a free localhost port.')
+    args = parser.parse_args(argv)
+
+    if args.spawn_server:
+        report = asyncio.run(run_with_server(args.requests, args.concurrency, args.seed))
+    else:
+        report = asyncio.run(run_load(args.host, args.port, args.requests, args.concurrency, args.seed))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,294 @@
+"""
+Paycheck Calculator - Python Timesheet Streaming
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a streaming mode for the Paycheck Calculator. Instead of prompting for a single hours worked and
+hourly rate pair, it reads a timesheet export of employee rows from a file (or standard input) and calculates the pay
+details for every row. The timesheet can be a CSV file with a header row or a JSON Lines (JSONL) file with one JSON
+object per line. Each row must contain the 'hours_worked' and 'hourly_rate' fields, and may contain an 'employee_id'.
+
+The rows flow through a pipeline of generators: parse -> validate -> compute -> emit. Only one row is held in memory
+at a time, so memory use stays flat no matter how many rows the timesheet has. Rows are validated with the same rules
+as the console application, using parse_value() from validation.py so each value is parsed only once, and invalid rows
+are written to a separate reject stream together with the line number and the reason, instead of stopping the run.
+
+The following functions are defined in this module:
+    - detect_format(path): Determines the timesheet format from the file extension.
+    - parse_csv_rows(lines): Parses CSV lines into (line number, row) pairs.
+    - parse_jsonl_rows(lines): Parses JSON Lines into (line number, row) pairs.
+    - parse_rows(lines, input_format): Parses the lines with the parser for the given format.
+    - validate_rows(rows, on_reject): Validates the parsed rows and passes the invalid rows to on_reject.
+    - compute_rows(rows): Calculates the gross pay, taxes, and net pay for each validated row.
+    - format_amount(amount): Formats a pay amount with two decimal places.
+    - process_timesheet(lines, output, rejects, input_format): Runs the full pipeline and writes the results.
+    - main(argv): Command line entry point for the streaming mode.
+
+Usage (from the repository root):
+    python -m paycheck_calculator.python.stream timesheet.csv --output pay.csv --rejects rejects.csv
+    cat timesheet.jsonl | python -m paycheck_calculator.python.stream - --format jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from .core import (
+    calculate_gross_pay,
+    calculate_taxes,
+    calculate_net_pay,
+)
+from .validation import MISSING, parse_value
+
+INPUT_FORMATS = ('csv', 'jsonl')
+REQUIRED_FIELDS = ('hours_worked', 'hourly_rate')
+OUTPUT_FIELDS = ['employee_id', 'hours_worked', 'hourly_rate', 'gross_pay', 'taxes', 'net_pay']
+REJECT_FIELDS = ['line_number', 'reason', 'row']
+
+
+def detect_format(path):
+    """
+    Determine the timesheet format from the file extension.
+
+    Files ending in '.jsonl' or '.ndjson' are read as JSON Lines, and everything else (including standard input) is
+    read as CSV.
+
+    Args:
+        path: The path of the timesheet file, or '-' for standard input.
+        :param path: str
+
+    Returns: The timesheet format ('csv' or 'jsonl').
+    """
+    return 'jsonl' if path.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def parse_csv_rows(lines):
+    """
+    Parse CSV lines into (line number, row) pairs.
+
+    The first line must be the header row. Each following line is yielded as a dictionary keyed by the header names.
+
+    Args:
+        lines: An iterable of CSV lines (e.g., an open file).
+        :param lines: iterable[str]
+
+    Returns: A generator of (line number, row) pairs, where row is a dictionary.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def parse_jsonl_rows(lines):
+    """
+    Parse JSON Lines into (line number, row) pairs.
+
+    Blank lines are skipped. Lines that are not valid JSON objects are yielded with the error message in place of the
+    row, so they can be rejected by validate_rows().
+
+    Args:
+        lines: An iterable of JSON Lines (e.g., an open file).
+        :param lines: iterable[str]
+
+    Returns: A generator of (line number, row) pairs, where row is a dictionary or an error message.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            yield line_number, f'Invalid JSON: {error}'
+            continue
+        if isinstance(row, dict):
+            yield line_number, row
+        else:
+            yield line_number, 'Invalid JSON: expected an object'
+
+
+def parse_rows(lines, input_format='csv'):
+    """
+    Parse the lines with the parser for the given format.
+
+    Args:
+        lines: An iterable of timesheet lines.
+        :param lines: iterable[str]
+
+        input_format: The timesheet format ('csv' or 'jsonl').
+        :param input_format: str
+
+    Returns: A generator of (line number, row) pairs.
+    """
+    if input_format == 'csv':
+        return parse_csv_rows(lines)
+    elif input_format == 'jsonl':
+        return parse_jsonl_rows(lines)
+    else:
+        raise ValueError(f'Unsupported input format: {input_format}')
+
+
+def validate_rows(rows, on_reject):
+    """
+    Validate the parsed rows and pass the invalid rows to on_reject.
+
+    Each row must have an hours worked value and an hourly rate that are finite floats greater than zero, which are
+    the same rules used by the console application and the quote service. Valid rows are yielded as (line number,
+    employee id, hours worked, hourly rate) tuples, with the values converted to floats and the employee id converted
+    to a string ('' if it is missing or null, since JSON Lines rows can have numeric or null ids). Invalid rows are
+    passed to on_reject as (line number, reason, row) and are not yielded.
+
+    Args:
+        rows: An iterable of (line number, row) pairs from one of the parsers.
+        :param rows: iterable[tuple]
+
+        on_reject: The function called for each invalid row.
+        :param on_reject: function
+
+    Returns: A generator of (line number, employee id, hours worked, hourly rate) tuples.
+    """
+    for line_number, row in rows:
+        if not isinstance(row, dict):
+            on_reject(line_number, row, None)
+            continue
+
+        values = []
+        for field in REQUIRED_FIELDS:
+            value = row.get(field)
+            number, reason = parse_value(value)
+            if reason == MISSING:
+                on_reject(line_number, f'Missing {field}', row)
+                break
+            if reason is not None:
+                on_reject(line_number, f'Invalid {field}: {str(value).strip()}', row)
+                break
+            values.append(number)
+        else:
+            hours_worked, hourly_rate = values
+            employee_id = row.get('employee_id')
+            yield line_number, '' if employee_id is None else str(employee_id), hours_worked, hourly_rate
+
+
+def compute_rows(rows):
+    """
+    Calculate the gross pay, taxes, and net pay for each validated row.
+
+    Args:
+        rows: An iterable of (line number, employee id, hours worked, hourly rate) tuples from validate_rows().
+        :param rows: iterable[tuple]
+
+    Returns: A generator of (employee id, hours worked, hourly rate, gross pay, taxes, net pay) tuples.
+    """
+    for _, employee_id, hours_worked, hourly_rate in rows:
+        gross_pay = calculate_gross_pay(hours_worked, hourly_rate)
+        tax_amount = calculate_taxes(gross_pay)
+        net_pay = calculate_net_pay(gross_pay, tax_amount)
+        yield employee_id, hours_worked, hourly_rate, gross_pay, tax_amount, net_pay
+
+
+def format_amount(amount):
+    """
+    Format a pay amount with two decimal places, the same precision used by display_pay_details().
+
+    Args:
+        amount: The pay amount.
+        :param amount: float
+
+    Returns: The formatted amount (e.g., '1234.50').
+    """
+    return f'{amount:.2f}'
+
+
+def process_timesheet(lines, output, rejects=None, input_format='csv'):
+    """
+    Run the full pipeline over a timesheet and write the results.
+
+    The results are written to output as CSV with the columns in OUTPUT_FIELDS. If rejects is given, the invalid rows
+    are written to it as CSV with the columns in REJECT_FIELDS, otherwise they are only counted.
+
+    Args:
+        lines: An iterable of timesheet lines (e.g., an open file).
+        :param lines: iterable[str]
+
+        output: The text stream to write the results to.
+        :param output: io.TextIOBase
+
+        rejects: The text stream to write the invalid rows to.
+        :param rejects: io.TextIOBase
+
+        input_format: The timesheet format ('csv' or 'jsonl').
+        :param input_format: str
+
+    Returns: A tuple with the number of processed rows and the number of rejected rows.
+    """
+    rejected = 0
+    reject_writer = None
+    if rejects is not None:
+        reject_writer = csv.writer(rejects)
+        reject_writer.writerow(REJECT_FIELDS)
+
+    def on_reject(line_number, reason, row):
+        nonlocal rejected
+        rejected += 1
+        if reject_writer is not None:
+            reject_writer.writerow([line_number, reason, '' if row is None else json.dumps(row)])
+
+    writer = csv.writer(output)
+    writer.writerow(OUTPUT_FIELDS)
+
+    processed = 0
+    for employee_id, hours_worked, hourly_rate, gross_pay, tax_amount, net_pay in compute_rows(
+            validate_rows(parse_rows(lines, input_format), on_reject)):
+        writer.writerow([employee_id, hours_worked, hourly_rate,
+                         format_amount(gross_pay), format_amount(tax_amount), format_amount(net_pay)])
+        processed += 1
+
+    return processed, rejected
+
+
+def main(argv=None):
+    """
+    Command line entry point for the streaming mode.
+
+    Args:
+        argv: The command line arguments, without the program name. Defaults to sys.argv[1:].
+        :param argv: list[str]
+
+    Returns: The exit status (0 if every row was processed, 1 if any row was rejected). A file that cannot be opened
+    is reported as a usage error, with exit status 2.
+    """
+    parser = argparse.ArgumentParser(description='Calculate the pay details for every row of a timesheet.')
+    parser.add_argument('input', nargs='?', default='-', help="The timesheet file, or '-' for standard input.")
+    parser.add_argument('--format', choices=INPUT_FORMATS, help='The timesheet format (default: from the extension).')
+    parser.add_argument('--output', default='-', help="The results file, or '-' for standard output.")
+    parser.add_argument('--rejects', default='-', help="The rejected rows file, or '-' for standard error.")
+    args = parser.parse_args(argv)
+
+    input_format = args.format or detect_format(args.input)
+    opened = []
+
+    def open_file(path, mode):
+        stream = open(path, mode, newline='', encoding='utf-8')
+        opened.append(stream)
+        return stream
+
+    try:
+        lines = sys.stdin if args.input == '-' else open_file(args.input, 'r')
+        output = sys.stdout if args.output == '-' else open_file(args.output, 'w')
+        rejects = sys.stderr if args.rejects == '-' else open_file(args.rejects, 'w')
+    except OSError as error:
+        for stream in opened:
+            stream.close()
+        parser.error(f"cannot open '{error.filename}': {error.strerror}")
+
+    try:
+        processed, rejected = process_timesheet(lines, output, rejects, input_format)
+    finally:
+        for stream in opened:
+            stream.close()
+
+    return 1 if rejected else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""
+Paycheck Calculator - Python What-If Sweep
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a what-if sensitivity grid for the Paycheck Calculator. Planning often needs a table of the net
+pay (or gross pay, or taxes) for every combination of a range of hours worked and a range of hourly rates, e.g., 0 to
+80 hours in 0.25-hour steps by $10.00 to $200.00 in 1-cent steps, which is more than 6 million cells. Instead of
+calling calculate_gross_pay() and calculate_taxes() once per cell, the sweep broadcasts a column of hours against a
+row of rates and calculates the whole grid with the batch engine (batch.py) in one pass, so the values match the
+scalar functions exactly.
+
+Grids can be written as a .npy file, which numpy.load(path, mmap_mode='r') maps into memory without reading it, or as
+a CSV table with one row per number of hours and one column per hourly rate. In streaming mode, the grid is
+calculated and written a block of rows at a time (into a memory-mapped .npy file, or as chunks of CSV rows), so grids
+that are much larger than the available memory can still be written.
+
+Usage (from the repository root):
+    python -m paycheck_calculator.python.sweep --hours 0:80:0.25 --rates 10:200:0.01 --output grid.npy
+    python -m paycheck_calculator.python.sweep --hours 0:80:0.25 --rates 10:20:0.25 --format csv --output grid.csv
+    python -m paycheck_calculator.python.sweep --hours 0:80:0.01 --rates 10:200:0.01 --stream --output grid.npy
+
+Example:
+    >>> from paycheck_calculator.python.sweep import calculate_sweep, make_axis
+    >>> grid = calculate_sweep(make_axis(0, 80, 0.25), make_axis(10, 200, 0.01), 'net_pay')
+    >>> grid.shape
+    (321, 19001)
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from .batch import as_float_array, calculate_pay_batch
+
+SWEEP_FIELDS = ('gross_pay', 'taxes', 'net_pay')
+OUTPUT_FORMATS = ('npy', 'csv')
+DEFAULT_BLOCK_ROWS = 64  # Rows of hours calculated and written at a time in streaming mode
+
+
+def make_axis(start, stop, step):
+    """
+    Make an axis of evenly spaced values from start to stop, inclusive.
+
+    Every value is calculated as start + index * step, so rounding errors do not accumulate along the axis, and the
+    values are rounded to 10 decimal places so that, e.g., 10 + 7 * 0.01 is exactly 10.07.
+
+    Args:
+        start: The first value.
+        :param start: float
+
+        stop: The last value. It is included if it is a whole number of steps from start.
+        :param stop: float
+
+        step: The distance between two values. Must be greater than zero.
+        :param step: float
+
+    Returns: A float64 array with the values of the axis.
+    """
+    if step <= 0:
+        raise ValueError('The step must be greater than zero.')
+    if stop < start:
+        raise ValueError('The stop value must not be less than the start value.')
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return np.round(start + np.arange(count) * step, 10)
+
+
+def parse_axis(text):
+    """
+    Parse an axis given on the command line as 'start:stop:step'.
+
+    Args:
+        text: The axis, e.g., '0:80:0.25'.
+        :param text: str
+
+    Returns: A float64 array with the values of the axis.
+    """
+    try:
+        start, stop, step = (float(value) for value in text.split(':'))
+        return make_axis(start, stop, step)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid axis '{text}' (expected start:stop:step): {error}") from None
+
+
+def calculate_sweep(hours_worked, hourly_rates, field='net_pay'):
+    """
+    Calculate a field of the pay details for every combination of hours worked and hourly rate.
+
+    Args:
+        hours_worked: The hours worked axis (the rows of the grid).
+        :param hours_worked: array-like
+
+        hourly_rates: The hourly rate axis (the columns of the grid).
+        :param hourly_rates: array-like
+
+        field: The field of the pay details, one of SWEEP_FIELDS.
+        :param field: str
+
+    Returns: A float64 array of shape (len(hours_worked), len(hourly_rates)).
+    """
+    if field not in SWEEP_FIELDS:
+        raise ValueError(f'Unknown sweep field: {field}')
+    hours_worked = as_float_array(hours_worked)
+    hourly_rates = as_float_array(hourly_rates)
+    return calculate_pay_batch(hours_worked[:, np.newaxis], hourly_rates[np.newaxis, :])[SWEEP_FIELDS.index(field)]
+
+
+def iter_sweep_blocks(hours_worked, hourly_rates, field='net_pay', block_rows=DEFAULT_BLOCK_ROWS):
+    """
+    Calculate a sweep grid one block of rows at a time.
+
+    Args:
+        hours_worked: The hours worked axis (the rows of the grid).
+        :param hours_worked: array-like
+
+        hourly_rates: The hourly rate axis (the columns of the grid).
+        :param hourly_rates: array-like
+
+        field: The field of the pay details, one of SWEEP_FIELDS.
+        :param field: str
+
+        block_rows: The number of rows per block (at least 1).
+        :param block_rows: int
+
+    Returns: A generator of (first row, block) tuples, where each block has at most block_rows rows.
+    """
+    if block_rows < 1:
+        raise ValueError('The number of rows per block must be at least 1.')
+    hours_worked = as_float_array(hours_worked)
+    return ((start, calculate_sweep(hours_worked[start:start + block_rows], hourly_rates, field))
+            for start in range(0, len(hours_worked), block_rows))
+
+
+def write_sweep_npy(path, hours_worked, hourly_rates, field='net_pay', block_rows=DEFAULT_BLOCK_ROWS):
+    """
+    Write a sweep grid to a .npy file one block of rows at a time, without holding the whole grid in memory.
+
+    The file is created with its final size and mapped into memory, and each block is written into its rows.
+
+    Args:
+        path: The path of the .npy file.
+        :param path: str
+
+        hours_worked: The hours worked axis (the rows of the grid).
+        :param hours_worked: array-like
+
+        hourly_rates: The hourly rate axis (the columns of the grid).
+        :param hourly_rates: array-like
+
+        field: The field of the pay details, one of SWEEP_FIELDS.
+        :param field: str
+
+        block_rows: The number of rows per block (at least 1).
+        :param block_rows: int
+
+    Returns: None
+    """
+    blocks = iter_sweep_blocks(hours_worked, hourly_rates, field, block_rows)
+    shape = (len(hours_worked), len(hourly_rates))
+    grid = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=shape)
+    for start, block in blocks:
+        grid[start:start + len(block)] = block
+    grid.flush()
+    del grid
+
+
+def write_sweep_csv(output, hours_worked, hourly_rates, field='net_pay', block_rows=DEFAULT_BLOCK_ROWS):
+    """
+    Write a sweep grid as a CSV table, one block of rows at a time.
+
+    The header row is 'hours_worked' followed by the hourly rates, and every other row is a number of hours worked
+    followed by the field of the pay details for each hourly rate, rounded to the nearest cent.
+
+    Args:
+        output: The text stream to write the table to.
+        :param output: io.TextIOBase
+
+        hours_worked: The hours worked axis (the rows of the grid).
+        :param hours_worked: array-like
+
+        hourly_rates: The hourly rate axis (the columns of the grid).
+        :param hourly_rates: array-like
+
+        field: The field of the pay details, one of SWEEP_FIELDS.
+        :param field: str
+
+        block_rows: The number of rows per block (at least 1).
+        :param block_rows: int
+
+    Returns: None
+    """
+    hours_worked = as_float_array(hours_worked)
+    blocks = iter_sweep_blocks(hours_worked, hourly_rates, field, block_rows)
+    output.write(','.join(['hours_worked'] + [f'{rate:.2f}' for rate in hourly_rates]) + '\n')
+    for start, block in blocks:
+        rows = np.column_stack((hours_worked[start:start + len(block)], block))
+        np.savetxt(output, rows, fmt='%.2f', delimiter=',')
+
+
+def main(argv=None):
+    """
+    Command line entry point for sweeps.
+
+    Args:
+        argv: The command line arguments, without the program name. Defaults to sys.argv[1:].
+        :param argv: list[str]
+
+    Returns: The exit status (0 on success). An output file that cannot be opened is reported as a usage error, with
+    exit status 2.
+    """
+    parser = argparse.ArgumentParser(description='Calculate a what-if grid of the pay details over hours and rates.')
+    parser.add_argument('--hours', type=parse_axis, required=True, help="The hours worked axis, as 'start:stop:step'.")
+    parser.add_argument('--rates', type=parse_axis, required=True, help="The hourly rate axis, as 'start:stop:step'.")
+    parser.add_argument('--field', choices=SWEEP_FIELDS, default='net_pay', help='The field of the pay details.')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, help='The output format (default: from the extension).')
+    parser.add_argument('--output', default='-', help="The output file, or '-' for standard output (CSV only).")
+    parser.add_argument('--stream', action='store_true',
+                        help='Calculate and write the grid a block of rows at a time, for grids larger than memory.')
+    parser.add_argument('--block-rows', type=int, default=DEFAULT_BLOCK_ROWS, help='The rows per block (--stream).')
+    args = parser.parse_args(argv)
+
+    output_format = args.format or ('npy' if args.output.endswith('.npy') else 'csv')
+    if output_format == 'npy' and args.output == '-':
+        parser.error('the npy format needs an --output file')
+    if args.block_rows < 1:
+        parser.error('--block-rows must be at least 1')
+    block_rows = args.block_rows if args.stream else len(args.hours)
+
+    try:
+        if args.output == '-':
+            output = sys.stdout
+        elif output_format == 'npy':
+            output = open(args.output, 'wb')
+        else:
+            output = open(args.output, 'w', newline='', encoding='utf-8')
+    except OSError as error:
+        parser.error(f"cannot open '{error.filename}': {error.strerror}")
+
+    try:
+        if output_format == 'npy' and args.stream:
+            output.close()  # open_memmap() opens the file again by its path, to create it with its final size
+            write_sweep_npy(args.output, args.hours, args.rates, args.field, block_rows)
+        elif output_format == 'npy':
+            np.save(output, calculate_sweep(args.hours, args.rates, args.field))
+        else:
+            write_sweep_csv(output, args.hours, args.rates, args.field, block_rows)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
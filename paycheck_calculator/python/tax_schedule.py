@@ -0,0 +1,180 @@
+"""
+Paycheck Calculator - Python Progressive Tax Schedules
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a progressive tax bracket engine for the Paycheck Calculator. The console application applies a
+single flat TAX_RATE to the gross pay. A tax schedule instead has several brackets, each with the amount of gross pay
+where the bracket starts and the marginal tax rate (as a percentage, like TAX_RATE) for the pay inside the bracket.
+Several schedules (e.g., federal, state, and local) can be combined into one schedule, since the sum of progressive
+taxes is itself a progressive tax with the union of the bracket boundaries.
+
+When a schedule is built, the cumulative tax owed at the start of every bracket is precomputed. The tax for a gross
+pay amount is then a single binary search for its bracket plus one multiply, instead of a loop over the brackets.
+The vectorized lookup for arrays of gross pay is calculate_progressive_taxes_batch() in batch.py.
+
+The schedules are loaded from a JSON data file (data/tax_schedules.json by default) that maps each schedule name to a
+list of brackets, e.g. {"state": [{"over": 0, "rate": 2.0}, {"over": 250, "rate": 4.0}]}. The file is parsed only
+once. Combining the parsed schedules only merges a few brackets, so the combined schedules are not cached separately,
+and clearing the cache of load_tax_schedules() is enough to pick up a changed file.
+
+The following functions are defined in this module:
+    - build_tax_schedule(brackets): Builds a tax schedule from a list of (start, rate) brackets.
+    - calculate_cumulative_taxes(starts, rates): Calculates the total tax owed at the start of each bracket.
+    - combine_tax_schedules(schedules): Combines several tax schedules into one.
+    - load_tax_schedules(path): Loads and caches the tax schedules in a data file.
+    - get_tax_schedule(names, path): Gets the combined tax schedule for the given schedule names.
+    - calculate_progressive_taxes(gross_pay, schedule): Calculates the taxes with a tax schedule.
+"""
+
+import json
+import os
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+
+DEFAULT_SCHEDULE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'tax_schedules.json')
+
+TaxSchedule = namedtuple('TaxSchedule', ['starts', 'rates', 'cumulative'])
+TaxSchedule.__doc__ = """
+A progressive tax schedule with precomputed cumulative taxes.
+
+Attributes:
+    starts: The gross pay amount where each bracket starts, in increasing order. The first bracket starts at 0.
+    rates: The marginal tax rate of each bracket, as a fraction (e.g., 0.18 for 18%).
+    cumulative: The total tax owed at the start of each bracket.
+"""
+
+
+def build_tax_schedule(brackets):
+    """
+    Build a tax schedule from a list of brackets.
+
+    Args:
+        brackets: The brackets as (start, rate) pairs, where start is the gross pay amount where the bracket starts and
+            rate is the marginal tax rate as a percentage. The first bracket must start at 0, and the starts must be
+            in increasing order.
+        :param brackets: list[tuple[float, float]]
+
+    Returns: The tax schedule.
+    """
+    if not brackets:
+        raise ValueError('A tax schedule needs at least one bracket.')
+
+    starts = tuple(float(start) for start, _ in brackets)
+    rates = tuple(float(rate) / 100 for _, rate in brackets)
+
+    if starts[0] != 0:
+        raise ValueError('The first tax bracket must start at 0.')
+    if any(start >= next_start for start, next_start in zip(starts, starts[1:])):
+        raise ValueError('The tax brackets must start at increasing amounts.')
+
+    return TaxSchedule(starts, rates, calculate_cumulative_taxes(starts, rates))
+
+
+def calculate_cumulative_taxes(starts, rates):
+    """
+    Calculate the total tax owed at the start of each bracket.
+
+    Args:
+        starts: The gross pay amount where each bracket starts.
+        :param starts: tuple[float]
+
+        rates: The marginal tax rate of each bracket, as a fraction.
+        :param rates: tuple[float]
+
+    Returns: The cumulative tax at the start of each bracket.
+    """
+    cumulative = [0.0]
+    for index in range(1, len(starts)):
+        cumulative.append(cumulative[-1] + (starts[index] - starts[index - 1]) * rates[index - 1])
+    return tuple(cumulative)
+
+
+def combine_tax_schedules(schedules):
+    """
+    Combine several tax schedules into one.
+
+    The combined schedule has a bracket for every bracket start in any of the schedules, and the marginal rate of each
+    bracket is the sum of the marginal rates of the schedules at that amount.
+
+    Args:
+        schedules: The tax schedules to combine.
+        :param schedules: iterable[TaxSchedule]
+
+    Returns: The combined tax schedule.
+    """
+    schedules = list(schedules)
+    if not schedules:
+        raise ValueError('At least one tax schedule is needed.')
+    if len(schedules) == 1:
+        return schedules[0]
+
+    starts = tuple(sorted({start for schedule in schedules for start in schedule.starts}))
+    rates = tuple(sum(schedule.rates[bisect_right(schedule.starts, start) - 1] for schedule in schedules)
+                  for start in starts)
+    return TaxSchedule(starts, rates, calculate_cumulative_taxes(starts, rates))
+
+
+@lru_cache(maxsize=None)
+def load_tax_schedules(path=DEFAULT_SCHEDULE_PATH):
+    """
+    Load the tax schedules in a data file.
+
+    The file is only parsed the first time it is loaded, and the same schedules are returned for every later call with
+    the same path. Call load_tax_schedules.cache_clear() after changing the file to load it again.
+
+    Args:
+        path: The path of the JSON data file.
+        :param path: str
+
+    Returns: A dictionary that maps each schedule name to its tax schedule.
+    """
+    with open(path, encoding='utf-8') as file:
+        data = json.load(file)
+
+    return {name: build_tax_schedule([(bracket['over'], bracket['rate']) for bracket in brackets])
+            for name, brackets in data.items()}
+
+
+def get_tax_schedule(names, path=DEFAULT_SCHEDULE_PATH):
+    """
+    Get the combined tax schedule for the given schedule names.
+
+    Args:
+        names: The name of a schedule, or the names of the schedules to combine (e.g., ('federal', 'state', 'local')).
+        :param names: str | iterable[str]
+
+        path: The path of the JSON data file.
+        :param path: str
+
+    Returns: The combined tax schedule.
+    """
+    names = (names,) if isinstance(names, str) else tuple(names)
+
+    schedules = load_tax_schedules(path)
+    missing = [name for name in names if name not in schedules]
+    if missing:
+        raise KeyError(f'Unknown tax schedule: {", ".join(missing)}')
+
+    return combine_tax_schedules(schedules[name] for name in names)
+
+
+def calculate_progressive_taxes(gross_pay, schedule):
+    """
+    Calculate the taxes based on the gross pay and a progressive tax schedule.
+
+    The bracket of the gross pay is found with a binary search, and the tax is the precomputed cumulative tax at the
+    start of the bracket plus the pay inside the bracket times its marginal rate.
+
+    Args:
+        gross_pay: The gross pay amount.
+        :param gross_pay: float
+
+        schedule: The tax schedule.
+        :param schedule: TaxSchedule
+
+    Returns: The calculated tax amount.
+    """
+    index = max(bisect_right(schedule.starts, gross_pay) - 1, 0)
+    return schedule.cumulative[index] + (gross_pay - schedule.starts[index]) * schedule.rates[index]
@@ -0,0 +1,152 @@
+"""
+Paycheck Calculator - Python Background Timesheet Import
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a background timesheet import for the Paycheck Calculator GUI. The TimesheetImport class reads a
+CSV or JSONL timesheet (in the layout of the streaming mode in stream.py), validates it, and calculates the pay details
+of every row on a worker thread, so the Tk main thread stays free to repaint and handle events while 100k+ rows are
+processed.
+
+The worker never touches the GUI. It sends its progress through a queue.Queue as small messages, which the GUI drains
+from a root.after() callback on the main thread:
+    - ('rows', rows, rejected, bytes_read, total_bytes): A chunk of calculated rows, where each row is an
+      (employee id, hours worked, hourly rate, gross pay, taxes, net pay) tuple.
+    - ('done', processed, rejected, totals): The import finished.
+    - ('cancelled', processed, rejected, totals): The import was cancelled with cancel().
+    - ('error', message, processed, rejected, totals): The import failed.
+
+The totals are the (gross pay, taxes, net pay) sums of the rows sent so far. They are added up by the worker as the
+chunks are sent, so the GUI does not have to sum every loaded row on the main thread when the import ends.
+
+This module has no GUI imports, so the import can also be driven and tested headlessly.
+"""
+
+import os
+import queue
+import threading
+
+from .stream import compute_rows, detect_format, parse_rows, validate_rows
+
+DEFAULT_CHUNK_SIZE = 2000  # Rows per progress message
+
+
+class TimesheetImport:
+    """
+    A timesheet import that runs on a background thread and reports its progress through a queue.
+
+    Args:
+        path: The path of the timesheet file.
+        :param path: str
+
+        input_format: The timesheet format ('csv' or 'jsonl'). Defaults to the format detected from the extension.
+        :param input_format: str
+
+        chunk_size: The number of rows per 'rows' message.
+        :param chunk_size: int
+    """
+
+    def __init__(self, path, input_format=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.input_format = input_format or detect_format(path)
+        self.chunk_size = chunk_size
+        self.messages = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Start the import on a daemon thread.
+
+        Returns: None
+        """
+        self._thread = threading.Thread(target=self.run, name='timesheet-import', daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """
+        Ask the import to stop. The worker stops before reading the next line and sends a 'cancelled' message.
+
+        Returns: None
+        """
+        self._cancelled.set()
+
+    def is_running(self):
+        """
+        Check if the worker thread is still running.
+
+        Returns: True if the worker thread is running, False otherwise.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_messages(self, limit):
+        """
+        Get the messages that are waiting in the queue, without blocking.
+
+        Args:
+            limit: The maximum number of messages to return, so a single poll never takes too long.
+            :param limit: int
+
+        Returns: A list of messages.
+        """
+        messages = []
+        while len(messages) < limit:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def run(self):
+        """
+        Run the import on the current thread and send the progress messages.
+
+        Returns: None
+        """
+        rejected = 0
+        processed = 0
+        gross_pay = tax_amount = net_pay = 0.0
+
+        def on_reject(line_number, reason, row):
+            nonlocal rejected
+            rejected += 1
+
+        try:
+            total_bytes = os.path.getsize(self.path)
+            bytes_read = 0
+            with open(self.path, newline='', encoding='utf-8') as file:
+
+                def read_lines():
+                    nonlocal bytes_read
+                    for line in file:
+                        if self._cancelled.is_set():
+                            return
+                        bytes_read += len(line)
+                        yield line
+
+                def send(chunk):
+                    nonlocal processed, gross_pay, tax_amount, net_pay
+                    processed += len(chunk)
+                    gross_pay += sum(row[3] for row in chunk)
+                    tax_amount += sum(row[4] for row in chunk)
+                    net_pay += sum(row[5] for row in chunk)
+                    self.messages.put(('rows', chunk, rejected, bytes_read, total_bytes))
+
+                chunk = []
+                for row in compute_rows(validate_rows(parse_rows(read_lines(), self.input_format), on_reject)):
+                    chunk.append(row)
+                    if len(chunk) >= self.chunk_size:
+                        send(chunk)
+                        chunk = []
+                send(chunk)
+
+            totals = (gross_pay, tax_amount, net_pay)
+            if self._cancelled.is_set():
+                self.messages.put(('cancelled', processed, rejected, totals))
+                return
+            self.messages.put(('done', processed, rejected, totals))
+        except Exception as error:
+            # Any error (e.g., an OSError, a UnicodeDecodeError, or a csv.Error for an oversized field) must end the
+            # import with an 'error' message, otherwise the GUI would wait for the worker forever.
+            self.messages.put(('error', str(error) or type(error).__name__, processed, rejected,
+                               (gross_pay, tax_amount, net_pay)))
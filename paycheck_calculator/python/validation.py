@@ -0,0 +1,178 @@
+"""
+Paycheck Calculator - Python Bulk Input Validation
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains a bulk validator for non-interactive data, such as imported timesheets. The interactive
+validation functions in the core module (core.py) check one string at a time: is_valid_float_greater_than_zero()
+parses the string with float() inside a try/except, and the caller then parses it a second time to get the number.
+On dirty imports, that double parse and the exceptions it raises dominate the run time, and an error can only be
+reported by prompting the user again.
+
+The functions in this module apply the same rules (a value must not be empty, must be a valid float, and must be
+greater than zero), plus the rule of the quote service that the value must be finite ('inf' and '1e400' would turn
+into infinite and NaN pay amounts), but parse each value exactly once and return the parsed number together with the
+reason it was rejected. Whole columns are validated in one pass: a column is first converted with a single
+map(float, ...) and checked with all(), which runs without any per-value Python code when the column is clean, and
+only a column with invalid values falls back to checking its values one at a time. Instead of prompting, the failures
+are returned as a compact list of (row, field, reason) records.
+
+Only strings, ints, and floats are converted with float() directly. Any other value (e.g., a bool, which float() would
+turn into 1.0 or 0.0, or bytes) is converted to a string first by parse_value(), like the console application sees
+its input, so a value is accepted or rejected the same way no matter which path parses it.
+
+The following functions are defined in this module:
+    - parse_value(value): Parses one value and returns the number and the reason it was rejected, if any.
+    - parse_column(values): Parses a column of values and returns the numbers and the rejected rows.
+    - validate_columns(columns, fields, first_row): Validates several columns and returns a structured report.
+
+Example:
+    >>> from paycheck_calculator.python.validation import validate_columns
+    >>> parsed, valid, failures = validate_columns({'hours_worked': ['40', 'x'], 'hourly_rate': ['20', '0']})
+    >>> valid
+    [True, False]
+    >>> failures[0]
+    ValidationFailure(row=2, field='hours_worked', reason='not a number')
+"""
+
+import math
+from collections import namedtuple
+
+MISSING = 'missing'  # The value is empty
+NOT_A_NUMBER = 'not a number'  # The value cannot be converted to a float
+NOT_GREATER_THAN_ZERO = 'not greater than zero'  # The value is a float, but zero, negative, or NaN
+NOT_FINITE = 'not finite'  # The value is greater than zero, but infinite (e.g., 'inf' or '1e400')
+
+DEFAULT_FIELDS = ('hours_worked', 'hourly_rate')
+FLOAT_TYPES = frozenset((str, int, float))  # Types that float() parses the same way as their string form
+
+ValidationFailure = namedtuple('ValidationFailure', ['row', 'field', 'reason'])
+ValidationFailure.__doc__ = """
+A value that failed validation.
+
+Attributes:
+    row: The row number of the value.
+    field: The field (column) name of the value.
+    reason: The reason the value was rejected (MISSING, NOT_A_NUMBER, NOT_GREATER_THAN_ZERO, or NOT_FINITE).
+"""
+
+
+def parse_value(value):
+    """
+    Parse one value with the same rules as is_valid_input() and is_valid_float_greater_than_zero(), parsing it once.
+    The value must also be finite.
+
+    Args:
+        value: The value to parse. None is treated as an empty value, and surrounding whitespace is ignored.
+        :param value: str
+
+    Returns: A tuple with the parsed float (or None if it is invalid) and the reason it was rejected (or None).
+    """
+    if value is None:
+        return None, MISSING
+    if not isinstance(value, str):
+        try:
+            value = str(value)
+        except ValueError:  # An int with more digits than str() converts, which is far too large for a float
+            return None, NOT_FINITE if value > 0 else NOT_GREATER_THAN_ZERO
+    value = value.strip()
+    if value == '':
+        return None, MISSING
+
+    try:
+        number = float(value)
+    except ValueError:
+        return None, NOT_A_NUMBER
+    if not number > 0:
+        return None, NOT_GREATER_THAN_ZERO
+    if not math.isfinite(number):
+        return None, NOT_FINITE
+    return number, None
+
+
+def parse_column(values):
+    """
+    Parse a column of values, parsing each value once.
+
+    If the column only has strings, ints, and floats, the whole column is first converted with map(float, ...) and
+    checked with all() (greater than zero and finite), so a clean column is parsed and validated without any
+    per-value Python code. Otherwise, or if that fails, the values are parsed one at a time, and only the values that
+    float() rejects (including ints too large for a float) or that are not strings, ints, or floats are passed to
+    parse_value() to find the reason.
+
+    Args:
+        values: The values of the column.
+        :param values: list[str]
+
+    Returns: A tuple with the list of parsed floats (None for invalid values) and a list of (index, reason) tuples for
+    the invalid values, where the index is the position in the column.
+    """
+    if FLOAT_TYPES.issuperset(map(type, values)):
+        try:
+            numbers = list(map(float, values))
+        except (ValueError, OverflowError):
+            pass
+        else:
+            if all(map((0.0).__lt__, numbers)) and all(map(math.isfinite, numbers)):
+                return numbers, []
+
+    numbers = []
+    invalid = []
+    append = numbers.append
+    for index, value in enumerate(values):
+        if type(value) not in FLOAT_TYPES:
+            number, reason = parse_value(value)
+        else:
+            try:
+                number = float(value)
+            except (ValueError, OverflowError):
+                number, reason = parse_value(value)
+            else:
+                if not number > 0:
+                    reason = NOT_GREATER_THAN_ZERO
+                else:
+                    reason = None if math.isfinite(number) else NOT_FINITE
+        if reason is None:
+            append(number)
+        else:
+            append(None)
+            invalid.append((index, reason))
+    return numbers, invalid
+
+
+def validate_columns(columns, fields=DEFAULT_FIELDS, first_row=1):
+    """
+    Validate several columns of values in one pass per column.
+
+    Args:
+        columns: The values of each field, e.g., {'hours_worked': [...], 'hourly_rate': [...]}. All the columns must
+            have the same length.
+        :param columns: dict[str, list[str]]
+
+        fields: The fields to validate.
+        :param fields: tuple[str]
+
+        first_row: The row number of the first value, used in the failures (e.g., 2 for a CSV file with a header).
+        :param first_row: int
+
+    Returns: A tuple with a dictionary of the parsed floats of each field (None for invalid values), a list of booleans
+    that are True for the rows where every field is valid, and the list of ValidationFailure records, ordered by row
+    and then by field.
+    """
+    lengths = {len(columns[field]) for field in fields}
+    if len(lengths) > 1:
+        raise ValueError('All columns must have the same length.')
+    length = lengths.pop() if lengths else 0
+
+    parsed = {}
+    valid = [True] * length
+    failures = []
+    for position, field in enumerate(fields):
+        parsed[field], invalid = parse_column(columns[field])
+        for index, reason in invalid:
+            valid[index] = False
+            failures.append((index, position, reason))
+
+    failures.sort()
+    return parsed, valid, [ValidationFailure(index + first_row, fields[position], reason)
+                           for index, position, reason in failures]
@@ -0,0 +1,209 @@
+"""
+Paycheck Calculator - Python Year-to-Date Accumulator
+Date: Saturday, October 17th, 2026
+Author: Brittaney Perry-Morgan
+
+This module contains an incremental year-to-date (YTD) accumulator for the Paycheck Calculator. Each paycheck
+calculation is stateless, so a report that needs YTD totals would otherwise have to re-sum every prior pay period for
+every employee. The YearToDateAccumulator class keeps the running gross pay, taxes, net pay, and number of pay periods
+of every employee, and folds each new pay period into them in O(1).
+
+Because the accumulator knows each employee's YTD gross pay before a new period is added, it also supports YTD
+dependent rules. A WageCapRule is an extra tax that only applies to the part of the YTD gross pay below a wage cap
+(e.g., a 6.2% tax on the first $168,600 earned in the year). Once an employee's YTD gross pay reaches the cap, the
+rule no longer adds any tax.
+
+The state is saved to disk as a small JSON document with one [gross, taxes, net, periods] array per employee, so the
+next run only needs to load it and add the new period. JSON object keys are always strings, so employee IDs are
+stored as strings (e.g., 7 and '7' are the same employee), and an employee's totals are never split in two by a save
+and load.
+
+Example:
+    >>> from paycheck_calculator.python.ytd import WageCapRule, YearToDateAccumulator
+    >>> accumulator = YearToDateAccumulator(2026, rules=[WageCapRule('social_security', 6.2, 168600.0)])
+    >>> gross, taxes, net = accumulator.add_period('E001', 45, 32.75)
+    >>> accumulator.save('ytd_2026.json')
+"""
+
+import json
+import os
+from collections import namedtuple
+
+from .core import calculate_gross_pay, calculate_taxes, calculate_net_pay
+
+WageCapRule = namedtuple('WageCapRule', ['name', 'rate', 'cap'])
+WageCapRule.__doc__ = """
+A tax that only applies to the part of the year-to-date gross pay below a wage cap.
+
+Attributes:
+    name: The name of the rule.
+    rate: The tax rate as a percentage, like TAX_RATE.
+    cap: The year-to-date gross pay above which the rule adds no tax.
+"""
+
+YearToDate = namedtuple('YearToDate', ['gross_pay', 'taxes', 'net_pay', 'periods'])
+YearToDate.__doc__ = """
+The year-to-date totals of one employee.
+
+Attributes:
+    gross_pay: The total gross pay.
+    taxes: The total taxes, including the wage cap rules.
+    net_pay: The total net pay.
+    periods: The number of pay periods.
+"""
+
+GROSS, TAXES, NET, PERIODS = range(4)  # Positions in the per-employee totals
+
+
+def calculate_capped_tax(gross_pay, ytd_gross_pay, rule):
+    """
+    Calculate the tax of a wage cap rule for one pay period.
+
+    Only the part of the period's gross pay that keeps the YTD gross pay at or below the cap is taxed.
+
+    Args:
+        gross_pay: The gross pay of the pay period.
+        :param gross_pay: float
+
+        ytd_gross_pay: The YTD gross pay before the pay period.
+        :param ytd_gross_pay: float
+
+        rule: The wage cap rule.
+        :param rule: WageCapRule
+
+    Returns: The tax amount of the rule for the pay period.
+    """
+    taxable = max(0.0, min(gross_pay, rule.cap - ytd_gross_pay))
+    return taxable * rule.rate / 100
+
+
+class YearToDateAccumulator:
+    """
+    Year-to-date totals for every employee, updated one pay period at a time.
+
+    Args:
+        year: The tax year of the totals.
+        :param year: int
+
+        rules: The wage cap rules applied on top of the flat TAX_RATE.
+        :param rules: list[WageCapRule]
+    """
+
+    def __init__(self, year, rules=()):
+        self.year = year
+        self.rules = [WageCapRule(*rule) for rule in rules]
+        self._totals = {}
+
+    def __len__(self):
+        return len(self._totals)
+
+    def __contains__(self, employee_id):
+        return str(employee_id) in self._totals
+
+    def add_pay(self, employee_id, gross_pay, tax_amount):
+        """
+        Fold a pay period that was already calculated into the employee's totals.
+
+        The wage cap rules are applied to the gross pay, and their taxes are added to tax_amount.
+
+        Args:
+            employee_id: The employee ID. Non-string IDs are converted to strings.
+            :param employee_id: str
+
+            gross_pay: The gross pay of the pay period.
+            :param gross_pay: float
+
+            tax_amount: The taxes of the pay period, before the wage cap rules.
+            :param tax_amount: float
+
+        Returns: A tuple with the gross pay, taxes, and net pay of the pay period.
+        """
+        employee_id = str(employee_id)
+        totals = self._totals.get(employee_id)
+        if totals is None:
+            totals = self._totals[employee_id] = [0.0, 0.0, 0.0, 0]
+
+        for rule in self.rules:
+            tax_amount += calculate_capped_tax(gross_pay, totals[GROSS], rule)
+        net_pay = calculate_net_pay(gross_pay, tax_amount)
+
+        totals[GROSS] += gross_pay
+        totals[TAXES] += tax_amount
+        totals[NET] += net_pay
+        totals[PERIODS] += 1
+        return gross_pay, tax_amount, net_pay
+
+    def add_period(self, employee_id, hours_worked, hourly_rate):
+        """
+        Calculate a pay period and fold it into the employee's totals.
+
+        Args:
+            employee_id: The employee ID. Non-string IDs are converted to strings.
+            :param employee_id: str
+
+            hours_worked: The number of hours worked in the pay period.
+            :param hours_worked: float
+
+            hourly_rate: The hourly rate.
+            :param hourly_rate: float
+
+        Returns: A tuple with the gross pay, taxes, and net pay of the pay period.
+        """
+        gross_pay = calculate_gross_pay(hours_worked, hourly_rate)
+        return self.add_pay(employee_id, gross_pay, calculate_taxes(gross_pay))
+
+    def get_totals(self, employee_id):
+        """
+        Get the year-to-date totals of an employee.
+
+        Args:
+            employee_id: The employee ID. Non-string IDs are converted to strings.
+            :param employee_id: str
+
+        Returns: The employee's totals, or zero totals if the employee has no pay periods yet.
+        """
+        totals = self._totals.get(str(employee_id))
+        if totals is None:
+            return YearToDate(0.0, 0.0, 0.0, 0)
+        return YearToDate(*totals)
+
+    def save(self, path):
+        """
+        Save the accumulator to a JSON file.
+
+        The file is written to a temporary file first and then moved into place, so an interrupted run never leaves a
+        half-written file behind.
+
+        Args:
+            path: The path of the file.
+            :param path: str
+
+        Returns: None
+        """
+        state = {
+            'year': self.year,
+            'rules': [list(rule) for rule in self.rules],
+            'employees': self._totals,
+        }
+        temporary_path = f'{path}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file, separators=(',', ':'))
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an accumulator from a JSON file written by save().
+
+        Args:
+            path: The path of the file.
+            :param path: str
+
+        Returns: The loaded accumulator.
+        """
+        with open(path, encoding='utf-8') as file:
+            state = json.load(file)
+
+        accumulator = cls(state['year'], state['rules'])
+        accumulator._totals = state['employees']
+        return accumulator